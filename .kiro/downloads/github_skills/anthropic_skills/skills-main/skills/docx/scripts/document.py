@@ -17,32 +17,54 @@ Usage:
     doc.add_comment(start=node, end=node, text="Comment text")
     doc.reply_to_comment(parent_comment_id=0, text="Reply text")
 
+    # Search paragraph text, including phrases split across runs
+    matches = doc.search_index().find("Governing Law", ignore_case=True)
+    node = matches[0].paragraph
+
     # Suggest tracked changes
     doc["word/document.xml"].suggest_deletion(node)  # Delete content
     doc["word/document.xml"].revert_insertion(ins_node)  # Reject insertion
     doc["word/document.xml"].revert_deletion(del_node)  # Reject deletion
 
+    # Apply many edits in one pass
+    with doc["word/document.xml"].transaction() as tx:
+        tx.suggest_deletion(run)
+        tx.insert_after(run, '<w:ins><w:r><w:t>new text</w:t></w:r></w:ins>')
+
     # Save
     doc.save()
 """
 
+import filecmp
 import html
+import os
 import random
 import shutil
 import tempfile
+import zipfile
 from datetime import datetime, timezone
 from pathlib import Path
 
 from defusedxml import minidom
-from ooxml.scripts.pack import pack_document
 from ooxml.scripts.validation.docx import DOCXSchemaValidator
 from ooxml.scripts.validation.redlining import RedliningValidator
+from ooxml.scripts.validation.result import ValidationError, ValidationResult
 
+from .search import ParagraphIndex
 from .utilities import XMLEditor
 
 # Path to template files
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 
+# EditTransaction methods that insert XML fragments, and the position
+# XMLEditor._place_nodes() inserts them at
+_FRAGMENT_EDIT_POSITIONS = {
+    "replace_node": "replace",
+    "insert_after": "after",
+    "insert_before": "before",
+    "append_to": "append",
+}
+
 
 class DocxXMLEditor(XMLEditor):
     """XMLEditor that automatically applies RSID, author, and date to new elements.
@@ -52,6 +74,8 @@ class DocxXMLEditor(XMLEditor):
     - w:author and w:date (for w:ins, w:del, w:comment elements)
     - w:id (for w:ins and w:del elements)
 
+    Use transaction() to queue many edits and apply them in one pass.
+
     Attributes:
         dom (defusedxml.minidom.Document): The DOM document for direct manipulation
     """
@@ -71,20 +95,22 @@ class DocxXMLEditor(XMLEditor):
         self.rsid = rsid
         self.author = author
         self.initials = initials
+        # Nodes awaiting attribute injection while a transaction is applied
+        self._deferred_nodes = None
+
+    def transaction(self):
+        """Return an EditTransaction that queues edits and applies them together.
+
+        Example:
+            with editor.transaction() as tx:
+                for run in runs:
+                    tx.suggest_deletion(run)
+        """
+        return EditTransaction(self)
 
     def _get_next_change_id(self):
-        """Get the next available change ID by checking all tracked change elements."""
-        max_id = -1
-        for tag in ("w:ins", "w:del"):
-            elements = self.dom.getElementsByTagName(tag)
-            for elem in elements:
-                change_id = elem.getAttribute("w:id")
-                if change_id:
-                    try:
-                        max_id = max(max_id, int(change_id))
-                    except ValueError:
-                        pass
-        return max_id + 1
+        """Reserve the next available w:id for a tracked change (w:ins/w:del)."""
+        return self.id_allocator(("w:ins", "w:del"), "w:id").allocate()
 
     def _ensure_w16du_namespace(self):
         """Ensure w16du namespace is declared on the root element."""
@@ -127,6 +153,11 @@ class DocxXMLEditor(XMLEditor):
         Args:
             nodes: List of DOM nodes to process
         """
+        if self._deferred_nodes is not None:
+            # Injected in bulk once the transaction's edits are in place
+            self._deferred_nodes.extend(nodes)
+            return
+
         from datetime import datetime, timezone
 
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -325,6 +356,7 @@ class DocxXMLEditor(XMLEditor):
                     for i in range(t_elem.attributes.length):
                         attr = t_elem.attributes.item(i)
                         del_text.setAttribute(attr.name, attr.value)
+                    self._index.removed(t_elem.parentNode, [t_elem])
                     t_elem.parentNode.replaceChild(del_text, t_elem)
 
             # Move all children from ins to del wrapper
@@ -334,6 +366,9 @@ class DocxXMLEditor(XMLEditor):
             # Add del wrapper back to ins
             ins_elem.appendChild(del_wrapper)
 
+            # Report the restructured content so the lookup indexes stay current
+            self._index.restructured(ins_elem, [del_wrapper])
+
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
 
@@ -510,6 +545,7 @@ class DocxXMLEditor(XMLEditor):
                 for i in range(t_elem.attributes.length):
                     attr = t_elem.attributes.item(i)
                     del_text.setAttribute(attr.name, attr.value)
+                self._index.removed(t_elem.parentNode, [t_elem])
                 t_elem.parentNode.replaceChild(del_text, t_elem)
 
             # Update run attributes: w:rsidR → w:rsidDel
@@ -526,6 +562,10 @@ class DocxXMLEditor(XMLEditor):
             parent.removeChild(elem)
             del_wrapper.appendChild(elem)
 
+            # Report the restructured run so the lookup indexes stay current
+            self._index.removed(parent, [elem])
+            self._index.inserted(parent, [del_wrapper])
+
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
 
@@ -567,6 +607,7 @@ class DocxXMLEditor(XMLEditor):
                 for i in range(t_elem.attributes.length):
                     attr = t_elem.attributes.item(i)
                     del_text.setAttribute(attr.name, attr.value)
+                self._index.removed(t_elem.parentNode, [t_elem])
                 t_elem.parentNode.replaceChild(del_text, t_elem)
 
             # Update run attributes: w:rsidR → w:rsidDel
@@ -584,6 +625,9 @@ class DocxXMLEditor(XMLEditor):
                 del_wrapper.appendChild(child)
             elem.appendChild(del_wrapper)
 
+            # Report the restructured paragraph so the lookup indexes stay current
+            self._index.restructured(elem, list(elem.childNodes))
+
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
 
@@ -593,6 +637,147 @@ class DocxXMLEditor(XMLEditor):
             raise ValueError(f"Element must be w:r or w:p, got {elem.nodeName}")
 
 
+class EditTransaction:
+    """Queue of DocxXMLEditor edits applied together in a single pass.
+
+    Edits are recorded as they are called and applied in the same order when
+    the with-block exits without an exception (or on commit()). Applying them
+    together parses all XML fragments with one parser run, scans existing
+    tracked changes for the next w:id only once, and adds RSID, author and
+    date attributes to all new content in bulk.
+
+    Each method returns a list that receives the result of the equivalent
+    DocxXMLEditor method once the transaction is applied.
+
+    Example:
+        with doc["word/document.xml"].transaction() as tx:
+            new_nodes = tx.insert_after(elem, "<w:ins>...</w:ins>")
+        # new_nodes now holds the inserted nodes
+    """
+
+    def __init__(self, editor):
+        self.editor = editor
+        self._edits = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self._edits = []
+        return False
+
+    def replace_node(self, elem, new_content):
+        """Queue DocxXMLEditor.replace_node()."""
+        return self._queue("replace_node", elem, new_content)
+
+    def insert_after(self, elem, xml_content):
+        """Queue DocxXMLEditor.insert_after()."""
+        return self._queue("insert_after", elem, xml_content)
+
+    def insert_before(self, elem, xml_content):
+        """Queue DocxXMLEditor.insert_before()."""
+        return self._queue("insert_before", elem, xml_content)
+
+    def append_to(self, elem, xml_content):
+        """Queue DocxXMLEditor.append_to()."""
+        return self._queue("append_to", elem, xml_content)
+
+    def suggest_deletion(self, elem):
+        """Queue DocxXMLEditor.suggest_deletion(); the list receives its result."""
+        return self._queue("suggest_deletion", elem)
+
+    def revert_insertion(self, elem):
+        """Queue DocxXMLEditor.revert_insertion()."""
+        return self._queue("revert_insertion", elem)
+
+    def revert_deletion(self, elem):
+        """Queue DocxXMLEditor.revert_deletion()."""
+        return self._queue("revert_deletion", elem)
+
+    def commit(self):
+        """Apply all queued edits in order.
+
+        If an edit raises, the edits before it stay applied (with their
+        attributes injected) and the rest are discarded.
+        """
+        edits, self._edits = self._edits, []
+        editor = self.editor
+        fragments = iter(
+            editor._parse_fragments(
+                [content for name, _, content, _ in edits if content is not None]
+            )
+        )
+
+        editor._deferred_nodes = []
+        try:
+            for name, elem, content, result in edits:
+                if content is not None:
+                    position = _FRAGMENT_EDIT_POSITIONS[name]
+                    nodes = editor._place_nodes(position, elem, next(fragments))
+                    editor._deferred_nodes.extend(nodes)
+                    result.extend(nodes)
+                else:
+                    value = getattr(editor, name)(elem)
+                    result.extend(value if isinstance(value, list) else [value])
+        finally:
+            nodes, editor._deferred_nodes = editor._deferred_nodes, None
+            editor._inject_attributes_to_nodes(nodes)
+
+    def _queue(self, name, elem, content=None):
+        result = []
+        self._edits.append((name, elem, content, result))
+        return result
+
+
+def _link_tree(source, target, suffixes=None):
+    """Mirror a directory tree with hard links, copying files that cannot be linked.
+
+    Args:
+        source: Directory to mirror
+        target: Directory to create
+        suffixes: Only mirror files with these suffixes (default: all files)
+
+    Returns:
+        dict: _file_signatures() of the files in target
+    """
+    link = True
+    for directory, _, names in os.walk(source):
+        target_dir = target / Path(directory).relative_to(source)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        for name in names:
+            if suffixes is not None and Path(name).suffix not in suffixes:
+                continue
+            if link:
+                try:
+                    os.link(Path(directory) / name, target_dir / name)
+                    continue
+                except OSError:
+                    # Different file system or no hard link support
+                    link = False
+            shutil.copy2(Path(directory) / name, target_dir / name)
+    return _file_signatures(target)
+
+
+def _file_signatures(directory):
+    """Return {relative path: (inode, size, mtime)} for the files under directory.
+
+    A file replaced or rewritten since the signature was taken gets a new one.
+    """
+    signatures = {}
+    for path in directory.rglob("*"):
+        if path.is_file():
+            stat = path.stat()
+            signatures[path.relative_to(directory).as_posix()] = (
+                stat.st_ino,
+                stat.st_size,
+                stat.st_mtime_ns,
+            )
+    return signatures
+
+
 def _generate_hex_id() -> str:
     """Generate random 8-character hex ID for para/durable IDs.
 
@@ -636,14 +821,15 @@ class Document:
         if not self.original_path.exists() or not self.original_path.is_dir():
             raise ValueError(f"Directory not found: {unpacked_dir}")
 
-        # Create temporary directory with subdirectories for unpacked content and baseline
+        # Create temporary directory with the working copy and a snapshot of the
+        # original XML parts. Both are hard links to the original files where
+        # possible; editors replace files instead of writing into them, so the
+        # originals are never touched until save().
         self.temp_dir = tempfile.mkdtemp(prefix="docx_")
         self.unpacked_path = Path(self.temp_dir) / "unpacked"
-        shutil.copytree(self.original_path, self.unpacked_path)
-
-        # Pack original directory into temporary .docx for validation baseline (outside unpacked dir)
-        self.original_docx = Path(self.temp_dir) / "original.docx"
-        pack_document(self.original_path, self.original_docx, validate=False)
+        self._unchanged_files = _link_tree(self.original_path, self.unpacked_path)
+        self._snapshot_path = Path(self.temp_dir) / "original"
+        _link_tree(self.original_path, self._snapshot_path, suffixes={".xml", ".rels"})
 
         self.word_path = self.unpacked_path / "word"
 
@@ -655,8 +841,9 @@ class Document:
         self.author = author
         self.initials = initials
 
-        # Cache for lazy-loaded editors
+        # Cache for lazy-loaded editors and their search indexes
         self._editors = {}
+        self._search_indexes = {}
 
         # Comment file paths
         self.comments_path = self.word_path / "comments.xml"
@@ -664,9 +851,8 @@ class Document:
         self.comments_ids_path = self.word_path / "commentsIds.xml"
         self.comments_extensible_path = self.word_path / "commentsExtensible.xml"
 
-        # Load existing comments and determine next ID (before setup modifies files)
+        # Load existing comments (before setup modifies files)
         self.existing_comments = self._load_existing_comments()
-        self.next_comment_id = self._get_next_comment_id()
 
         # Convenient access to document.xml editor (semi-private)
         self._document = self["word/document.xml"]
@@ -710,6 +896,29 @@ class Document:
             )
         return self._editors[xml_path]
 
+    def search_index(self, xml_path: str = "word/document.xml") -> ParagraphIndex:
+        """
+        Get the full-text paragraph search index for an XML file.
+
+        The index is built on first use and refreshed automatically after
+        edits made through the file's editor. After changing the DOM
+        directly, call the editor's invalidate_indexes() so the next search
+        sees the change. See search.py for details.
+
+        Args:
+            xml_path: Relative path to XML file (default: "word/document.xml")
+
+        Returns:
+            ParagraphIndex over the file's w:p elements
+
+        Example:
+            match = doc.search_index().find("payment terms", ignore_case=True)[0]
+            doc.add_comment(start=match.paragraph, end=match.paragraph, text="Review")
+        """
+        if xml_path not in self._search_indexes:
+            self._search_indexes[xml_path] = ParagraphIndex(self[xml_path])
+        return self._search_indexes[xml_path]
+
     def add_comment(self, start, end, text: str) -> int:
         """
         Add a comment spanning from one element to another.
@@ -727,7 +936,7 @@ class Document:
             end_node = cm.get_document_node(tag="w:ins", id="2")
             cm.add_comment(start=start_node, end=end_node, text="Explanation")
         """
-        comment_id = self.next_comment_id
+        comment_id = self._allocate_comment_id()
         para_id = _generate_hex_id()
         durable_id = _generate_hex_id()
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -759,7 +968,6 @@ class Document:
         # Update existing_comments so replies work
         self.existing_comments[comment_id] = {"para_id": para_id}
 
-        self.next_comment_id += 1
         return comment_id
 
     def reply_to_comment(
@@ -784,7 +992,7 @@ class Document:
             raise ValueError(f"Parent comment with id={parent_comment_id} not found")
 
         parent_info = self.existing_comments[parent_comment_id]
-        comment_id = self.next_comment_id
+        comment_id = self._allocate_comment_id()
         para_id = _generate_hex_id()
         durable_id = _generate_hex_id()
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -827,20 +1035,42 @@ class Document:
         # Update existing_comments so replies work
         self.existing_comments[comment_id] = {"para_id": para_id}
 
-        self.next_comment_id += 1
         return comment_id
 
+    @property
+    def original_docx(self):
+        """Path to the validation baseline: the original XML parts as a .docx.
+
+        Packed from the snapshot taken at startup the first time it is needed.
+        """
+        path = Path(self.temp_dir) / "original.docx"
+        if not path.exists():
+            temp_path = path.with_name(f"{path.name}.tmp")
+            with zipfile.ZipFile(temp_path, "w", zipfile.ZIP_STORED) as zf:
+                for f in sorted(self._snapshot_path.rglob("*")):
+                    if f.is_file():
+                        zf.write(f, f.relative_to(self._snapshot_path))
+            os.replace(temp_path, path)
+        return path
+
     def __del__(self):
         """Clean up temporary directory on deletion."""
         if hasattr(self, "temp_dir") and Path(self.temp_dir).exists():
             shutil.rmtree(self.temp_dir)
 
-    def validate(self) -> None:
+    def validate(self) -> ValidationResult:
         """
         Validate the document against XSD schema and redlining rules.
 
+        Nothing is printed; the checks and their issues are returned, or
+        carried by the exception.
+
+        Returns:
+            ValidationResult: The checks run, including warnings and info
+
         Raises:
-            ValueError: If validation fails.
+            ValidationError: If validation fails (a ValueError subclass whose
+                result attribute holds the structured issues).
         """
         # Create validators with current state
         schema_validator = DOCXSchemaValidator(
@@ -850,11 +1080,14 @@ class Document:
             self.unpacked_path, self.original_docx, verbose=False
         )
 
-        # Run validations
-        if not schema_validator.validate():
-            raise ValueError("Schema validation failed")
-        if not redlining_validator.validate():
-            raise ValueError("Redlining validation failed")
+        # Run validations; redlining is only checked on a schema-valid document
+        result = ValidationResult()
+        for validator in (schema_validator, redlining_validator):
+            passed = validator.validate()
+            result.extend(validator.result)
+            if not passed:
+                raise ValidationError(result)
+        return result
 
     def save(self, destination=None, validate=True) -> None:
         """
@@ -879,27 +1112,33 @@ class Document:
         if validate:
             self.validate()
 
-        # Copy contents from temp directory to destination (or original directory)
+        # Copy contents from temp directory to destination, or write the
+        # changed files back to the original directory
         target_path = Path(destination) if destination else self.original_path
-        shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
+        if target_path.resolve() != self.original_path.resolve():
+            shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
+            return
+
+        for relative_path, signature in _file_signatures(self.unpacked_path).items():
+            if self._unchanged_files.get(relative_path) == signature:
+                continue
+            source = self.unpacked_path / relative_path
+            target = target_path / relative_path
+            if not (target.exists() and filecmp.cmp(source, target, shallow=False)):
+                target.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+                shutil.copy2(source, temp_path)
+                os.replace(temp_path, target)
+            self._unchanged_files[relative_path] = signature
 
     # ==================== Private: Initialization ====================
 
-    def _get_next_comment_id(self):
-        """Get the next available comment ID."""
+    def _allocate_comment_id(self):
+        """Reserve the next available comment ID in comments.xml."""
         if not self.comments_path.exists():
-            return 0
-
+            shutil.copy(TEMPLATE_DIR / "comments.xml", self.comments_path)
         editor = self["word/comments.xml"]
-        max_id = -1
-        for comment_elem in editor.dom.getElementsByTagName("w:comment"):
-            comment_id = comment_elem.getAttribute("w:id")
-            if comment_id:
-                try:
-                    max_id = max(max_id, int(comment_id))
-                except ValueError:
-                    pass
-        return max_id + 1
+        return editor.id_allocator(("w:comment",), "w:id").allocate()
 
     def _load_existing_comments(self):
         """Load existing comments from files to enable replies."""
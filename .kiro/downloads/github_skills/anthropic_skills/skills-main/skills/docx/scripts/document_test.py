@@ -0,0 +1,272 @@
+import re
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.document import DocxXMLEditor
+from scripts.search import ParagraphIndex
+from scripts.utilities import LxmlXMLEditor, XMLEditor
+
+
+DOCUMENT_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>
+<w:p><w:r><w:t>Keep this</w:t></w:r></w:p>
+<w:p><w:r><w:t>Remove paragraph</w:t></w:r></w:p>
+<w:p><w:r><w:t>Remove run</w:t></w:r></w:p>
+<w:p><w:ins w:id="1" w:author="A" w:date="2024-01-01T00:00:00Z"><w:r><w:t>Inserted</w:t></w:r></w:ins></w:p>
+</w:body></w:document>"""
+
+BATCH_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>
+<w:p><w:r><w:t>Keep this</w:t></w:r></w:p>
+<w:p><w:r><w:t>Remove paragraph</w:t></w:r></w:p>
+<w:p><w:r><w:t>Remove run</w:t></w:r><w:r><w:t>Replace run</w:t></w:r></w:p>
+<w:p><w:ins w:id="1" w:author="A" w:date="2024-01-01T00:00:00Z"><w:r><w:t>Inserted</w:t></w:r></w:ins></w:p>
+<w:p><w:del w:id="4" w:author="A" w:date="2024-01-01T00:00:00Z"><w:r><w:delText>Deleted</w:delText></w:r></w:del></w:p>
+</w:body></w:document>"""
+
+SEARCH_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>
+<w:p><w:r><w:t>Intro</w:t></w:r></w:p>
+<w:p><w:r><w:t xml:space="preserve">This Agreement is governed by the </w:t></w:r><w:r><w:rPr><w:b/></w:rPr><w:t>Gover</w:t></w:r><w:r><w:t xml:space="preserve">ning Law of Section </w:t></w:r><w:r><w:t>12.3</w:t></w:r></w:p>
+<w:p><w:del w:id="1" w:author="A" w:date="2024-01-01T00:00:00Z"><w:r><w:delText>Governing Law</w:delText></w:r></w:del></w:p>
+</w:body></w:document>"""
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+# Run from the skill directory: python -m unittest scripts.document_test
+class TestTrackedChangeLookups(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        path = Path(self.temp_dir.name) / "document.xml"
+        path.write_text(DOCUMENT_XML, encoding="utf-8")
+        self.editor = DocxXMLEditor(path, rsid="00AB12CD", author="Tester")
+        # Build the lookup indexes before editing
+        self.editor.get_node(tag="w:t", contains="Keep this")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def assert_only_deleted_text(self, text):
+        with self.assertRaisesRegex(ValueError, "Node not found"):
+            self.editor.get_node(tag="w:t", contains=text)
+        del_text = self.editor.get_node(tag="w:delText", contains=text)
+        self.assertIsNotNone(del_text.parentNode)
+
+    def test_suggest_deletion_paragraph(self):
+        """Test that deleted paragraph text is only found as w:delText"""
+        para = self.editor.get_node(tag="w:p", contains="Remove paragraph")
+        self.editor.suggest_deletion(para)
+        self.assert_only_deleted_text("Remove paragraph")
+
+    def test_suggest_deletion_run(self):
+        """Test that deleted run text is only found as w:delText"""
+        run = self.editor.get_node(tag="w:r", contains="Remove run")
+        self.editor.suggest_deletion(run)
+        self.assert_only_deleted_text("Remove run")
+
+    def test_revert_insertion(self):
+        """Test that rejected insertion text is only found as w:delText"""
+        ins = self.editor.get_node(tag="w:ins", attrs={"w:id": "1"})
+        self.editor.revert_insertion(ins)
+        self.assert_only_deleted_text("Inserted")
+
+    def test_untouched_text_still_editable(self):
+        """Test that other text can still be found and edited after a deletion"""
+        para = self.editor.get_node(tag="w:p", contains="Remove paragraph")
+        self.editor.suggest_deletion(para)
+        keep = self.editor.get_node(tag="w:r", contains="Keep this")
+        self.editor.insert_after(keep, "<w:r><w:t>added</w:t></w:r>")
+        self.editor.get_node(tag="w:t", contains="added")
+
+
+class TestEditTransaction(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def make_editor(self, name):
+        path = Path(self.temp_dir.name) / name
+        path.write_text(BATCH_XML, encoding="utf-8")
+        return DocxXMLEditor(path, rsid="00AB12CD", author="Tester")
+
+    def apply_edits(self, editor, target):
+        """Make the same edits through target (the editor or a transaction)"""
+        keep = editor.get_node(tag="w:r", contains="Keep this")
+        remove_para = editor.get_node(tag="w:p", contains="Remove paragraph")
+        remove_run = editor.get_node(tag="w:r", contains="Remove run")
+        replace_run = editor.get_node(tag="w:r", contains="Replace run")
+        ins = editor.get_node(tag="w:ins", attrs={"w:id": "1"})
+        deleted = editor.get_node(tag="w:del", attrs={"w:id": "4"})
+        return [
+            target.insert_after(keep, "<w:ins><w:r><w:t>after</w:t></w:r></w:ins>"),
+            target.suggest_deletion(remove_para),
+            target.insert_before(keep, "<w:ins><w:r><w:t>before</w:t></w:r></w:ins>"),
+            target.suggest_deletion(remove_run),
+            target.replace_node(
+                replace_run, "<w:ins><w:r><w:t>replaced</w:t></w:r></w:ins>"
+            ),
+            target.revert_insertion(ins),
+            target.revert_deletion(deleted),
+            target.append_to(
+                keep.parentNode, "<w:ins><w:r><w:t>end</w:t></w:r></w:ins>"
+            ),
+        ]
+
+    def mask_dates(self, xml):
+        """Replace generated timestamps, which may differ between the runs"""
+        return re.sub(r'(w:date|w16du:dateUtc)="[^"]*"', r'\1="DATE"', xml)
+
+    def saved_xml(self, editor):
+        editor.save()
+        return self.mask_dates(editor.xml_path.read_text(encoding="utf-8"))
+
+    def test_batch_matches_sequential_edits(self):
+        """Test that a transaction produces the same XML and change ids as single edits"""
+        sequential = self.make_editor("sequential.xml")
+        single_results = self.apply_edits(sequential, sequential)
+
+        batched = self.make_editor("batched.xml")
+        with batched.transaction() as tx:
+            batch_results = self.apply_edits(batched, tx)
+
+        self.assertEqual(self.saved_xml(batched), self.saved_xml(sequential))
+        for single, batch in zip(single_results, batch_results):
+            single = single if isinstance(single, list) else [single]
+            self.assertEqual(
+                [self.mask_dates(node.toxml()) for node in batch],
+                [self.mask_dates(node.toxml()) for node in single],
+            )
+
+        change_ids = sorted(
+            int(elem.getAttribute("w:id"))
+            for tag in ("w:ins", "w:del")
+            for elem in batched.dom.getElementsByTagName(tag)
+        )
+        self.assertEqual(change_ids, [1, 4, 5, 6, 7, 8, 9, 10, 11, 12])
+
+
+class TestDirectDomEdits(unittest.TestCase):
+    """Lookups after the DOM is changed without going through the editor"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        path = Path(self.temp_dir.name) / "document.xml"
+        path.write_text(DOCUMENT_XML, encoding="utf-8")
+        self.editor = XMLEditor(path)
+        self.para = self.editor.get_node(tag="w:p", contains="Keep this")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_changed_text(self):
+        """Test that a paragraph is found by text set directly on its w:t"""
+        t = self.para.getElementsByTagName("w:t")[0]
+        t.firstChild.data = "gamma"
+        self.assertIs(self.editor.get_node(tag="w:p", contains="gamma"), self.para)
+
+    def test_changed_attribute(self):
+        """Test that a paragraph is found by an attribute set directly"""
+        with self.assertRaisesRegex(ValueError, "Node not found"):
+            self.editor.get_node(tag="w:p", attrs={"w14:paraId": "AAAA"})
+        self.para.setAttribute("w14:paraId", "AAAA")
+        found = self.editor.get_node(tag="w:p", attrs={"w14:paraId": "AAAA"})
+        self.assertIs(found, self.para)
+
+    def test_appended_element(self):
+        """Test that an element appended directly is found by tag"""
+        body = self.para.parentNode
+        tbl = body.appendChild(self.editor.dom.createElement("w:tbl"))
+        self.assertIs(self.editor.get_node(tag="w:tbl"), tbl)
+
+
+class TestLxmlDirectDomEdits(unittest.TestCase):
+    """The same lookups with the lxml-backed editor"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        path = Path(self.temp_dir.name) / "document.xml"
+        path.write_text(DOCUMENT_XML, encoding="utf-8")
+        self.editor = LxmlXMLEditor(path)
+        self.para = self.editor.get_node(tag="w:p", contains="Keep this")
+        self.w = self.editor.root.nsmap["w"]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_changed_text(self):
+        """Test that a paragraph is found by text set directly on its w:t"""
+        self.para.find(f".//{{{self.w}}}t").text = "gamma"
+        self.assertIs(self.editor.get_node(tag="w:p", contains="gamma"), self.para)
+
+    def test_changed_attribute(self):
+        """Test that a paragraph is found by an attribute set directly"""
+        with self.assertRaisesRegex(ValueError, "Node not found"):
+            self.editor.get_node(tag="w:p", attrs={"w:rsidR": "AAAA"})
+        self.para.set(f"{{{self.w}}}rsidR", "AAAA")
+        found = self.editor.get_node(tag="w:p", attrs={"w:rsidR": "AAAA"})
+        self.assertIs(found, self.para)
+
+    def test_appended_element(self):
+        """Test that an element appended directly is found by tag"""
+        tbl = self.para.getparent().makeelement(f"{{{self.w}}}tbl")
+        self.para.getparent().append(tbl)
+        self.assertIs(self.editor.get_node(tag="w:tbl"), tbl)
+
+
+class TestParagraphSearch(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        path = Path(self.temp_dir.name) / "document.xml"
+        path.write_text(SEARCH_XML, encoding="utf-8")
+        self.editor = XMLEditor(path)
+        self.index = ParagraphIndex(self.editor)
+        self.para = self.editor.dom.getElementsByTagName("w:p")[1]
+        self.runs = self.para.getElementsByTagName("w:r")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_find_across_runs(self):
+        """Test that a phrase split over runs is found and mapped onto them"""
+        matches = self.index.find("governing law", ignore_case=True)
+        self.assertEqual(len(matches), 1)
+        match = matches[0]
+        self.assertIs(match.paragraph, self.para)
+        self.assertEqual(match.text, "Governing Law")
+        spans = [(span.run, span.start, span.end) for span in match.runs]
+        self.assertEqual(spans, [(self.runs[1], 0, 5), (self.runs[2], 0, 8)])
+
+    def test_find_regex_across_runs(self):
+        """Test that a regex match spanning runs reports each run's part"""
+        matches = self.index.find_regex(r"Section \d+\.\d+")
+        self.assertEqual([m.text for m in matches], ["Section 12.3"])
+        spans = [(span.run, span.start, span.end) for span in matches[0].runs]
+        self.assertEqual(spans, [(self.runs[2], 12, 20), (self.runs[3], 0, 4)])
+
+    def test_find_fuzzy_across_runs(self):
+        """Test that a misspelled phrase over several runs is found"""
+        matches = self.index.find_fuzzy("governd by the governing law", threshold=0.9)
+        self.assertEqual(len(matches), 1)
+        self.assertEqual(matches[0].text, "governed by the Governing Law")
+        self.assertIs(matches[0].runs[0].run, self.runs[0])
+        self.assertLess(matches[0].score, 1.0)
+
+    def test_refresh_after_edits(self):
+        """Test that editor edits and invalidate_indexes() refresh the index"""
+        self.assertEqual(self.index.find("added"), [])
+        self.editor.append_to(self.para, "<w:r><w:t>added</w:t></w:r>")
+        self.assertEqual(len(self.index.find("added")), 1)
+
+        self.runs[0].getElementsByTagName("w:t")[0].firstChild.data = "Direct"
+        self.editor.invalidate_indexes()
+        self.assertEqual(len(self.index.find("Direct")), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,350 @@
+"""
+Full-text search over the paragraphs of a WordprocessingML part.
+
+ParagraphIndex joins the text of each w:p across its runs, so phrases split
+over several w:r elements are found, and reports where each match lies in
+the paragraph and in the individual runs. The index is built on first use
+and rebuilt automatically after the editor changes the document. It cannot
+see changes made to the DOM directly; call the editor's invalidate_indexes()
+after those and the next search rebuilds the index.
+
+Usage:
+    doc = Document('workspace/unpacked')
+    index = doc.search_index()  # word/document.xml
+
+    # Substring (whitespace in the query matches any run of whitespace)
+    for match in index.find("Governing Law", ignore_case=True):
+        print(match.paragraph, match.start, match.end, match.text)
+        for span in match.runs:
+            print(span.run, span.start, span.end)
+
+    # Regular expression
+    matches = index.find_regex(r"Section \\d+\\.\\d+")
+
+    # Fuzzy phrase, tolerant of typos and punctuation differences
+    matches = index.find_fuzzy("governing law of the state", threshold=0.85)
+
+Paragraph text is the content of w:t elements, with w:tab as a tab and
+w:br/w:cr as a newline. Runs inside w:del and w:moveFrom are left out, so
+the index reflects the document with all tracked changes accepted.
+"""
+
+import html
+import re
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+
+# Run children that contribute text, and the text they stand for
+_RUN_CHARACTERS = {"w:tab": "\t", "w:br": "\n", "w:cr": "\n"}
+
+# Tracked-change containers whose runs are not part of the current text
+_DELETED_CONTENT = {"w:del", "w:moveFrom"}
+
+# Word characters used to anchor fuzzy matches
+_WORD_PATTERN = re.compile(r"\S+")
+
+
+@dataclass
+class RunSpan:
+    """Part of a match inside one run.
+
+    Attributes:
+        run: The w:r element
+        start: Offset of the first matched character in the run's text
+        end: Offset after the last matched character in the run's text
+    """
+
+    run: object
+    start: int
+    end: int
+
+
+@dataclass
+class SearchMatch:
+    """A match within one paragraph.
+
+    Attributes:
+        paragraph: The w:p element
+        start: Offset of the match in the paragraph text
+        end: Offset after the match in the paragraph text
+        text: The matched paragraph text
+        runs: The runs the match covers, in document order
+        score: Similarity for fuzzy matches (1.0 for exact matches)
+    """
+
+    paragraph: object
+    start: int
+    end: int
+    text: str
+    runs: list[RunSpan]
+    score: float = 1.0
+
+
+class _Paragraph:
+    """Text of one paragraph and the runs it was assembled from."""
+
+    def __init__(self, elem):
+        self.elem = elem
+        self.parts = []
+        # (paragraph offset, run element, run offset) per text piece
+        self.pieces = []
+        self.length = 0
+        self.tokens = None
+
+    def add(self, run, run_offset, text):
+        self.pieces.append((self.length, run, run_offset))
+        self.parts.append(text)
+        self.length += len(text)
+
+    def finish(self):
+        self.text = "".join(self.parts)
+        del self.parts
+
+    def run_spans(self, start, end):
+        """Map a [start, end) range of the paragraph text onto its runs."""
+        spans = []
+        for i, (offset, run, run_offset) in enumerate(self.pieces):
+            piece_end = (
+                self.pieces[i + 1][0] if i + 1 < len(self.pieces) else self.length
+            )
+            if piece_end <= start or offset >= end:
+                continue
+            span_start = run_offset + max(start, offset) - offset
+            span_end = run_offset + min(end, piece_end) - offset
+            if spans and spans[-1].run is run and spans[-1].end == span_start:
+                spans[-1].end = span_end
+            else:
+                spans.append(RunSpan(run, span_start, span_end))
+        return spans
+
+
+class ParagraphIndex:
+    """
+    Search index over the w:p elements of one XMLEditor.
+
+    The paragraphs are rebuilt whenever the editor reports a change (see
+    _ElementIndex.generation in utilities.py): edits through the editor's
+    methods, and invalidate_indexes() after direct DOM changes. Direct
+    changes without invalidate_indexes() are not seen.
+
+    Args:
+        editor: XMLEditor (or DocxXMLEditor) whose document is searched. The
+            index walks minidom nodes, so LxmlXMLEditor is not supported.
+    """
+
+    def __init__(self, editor):
+        self.editor = editor
+        self._paragraphs = None
+        self._generation = None
+        self._words = None
+
+    def find(self, query, ignore_case=False):
+        """
+        Find all occurrences of a phrase.
+
+        HTML entities in the query are decoded (e.g. "&#8220;" matches a
+        left double quote), and any whitespace in the query matches any run
+        of whitespace in the text.
+
+        Args:
+            query: Text to find
+            ignore_case: Match regardless of case
+
+        Returns:
+            list[SearchMatch]: Matches in document order
+        """
+        words = html.unescape(query).split()
+        if not words:
+            return []
+        pattern = r"\s+".join(re.escape(word) for word in words)
+        return self.find_regex(pattern, re.IGNORECASE if ignore_case else 0)
+
+    def find_regex(self, pattern, flags=0):
+        """
+        Find all matches of a regular expression in paragraph text.
+
+        Args:
+            pattern: Regular expression (str or compiled)
+            flags: re flags, if pattern is a string
+
+        Returns:
+            list[SearchMatch]: Non-empty matches in document order
+        """
+        regex = re.compile(pattern, flags) if isinstance(pattern, str) else pattern
+        matches = []
+        for paragraph in self._get_paragraphs():
+            for m in regex.finditer(paragraph.text):
+                if m.end() > m.start():
+                    matches.append(self._match(paragraph, m.start(), m.end()))
+        return matches
+
+    def find_fuzzy(self, phrase, threshold=0.8, ignore_case=True):
+        """
+        Find passages similar to a phrase.
+
+        Compares word windows of about the phrase's length with
+        difflib.SequenceMatcher. For multi-word phrases only windows that
+        share at least one whole word with the phrase are compared, which
+        keeps the search fast on long documents.
+
+        Args:
+            phrase: Text to look for
+            threshold: Minimum similarity ratio (0-1) for a match
+            ignore_case: Compare case-insensitively
+
+        Returns:
+            list[SearchMatch]: Best non-overlapping matches in document
+            order, with their similarity in score
+        """
+
+        def normalize(text):
+            text = " ".join(text.split())
+            return text.casefold() if ignore_case else text
+
+        target = normalize(html.unescape(phrase))
+        target_words = target.split()
+        if not target_words:
+            return []
+        matcher = SequenceMatcher(None, autojunk=False)
+        matcher.set_seq2(target)
+
+        matches = []
+        for paragraph, windows in self._fuzzy_windows(target_words, ignore_case):
+            tokens = paragraph.tokens
+            scored = []
+            for first, last in windows:
+                start, end = tokens[first][0], tokens[last][1]
+                matcher.set_seq1(normalize(paragraph.text[start:end]))
+                if matcher.real_quick_ratio() < threshold:
+                    continue
+                if matcher.quick_ratio() < threshold:
+                    continue
+                score = matcher.ratio()
+                if score >= threshold:
+                    scored.append((score, start, end))
+
+            # Keep the best matches that do not overlap, shortest first on ties
+            taken = []
+            for score, start, end in sorted(scored, key=lambda s: (-s[0], s[2] - s[1])):
+                if all(end <= s or start >= e for _, s, e in taken):
+                    taken.append((score, start, end))
+            for score, start, end in sorted(taken, key=lambda s: s[1]):
+                match = self._match(paragraph, start, end)
+                match.score = score
+                matches.append(match)
+        return matches
+
+    def _fuzzy_windows(self, target_words, ignore_case):
+        """Yield (paragraph, [(first token, last token)]) worth comparing."""
+        size = len(target_words)
+        sizes = [n for n in (size - 1, size, size + 1) if n > 0]
+        paragraphs = self._get_paragraphs()
+
+        if size == 1:
+            # No other word to anchor on: compare every token
+            for paragraph in paragraphs:
+                tokens = self._tokens(paragraph)
+                if tokens:
+                    yield paragraph, [(i, i) for i in range(len(tokens))]
+            return
+
+        words = self._get_words(ignore_case)
+        windows = {}
+        for position, word in enumerate(target_words):
+            for p, t in words.get(_word_key(word, ignore_case), ()):
+                count = len(paragraphs[p].tokens)
+                for n in sizes:
+                    for first in range(t - position - 1, t - position + 2):
+                        last = first + n - 1
+                        if first >= 0 and last < count and first <= t <= last:
+                            windows.setdefault(p, set()).add((first, last))
+        for p in sorted(windows):
+            yield paragraphs[p], sorted(windows[p])
+
+    def _get_words(self, ignore_case):
+        """Return {word key: [(paragraph index, token index)]}."""
+        if self._words is None or self._words[0] != ignore_case:
+            words = {}
+            for p, paragraph in enumerate(self._get_paragraphs()):
+                for t, (start, end) in enumerate(self._tokens(paragraph)):
+                    key = _word_key(paragraph.text[start:end], ignore_case)
+                    if key:
+                        words.setdefault(key, []).append((p, t))
+            self._words = (ignore_case, words)
+        return self._words[1]
+
+    def _tokens(self, paragraph):
+        if paragraph.tokens is None:
+            paragraph.tokens = [
+                m.span() for m in _WORD_PATTERN.finditer(paragraph.text)
+            ]
+        return paragraph.tokens
+
+    def _match(self, paragraph, start, end):
+        return SearchMatch(
+            paragraph=paragraph.elem,
+            start=start,
+            end=end,
+            text=paragraph.text[start:end],
+            runs=paragraph.run_spans(start, end),
+        )
+
+    def _get_paragraphs(self):
+        """Return the indexed paragraphs, rebuilding them after edits."""
+        generation = self.editor._index.generation
+        if self._paragraphs is None or self._generation != generation:
+            self._paragraphs = self._collect()
+            self._generation = generation
+            self._words = None
+        return self._paragraphs
+
+    def _collect(self):
+        """Assemble the text of every paragraph in one pass over the DOM.
+
+        walk() and walk_run() use the minidom node API (childNodes, tagName).
+        """
+        paragraphs = []
+
+        def walk(node, paragraph):
+            for child in node.childNodes:
+                if child.nodeType != child.ELEMENT_NODE:
+                    continue
+                if child.tagName == "w:p":
+                    # Paragraphs nested in text boxes are indexed separately
+                    nested = _Paragraph(child)
+                    paragraphs.append(nested)
+                    walk(child, nested)
+                    nested.finish()
+                elif child.tagName == "w:r" and paragraph is not None:
+                    walk_run(child, paragraph)
+                elif child.tagName not in _DELETED_CONTENT:
+                    walk(child, paragraph)
+
+        def walk_run(run, paragraph):
+            run_offset = 0
+            for child in run.childNodes:
+                if child.nodeType != child.ELEMENT_NODE:
+                    continue
+                if child.tagName == "w:t":
+                    text = "".join(
+                        node.data
+                        for node in child.childNodes
+                        if node.nodeType == node.TEXT_NODE
+                    )
+                elif child.tagName in _RUN_CHARACTERS:
+                    text = _RUN_CHARACTERS[child.tagName]
+                else:
+                    walk(child, paragraph)
+                    continue
+                if text:
+                    paragraph.add(run, run_offset, text)
+                    run_offset += len(text)
+
+        walk(self.editor.dom, None)
+        return paragraphs
+
+
+def _word_key(word, ignore_case):
+    """Normalize a word for anchoring: drop punctuation, optionally casefold."""
+    key = re.sub(r"\W+", "", word)
+    return key.casefold() if ignore_case else key
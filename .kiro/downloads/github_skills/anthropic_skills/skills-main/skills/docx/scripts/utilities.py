@@ -28,14 +28,29 @@ Example usage:
 
     # Save changes
     editor.save()
+
+LxmlXMLEditor offers the same API backed by lxml. It parses large files much
+faster and with a fraction of the memory, and returns lxml elements instead
+of minidom nodes:
+    editor = LxmlXMLEditor("document.xml")
+    elem = editor.get_node(tag="w:r", line_number=519)
+    editor.replace_node(elem, "<w:r><w:t>new text</w:t></w:r>")
+    editor.save()
 """
 
 import html
+import os
+import re
+from bisect import bisect_left
 from pathlib import Path
 from typing import Optional, Union
 
 import defusedxml.minidom
 import defusedxml.sax
+import lxml.etree
+
+# Wrapper element separating fragments parsed together by _parse_fragments()
+_FRAGMENT_TAG = "ooxml-fragment"
 
 
 class XMLEditor:
@@ -46,6 +61,12 @@ class XMLEditor:
     of each element. This enables finding nodes by their line number in the original
     file, which is useful when working with Read tool output.
 
+    Lookups go through indexes (by tag, attribute value and line, plus cached
+    element text) that are built on first use and kept current by the editing
+    methods below. If dom was changed directly, a lookup that finds no unique
+    match rebuilds the indexes and tries again; call invalidate_indexes() after
+    changing text directly so a lookup cannot match the old text.
+
     Attributes:
         xml_path: Path to the XML file being edited
         encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
@@ -72,6 +93,8 @@ class XMLEditor:
 
         parser = _create_line_tracking_parser()
         self.dom = defusedxml.minidom.parse(str(self.xml_path), parser)
+        self._index = _MinidomIndex(self.dom)
+        self._ns_decl_cache = None
 
     def get_node(
         self,
@@ -109,40 +132,12 @@ class XMLEditor:
             elem = editor.get_node(tag="w:t", contains="&#8220;Agreement")  # Entity notation
             elem = editor.get_node(tag="w:t", contains="\u201cAgreement")   # Unicode character
         """
-        matches = []
-        for elem in self.dom.getElementsByTagName(tag):
-            # Check line_number filter
-            if line_number is not None:
-                parse_pos = getattr(elem, "parse_position", (None,))
-                elem_line = parse_pos[0]
-
-                # Handle both single line number and range
-                if isinstance(line_number, range):
-                    if elem_line not in line_number:
-                        continue
-                else:
-                    if elem_line != line_number:
-                        continue
-
-            # Check attrs filter
-            if attrs is not None:
-                if not all(
-                    elem.getAttribute(attr_name) == attr_value
-                    for attr_name, attr_value in attrs.items()
-                ):
-                    continue
-
-            # Check contains filter
-            if contains is not None:
-                elem_text = self._get_element_text(elem)
-                # Normalize the search string: convert HTML entities to Unicode characters
-                # This allows searching for both "&#8220;Rowan" and ""Rowan"
-                normalized_contains = html.unescape(contains)
-                if normalized_contains not in elem_text:
-                    continue
-
-            # If all applicable filters passed, this is a match
-            matches.append(elem)
+        rebuilt = not self._index.built
+        matches = self._find_matches(tag, attrs, line_number, contains)
+        if len(matches) != 1 and not rebuilt:
+            # The DOM may have been changed directly, so look again from scratch
+            self._index.invalidate()
+            matches = self._find_matches(tag, attrs, line_number, contains)
 
         if not matches:
             # Build descriptive error message
@@ -180,12 +175,51 @@ class XMLEditor:
             )
         return matches[0]
 
+    def _find_matches(self, tag, attrs, line_number, contains):
+        """Return the elements passing all get_node() filters, using the indexes."""
+        matches = []
+        for elem in self._index.candidates(tag, attrs, line_number):
+            # Check line_number filter
+            if line_number is not None:
+                parse_pos = getattr(elem, "parse_position", (None,))
+                elem_line = parse_pos[0]
+
+                # Handle both single line number and range
+                if isinstance(line_number, range):
+                    if elem_line not in line_number:
+                        continue
+                else:
+                    if elem_line != line_number:
+                        continue
+
+            # Check attrs filter
+            if attrs is not None:
+                if not all(
+                    elem.getAttribute(attr_name) == attr_value
+                    for attr_name, attr_value in attrs.items()
+                ):
+                    continue
+
+            # Check contains filter
+            if contains is not None:
+                elem_text = self._get_element_text(elem)
+                # Normalize the search string: convert HTML entities to Unicode characters
+                # This allows searching for both "&#8220;Rowan" and ""Rowan"
+                normalized_contains = html.unescape(contains)
+                if normalized_contains not in elem_text:
+                    continue
+
+            # If all applicable filters passed, this is a match
+            matches.append(elem)
+        return matches
+
     def _get_element_text(self, elem):
         """
         Recursively extract all text content from an element.
 
         Skips text nodes that contain only whitespace (spaces, tabs, newlines),
         which typically represent XML formatting rather than document content.
+        Results are cached per element until the element's content is edited.
 
         Args:
             elem: defusedxml.minidom.Element to extract text from
@@ -193,15 +227,18 @@ class XMLEditor:
         Returns:
             str: Concatenated text from all non-whitespace text nodes within the element
         """
-        text_parts = []
-        for node in elem.childNodes:
-            if node.nodeType == node.TEXT_NODE:
-                # Skip whitespace-only text nodes (XML formatting)
-                if node.data.strip():
-                    text_parts.append(node.data)
-            elif node.nodeType == node.ELEMENT_NODE:
-                text_parts.append(self._get_element_text(node))
-        return "".join(text_parts)
+        text = self._index.text.get(elem)
+        if text is None:
+            text_parts = []
+            for node in elem.childNodes:
+                if node.nodeType == node.TEXT_NODE:
+                    # Skip whitespace-only text nodes (XML formatting)
+                    if node.data.strip():
+                        text_parts.append(node.data)
+                elif node.nodeType == node.ELEMENT_NODE:
+                    text_parts.append(self._get_element_text(node))
+            text = self._index.text[elem] = "".join(text_parts)
+        return text
 
     def replace_node(self, elem, new_content):
         """
@@ -217,12 +254,7 @@ class XMLEditor:
         Example:
             new_nodes = editor.replace_node(old_elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
-        nodes = self._parse_fragment(new_content)
-        for node in nodes:
-            parent.insertBefore(node, elem)
-        parent.removeChild(elem)
-        return nodes
+        return self._place_nodes("replace", elem, self._parse_fragment(new_content))
 
     def insert_after(self, elem, xml_content):
         """
@@ -238,15 +270,7 @@ class XMLEditor:
         Example:
             new_nodes = editor.insert_after(elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
-        next_sibling = elem.nextSibling
-        nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            if next_sibling:
-                parent.insertBefore(node, next_sibling)
-            else:
-                parent.appendChild(node)
-        return nodes
+        return self._place_nodes("after", elem, self._parse_fragment(xml_content))
 
     def insert_before(self, elem, xml_content):
         """
@@ -262,11 +286,7 @@ class XMLEditor:
         Example:
             new_nodes = editor.insert_before(elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
-        nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            parent.insertBefore(node, elem)
-        return nodes
+        return self._place_nodes("before", elem, self._parse_fragment(xml_content))
 
     def append_to(self, elem, xml_content):
         """
@@ -282,22 +302,69 @@ class XMLEditor:
         Example:
             new_nodes = editor.append_to(elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            elem.appendChild(node)
+        return self._place_nodes("append", elem, self._parse_fragment(xml_content))
+
+    def _place_nodes(self, position, elem, nodes):
+        """
+        Insert parsed nodes relative to elem and update the lookup indexes.
+
+        Args:
+            position: "replace", "after", "before" or "append" (as last children)
+            elem: defusedxml.minidom.Element the position refers to
+            nodes: Nodes from _parse_fragment()
+
+        Returns:
+            The inserted nodes
+        """
+        if position == "append":
+            for node in nodes:
+                elem.appendChild(node)
+            self._index.inserted(elem, nodes)
+            return nodes
+
+        parent = elem.parentNode
+        if position == "after":
+            next_sibling = elem.nextSibling
+            for node in nodes:
+                if next_sibling:
+                    parent.insertBefore(node, next_sibling)
+                else:
+                    parent.appendChild(node)
+        else:
+            for node in nodes:
+                parent.insertBefore(node, elem)
+            if position == "replace":
+                parent.removeChild(elem)
+                self._index.removed(parent, [elem])
+        self._index.inserted(parent, nodes)
         return nodes
 
+    def invalidate_indexes(self):
+        """Discard lookup indexes after the DOM was modified directly."""
+        self._index.invalidate()
+
+    def id_allocator(self, tags, attribute, prefix="", start=0):
+        """
+        Return the IdAllocator for an ID attribute, creating it on first use.
+
+        Args:
+            tags: Tags of the elements carrying the ID (e.g. ("w:ins", "w:del"))
+            attribute: Attribute holding the ID (e.g. "w:id")
+            prefix: Text before the number (e.g. "rId")
+            start: First ID handed out when the document has none
+
+        Returns:
+            IdAllocator: Shared by all callers asking for the same ID attribute
+        """
+        return self._index.allocator(tuple(tags), attribute, prefix, start)
+
     def get_next_rid(self):
-        """Get the next available rId for relationships files."""
-        max_id = 0
-        for rel_elem in self.dom.getElementsByTagName("Relationship"):
-            rel_id = rel_elem.getAttribute("Id")
-            if rel_id.startswith("rId"):
-                try:
-                    max_id = max(max_id, int(rel_id[3:]))
-                except ValueError:
-                    pass
-        return f"rId{max_id + 1}"
+        """Reserve the next available rId for relationships files.
+
+        Each call returns a new rId, even before it is added to the document.
+        """
+        allocator = self.id_allocator(("Relationship",), "Id", prefix="rId", start=1)
+        return f"rId{allocator.allocate()}"
 
     def save(self):
         """
@@ -307,7 +374,7 @@ class XMLEditor:
         preserving the original encoding (ascii or utf-8).
         """
         content = self.dom.toxml(encoding=self.encoding)
-        self.xml_path.write_bytes(content)
+        _replace_file_content(self.xml_path, content)
 
     def _parse_fragment(self, xml_content):
         """
@@ -322,26 +389,716 @@ class XMLEditor:
         Raises:
             AssertionError: If fragment contains no element nodes
         """
-        # Extract namespace declarations from the root document element
+        return self._parse_fragments([xml_content])[0]
+
+    def _parse_fragments(self, xml_contents):
+        """
+        Parse several XML fragments with a single parser run.
+
+        Args:
+            xml_contents: List of strings containing XML fragments
+
+        Returns:
+            List with the imported nodes of each fragment, in the same order
+
+        Raises:
+            AssertionError: If a fragment contains no element nodes
+        """
+        wrapper = "".join(
+            f"<{_FRAGMENT_TAG}>{xml_content}</{_FRAGMENT_TAG}>"
+            for xml_content in xml_contents
+        )
+        fragment_doc = defusedxml.minidom.parseString(
+            f"<root {self._namespace_declarations()}>{wrapper}</root>"
+        )
+        results = []
+        for fragment in fragment_doc.documentElement.childNodes:  # type: ignore
+            nodes = [
+                self.dom.importNode(child, deep=True)
+                for child in fragment.childNodes  # type: ignore
+            ]
+            elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
+            assert elements, "Fragment must contain at least one element"
+            results.append(nodes)
+        return results
+
+    def _namespace_declarations(self):
+        """
+        Return the root element's xmlns declarations as attribute text.
+
+        Cached until the number of root attributes changes, which is how
+        namespace declarations get added (see DocxXMLEditor).
+        """
         root_elem = self.dom.documentElement
-        namespaces = []
-        if root_elem and root_elem.attributes:
-            for i in range(root_elem.attributes.length):
-                attr = root_elem.attributes.item(i)
-                if attr.name.startswith("xmlns"):  # type: ignore
-                    namespaces.append(f'{attr.name}="{attr.value}"')  # type: ignore
+        if not root_elem or not root_elem.attributes:
+            return ""
+        cached = self._ns_decl_cache
+        if cached is not None and cached[0] == root_elem.attributes.length:
+            return cached[1]
 
+        namespaces = []
+        for i in range(root_elem.attributes.length):
+            attr = root_elem.attributes.item(i)
+            if attr.name.startswith("xmlns"):  # type: ignore
+                namespaces.append(f'{attr.name}="{attr.value}"')  # type: ignore
         ns_decl = " ".join(namespaces)
-        wrapper = f"<root {ns_decl}>{xml_content}</root>"
-        fragment_doc = defusedxml.minidom.parseString(wrapper)
-        nodes = [
-            self.dom.importNode(child, deep=True)
-            for child in fragment_doc.documentElement.childNodes  # type: ignore
-        ]
-        elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
-        assert elements, "Fragment must contain at least one element"
+        self._ns_decl_cache = (root_elem.attributes.length, ns_decl)
+        return ns_decl
+
+
+class LxmlXMLEditor:
+    """
+    lxml-backed alternative to XMLEditor with the same editing API.
+
+    Line numbers come from lxml's sourceline, which records where each
+    element's start tag appeared in the original file. Tags and attribute
+    names are given with the prefixes declared on the root element (e.g.
+    "w:p", "w:id"), exactly as with XMLEditor. Returned nodes are
+    lxml.etree elements. Lookups use the same indexes as XMLEditor and are
+    retried the same way after direct changes to the tree; call
+    invalidate_indexes() after changing text directly.
+
+    Attributes:
+        xml_path: Path to the XML file being edited
+        encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
+        tree: Parsed lxml.etree.ElementTree
+        root: Root element of the tree
+    """
+
+    def __init__(self, xml_path):
+        """
+        Initialize with path to XML file and parse it.
+
+        Args:
+            xml_path: Path to XML file to edit (str or Path)
+
+        Raises:
+            ValueError: If the XML file does not exist
+        """
+        self.xml_path = Path(xml_path)
+        if not self.xml_path.exists():
+            raise ValueError(f"XML file not found: {xml_path}")
+
+        with open(self.xml_path, "rb") as f:
+            header = f.read(200).decode("utf-8", errors="ignore")
+        self.encoding = "ascii" if 'encoding="ascii"' in header else "utf-8"
+        # lxml reports an absent standalone flag as False, so read it here
+        standalone = re.search(r"standalone=[\"'](yes|no)[\"']", header.split("?>")[0])
+        self._standalone = standalone.group(1) if standalone else None
+
+        self.tree = lxml.etree.parse(str(self.xml_path), _create_safe_lxml_parser())
+        self.root = self.tree.getroot()
+        self._index = _LxmlIndex(self.root)
+
+    def get_node(
+        self,
+        tag: str,
+        attrs: Optional[dict[str, str]] = None,
+        line_number: Optional[Union[int, range]] = None,
+        contains: Optional[str] = None,
+    ):
+        """
+        Get an element by tag and identifier.
+
+        Takes the same filters as XMLEditor.get_node(). Exactly one match must
+        be found.
+
+        Args:
+            tag: The XML tag name (e.g., "w:del", "w:ins", "w:r")
+            attrs: Dictionary of attribute name-value pairs to match (e.g., {"w:id": "1"})
+            line_number: Line number (int) or line range (range) in original XML file (1-indexed)
+            contains: Text string that must appear in any text node within the element.
+                      Supports both entity notation (&#8220;) and Unicode characters (\u201c).
+
+        Returns:
+            lxml.etree._Element: The matching element
+
+        Raises:
+            ValueError: If node not found or multiple matches found
+        """
+        clark_attrs = None
+        if attrs is not None:
+            clark_attrs = [
+                (self._clark_name(name, attribute=True), value)
+                for name, value in attrs.items()
+            ]
+        normalized_contains = html.unescape(contains) if contains is not None else None
+
+        clark_tag = self._clark_name(tag)
+        if not clark_tag:
+            matches = []
+        else:
+            rebuilt = not self._index.built
+            matches = self._find_matches(
+                clark_tag, clark_attrs, line_number, normalized_contains
+            )
+            if len(matches) != 1 and not rebuilt:
+                # The tree may have been changed directly, so look again from scratch
+                self._index.invalidate()
+                matches = self._find_matches(
+                    clark_tag, clark_attrs, line_number, normalized_contains
+                )
+
+        if not matches:
+            filters = []
+            if line_number is not None:
+                line_str = (
+                    f"lines {line_number.start}-{line_number.stop - 1}"
+                    if isinstance(line_number, range)
+                    else f"line {line_number}"
+                )
+                filters.append(f"at {line_str}")
+            if attrs is not None:
+                filters.append(f"with attributes {attrs}")
+            if contains is not None:
+                filters.append(f"containing '{contains}'")
+
+            filter_desc = " ".join(filters) if filters else ""
+            base_msg = f"Node not found: <{tag}> {filter_desc}".strip()
+
+            if contains:
+                hint = "Text may be split across elements or use different wording."
+            elif line_number:
+                hint = "Line numbers may have changed if document was modified."
+            elif attrs:
+                hint = "Verify attribute values are correct."
+            else:
+                hint = "Try adding filters (attrs, line_number, or contains)."
+
+            raise ValueError(f"{base_msg}. {hint}")
+        if len(matches) > 1:
+            raise ValueError(
+                f"Multiple nodes found: <{tag}>. "
+                f"Add more filters (attrs, line_number, or contains) to narrow the search."
+            )
+        return matches[0]
+
+    def _find_matches(self, clark_tag, clark_attrs, line_number, contains):
+        """Return the elements passing all get_node() filters, using the indexes."""
+        matches = []
+        for elem in self._index.candidates(
+            clark_tag, dict(clark_attrs or ()), line_number
+        ):
+            if line_number is not None:
+                if isinstance(line_number, range):
+                    if elem.sourceline not in line_number:
+                        continue
+                elif elem.sourceline != line_number:
+                    continue
+
+            # Missing attributes compare as "", like minidom's getAttribute()
+            if clark_attrs is not None and not all(
+                elem.get(name, "") == value for name, value in clark_attrs
+            ):
+                continue
+
+            if contains is not None and contains not in self._get_element_text(elem):
+                continue
+
+            matches.append(elem)
+        return matches
+
+    def _clark_name(self, name, attribute=False):
+        """
+        Convert a prefixed name like "w:p" to lxml's "{namespace}p" form.
+
+        Unprefixed tags use the root's default namespace; unprefixed
+        attributes have no namespace. Returns None for an undeclared prefix.
+        """
+        prefix, _, local = name.rpartition(":")
+        if not prefix:
+            if attribute:
+                return name
+            prefix = None
+        elif prefix == "xml":
+            return f"{{http://www.w3.org/XML/1998/namespace}}{local}"
+        namespace = self.root.nsmap.get(prefix)
+        if namespace is None:
+            return local if prefix is None else None
+        return f"{{{namespace}}}{local}"
+
+    def _get_element_text(self, elem):
+        """
+        Recursively extract all text content from an element.
+
+        Skips whitespace-only text (XML formatting), matching
+        XMLEditor._get_element_text(). Results are cached per element until
+        the element's content is edited.
+
+        Args:
+            elem: lxml element to extract text from
+
+        Returns:
+            str: Concatenated text from all non-whitespace text within the element
+        """
+        text = self._index.text.get(elem)
+        if text is None:
+            text_parts = []
+            if isinstance(elem.tag, str) and elem.text and elem.text.strip():
+                text_parts.append(elem.text)
+            for child in elem:
+                if isinstance(child.tag, str):
+                    text_parts.append(self._get_element_text(child))
+                if child.tail and child.tail.strip():
+                    text_parts.append(child.tail)
+            text = "".join(text_parts)
+            if isinstance(elem.tag, str):
+                self._index.text[elem] = text
+        return text
+
+    def replace_node(self, elem, new_content):
+        """
+        Replace an element with new XML content.
+
+        Args:
+            elem: lxml element to replace
+            new_content: String containing XML to replace the node with
+
+        Returns:
+            List[lxml.etree._Element]: All inserted elements
+        """
+        parent = elem.getparent()
+        leading_text, nodes = self._parse_fragment(new_content)
+        index = parent.index(elem)
+        nodes[-1].tail = (nodes[-1].tail or "") + (elem.tail or "") or None
+        parent.remove(elem)
+        _insert_nodes(parent, index, leading_text, nodes)
+        self._index.removed(parent, [elem])
+        self._index.inserted(parent, nodes)
+        return nodes
+
+    def insert_after(self, elem, xml_content):
+        """
+        Insert XML content after an element.
+
+        Args:
+            elem: lxml element to insert after
+            xml_content: String containing XML to insert
+
+        Returns:
+            List[lxml.etree._Element]: All inserted elements
+        """
+        parent = elem.getparent()
+        leading_text, nodes = self._parse_fragment(xml_content)
+        # Text following elem moves behind the inserted nodes, as with minidom
+        nodes[-1].tail = (nodes[-1].tail or "") + (elem.tail or "") or None
+        elem.tail = None
+        _insert_nodes(parent, parent.index(elem) + 1, leading_text, nodes)
+        self._index.inserted(parent, nodes)
+        return nodes
+
+    def insert_before(self, elem, xml_content):
+        """
+        Insert XML content before an element.
+
+        Args:
+            elem: lxml element to insert before
+            xml_content: String containing XML to insert
+
+        Returns:
+            List[lxml.etree._Element]: All inserted elements
+        """
+        parent = elem.getparent()
+        leading_text, nodes = self._parse_fragment(xml_content)
+        _insert_nodes(parent, parent.index(elem), leading_text, nodes)
+        self._index.inserted(parent, nodes)
         return nodes
 
+    def append_to(self, elem, xml_content):
+        """
+        Append XML content as children of an element.
+
+        Args:
+            elem: lxml element to append to
+            xml_content: String containing XML to append
+
+        Returns:
+            List[lxml.etree._Element]: All inserted elements
+        """
+        leading_text, nodes = self._parse_fragment(xml_content)
+        _insert_nodes(elem, len(elem), leading_text, nodes)
+        self._index.inserted(elem, nodes)
+        return nodes
+
+    def invalidate_indexes(self):
+        """Discard lookup indexes after the tree was modified directly."""
+        self._index.invalidate()
+
+    def id_allocator(self, tags, attribute, prefix="", start=0):
+        """Return the IdAllocator for an ID attribute, see XMLEditor.id_allocator()."""
+        return self._index.allocator(
+            tuple(self._clark_name(tag) for tag in tags),
+            self._clark_name(attribute, attribute=True),
+            prefix,
+            start,
+        )
+
+    def get_next_rid(self):
+        """Reserve the next available rId for relationships files.
+
+        Each call returns a new rId, even before it is added to the document.
+        """
+        allocator = self.id_allocator(("Relationship",), "Id", prefix="rId", start=1)
+        return f"rId{allocator.allocate()}"
+
+    def save(self):
+        """
+        Save the edited XML back to the file.
+
+        Keeps the original encoding (ascii or utf-8) and standalone flag.
+        """
+        declaration = f'<?xml version="1.0" encoding="{self.encoding}"'
+        if self._standalone is not None:
+            declaration += f' standalone="{self._standalone}"'
+        content = lxml.etree.tostring(self.tree, encoding=self.encoding)
+        _replace_file_content(self.xml_path, declaration.encode() + b"?>\n" + content)
+
+    def _parse_fragment(self, xml_content):
+        """
+        Parse an XML fragment using the namespaces declared on the root.
+
+        Args:
+            xml_content: String containing XML fragment
+
+        Returns:
+            Tuple of (text before the first element or None, list of elements).
+            Elements carry any text that follows them as their tail.
+
+        Raises:
+            AssertionError: If fragment contains no element nodes
+        """
+        ns_decl = " ".join(
+            f'xmlns:{prefix}="{uri}"' if prefix else f'xmlns="{uri}"'
+            for prefix, uri in self.root.nsmap.items()
+        )
+        wrapper = lxml.etree.fromstring(
+            f"<root {ns_decl}>{xml_content}</root>", _create_safe_lxml_parser()
+        )
+        nodes = list(wrapper)
+        assert any(isinstance(node.tag, str) for node in nodes), (
+            "Fragment must contain at least one element"
+        )
+        # Inserted nodes have no position in the original file
+        for node in nodes:
+            for descendant in node.iter():
+                descendant.sourceline = 0
+        return wrapper.text, nodes
+
+
+class IdAllocator:
+    """
+    Hands out unique numeric IDs for one attribute of one or more tags.
+
+    The document is scanned for the highest existing ID on the first
+    allocation; after that IDs come from a counter. Explicit IDs in content
+    inserted through the editor move the counter past them, and after
+    invalidate_indexes() the next allocation scans again. The counter never
+    goes down, so an ID is not handed out twice even if its element is
+    removed. Get allocators from the editors' id_allocator().
+
+    Attributes:
+        tags: Tags of the elements carrying the ID
+        attribute: Attribute holding the ID
+        prefix: Text before the number; values without it are ignored
+    """
+
+    def __init__(self, index, tags, attribute, prefix="", start=0):
+        self.tags = tags
+        self.attribute = attribute
+        self.prefix = prefix
+        self._index = index
+        self._next = None
+        self._floor = start
+
+    def allocate(self):
+        """Reserve and return the next ID, as an int without the prefix."""
+        if self._next is None:
+            self._next = self._floor
+            for tag in self.tags:
+                for elem in self._index.candidates(tag):
+                    self.observe(elem)
+        value = self._next
+        self._next += 1
+        return value
+
+    def observe(self, elem):
+        """Make sure the ID of elem, if it carries one, is not handed out."""
+        if self._next is None or self._index._tag(elem) not in self.tags:
+            return
+        value = self._index._attribute(elem, self.attribute)
+        if not value.startswith(self.prefix):
+            return
+        try:
+            number = int(value[len(self.prefix) :])
+        except ValueError:
+            return
+        if number >= self._next:
+            self._next = number + 1
+
+    def reset(self):
+        """Scan again on the next allocation, without going below issued IDs."""
+        if self._next is not None:
+            self._floor = self._next
+            self._next = None
+
+
+class _ElementIndex:
+    """
+    Lookup tables for get_node(), built on first use.
+
+    Holds elements by tag, by (tag, attribute) value and by original line,
+    plus the cached text of elements. Editors report inserted and removed
+    nodes so the tables stay current without a rebuild. Elements inserted
+    after an attribute table was built are kept aside and always checked,
+    since callers may still set their attributes (see DocxXMLEditor). Candidates
+    that are no longer part of the document are dropped before returning.
+
+    Subclasses adapt the index to a tree API (minidom or lxml).
+
+    Attributes:
+        document: Tree the index covers (minidom Document or lxml root)
+        text: Cached element text, see the editors' _get_element_text()
+        generation: Bumped on every reported change, so caches built on top
+            of the editor (see search.py) can tell when they are stale
+        allocators: IdAllocators kept informed of inserted elements
+    """
+
+    def __init__(self, document):
+        self.document = document
+        self.text = {}
+        self.generation = 0
+        self.allocators = {}
+        self._by_tag = None
+        self._by_line = None
+        self._lines = None
+        self._by_attr = {}
+        self._pending = {}
+
+    @property
+    def built(self):
+        """Whether the tables have been built since the last invalidate()."""
+        return self._by_tag is not None
+
+    def invalidate(self):
+        """Drop all tables; they are rebuilt on the next lookup."""
+        self.generation += 1
+        self.text = {}
+        self._by_tag = None
+        self._by_line = None
+        self._lines = None
+        self._by_attr = {}
+        self._pending = {}
+        for allocator in self.allocators.values():
+            allocator.reset()
+
+    def allocator(self, tags, attribute, prefix, start):
+        """Return the IdAllocator for these arguments, creating it once."""
+        key = (tags, attribute, prefix)
+        if key not in self.allocators:
+            self.allocators[key] = IdAllocator(self, tags, attribute, prefix, start)
+        return self.allocators[key]
+
+    def candidates(self, tag, attrs=None, line_number=None):
+        """Return attached elements with this tag that may match the filters.
+
+        Uses the most selective index available: line, then the first
+        attribute, then tag. Callers still apply all filters to the result.
+        """
+        if self._by_tag is None:
+            self._build()
+
+        if line_number is not None:
+            if isinstance(line_number, range):
+                start = bisect_left(self._lines, line_number.start)
+                stop = bisect_left(self._lines, line_number.stop)
+                lines = self._lines[start:stop]
+            else:
+                lines = [line_number]
+            elements = [
+                elem
+                for line in lines
+                for elem in self._by_line.get(line, ())
+                if self._tag(elem) == tag
+            ]
+        elif attrs:
+            name, value = next(iter(attrs.items()))
+            elements = self._attribute_table(tag, name).get(value, []) + list(
+                self._pending[(tag, name)]
+            )
+        else:
+            elements = self._by_tag.get(tag, ())
+
+        return [elem for elem in elements if self._is_attached(elem)]
+
+    def inserted(self, parent, nodes):
+        """Record nodes just inserted under parent."""
+        self.generation += 1
+        self._text_changed(parent)
+        if self._by_tag is None:
+            return
+        for node in nodes:
+            for elem in self._subtree(node):
+                tag = self._tag(elem)
+                self._by_tag.setdefault(tag, {})[elem] = None
+                for key, pending in self._pending.items():
+                    if key[0] == tag:
+                        pending[elem] = None
+                for allocator in self.allocators.values():
+                    allocator.observe(elem)
+
+    def removed(self, parent, nodes):
+        """Record nodes just removed from parent."""
+        self.generation += 1
+        self._text_changed(parent)
+        for node in nodes:
+            for elem in self._subtree(node):
+                self.text.pop(elem, None)
+                if self._by_tag is not None:
+                    self._by_tag.get(self._tag(elem), {}).pop(elem, None)
+                    for pending in self._pending.values():
+                        pending.pop(elem, None)
+
+    def restructured(self, parent, nodes):
+        """Record nodes under parent whose subtrees were changed in place."""
+        self.removed(parent, nodes)
+        self.inserted(parent, nodes)
+
+    def _build(self):
+        self._by_tag = {}
+        self._by_line = {}
+        for elem, line in self._elements():
+            self._by_tag.setdefault(self._tag(elem), {})[elem] = None
+            if line is not None:
+                self._by_line.setdefault(line, []).append(elem)
+        self._lines = sorted(self._by_line)
+
+    def _attribute_table(self, tag, name):
+        key = (tag, name)
+        if key not in self._by_attr:
+            table = {}
+            for elem in self._by_tag.get(tag, ()):
+                table.setdefault(self._attribute(elem, name), []).append(elem)
+            self._by_attr[key] = table
+            self._pending[key] = {}
+        return self._by_attr[key]
+
+    def _text_changed(self, elem):
+        """Forget the cached text of elem and its ancestors."""
+        while elem is not None:
+            self.text.pop(elem, None)
+            elem = self._parent(elem)
+
+    def _elements(self):
+        """Yield (element, original line or None) in document order."""
+        raise NotImplementedError
+
+    def _subtree(self, node):
+        """Yield node (if it is an element) and all its descendant elements."""
+        raise NotImplementedError
+
+    def _tag(self, elem):
+        raise NotImplementedError
+
+    def _attribute(self, elem, name):
+        raise NotImplementedError
+
+    def _parent(self, elem):
+        """Return the parent element, or None at the root."""
+        raise NotImplementedError
+
+    def _is_attached(self, elem):
+        raise NotImplementedError
+
+
+class _MinidomIndex(_ElementIndex):
+    """_ElementIndex over a minidom Document."""
+
+    def _elements(self):
+        for elem in self.document.getElementsByTagName("*"):
+            yield elem, getattr(elem, "parse_position", (None,))[0]
+
+    def _subtree(self, node):
+        if node.nodeType == node.ELEMENT_NODE:
+            yield node
+            yield from node.getElementsByTagName("*")
+
+    def _tag(self, elem):
+        return elem.tagName
+
+    def _attribute(self, elem, name):
+        return elem.getAttribute(name)
+
+    def _parent(self, elem):
+        parent = elem.parentNode
+        if parent is None or parent.nodeType != parent.ELEMENT_NODE:
+            return None
+        return parent
+
+    def _is_attached(self, elem):
+        while elem.parentNode is not None:
+            elem = elem.parentNode
+        return elem is self.document
+
+
+class _LxmlIndex(_ElementIndex):
+    """_ElementIndex over an lxml root element."""
+
+    def _elements(self):
+        for elem in self.document.iter(lxml.etree.Element):
+            yield elem, elem.sourceline
+
+    def _subtree(self, node):
+        if isinstance(node.tag, str):
+            yield from node.iter(lxml.etree.Element)
+
+    def _tag(self, elem):
+        return elem.tag
+
+    def _attribute(self, elem, name):
+        return elem.get(name, "")
+
+    def _parent(self, elem):
+        return elem.getparent()
+
+    def _is_attached(self, elem):
+        while True:
+            parent = elem.getparent()
+            if parent is None:
+                return elem is self.document
+            elem = parent
+
+
+def _insert_nodes(parent, index, leading_text, nodes):
+    """Insert nodes into parent at index, with leading_text placed before them."""
+    if leading_text:
+        if index == 0:
+            parent.text = (parent.text or "") + leading_text
+        else:
+            previous = parent[index - 1]
+            previous.tail = (previous.tail or "") + leading_text
+    for offset, node in enumerate(nodes):
+        parent.insert(index + offset, node)
+
+
+def _replace_file_content(path, content):
+    """Write content to a new file and move it over path.
+
+    Other hard links to path (see Document) keep the old content, and readers
+    never see a partially written file.
+    """
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        temp_path.write_bytes(content)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def _create_safe_lxml_parser():
+    """Create an lxml parser that does not expand entities or touch the network."""
+    return lxml.etree.XMLParser(resolve_entities=False, no_network=True)
+
 
 def _create_line_tracking_parser():
     """
@@ -2,6 +2,8 @@ from dataclasses import dataclass
 import json
 import sys
 
+from overlaps import overlapping_pairs
+
 
 # Script to check that the `fields.json` file that Claude creates when analyzing PDFs
 # does not have overlapping bounding boxes. See forms.md.
@@ -20,30 +22,33 @@ def get_bounding_box_messages(fields_json_stream) -> list[str]:
     fields = json.load(fields_json_stream)
     messages.append(f"Read {len(fields['form_fields'])} fields")
 
-    def rects_intersect(r1, r2):
-        disjoint_horizontal = r1[0] >= r2[2] or r1[2] <= r2[0]
-        disjoint_vertical = r1[1] >= r2[3] or r1[3] <= r2[1]
-        return not (disjoint_horizontal or disjoint_vertical)
-
     rects_and_fields = []
     for f in fields["form_fields"]:
         rects_and_fields.append(RectAndField(f["label_bounding_box"], "label", f))
         rects_and_fields.append(RectAndField(f["entry_bounding_box"], "entry", f))
 
+    # Find the intersecting boxes on each page with a sweep instead of comparing
+    # every pair. Pairs come back sorted, so each list is in box order.
+    indices_by_page = {}
+    for i, r in enumerate(rects_and_fields):
+        indices_by_page.setdefault(r.field["page_number"], []).append(i)
+    intersecting = [[] for _ in rects_and_fields]
+    for indices in indices_by_page.values():
+        for a, b in overlapping_pairs([rects_and_fields[i].rect for i in indices]):
+            intersecting[indices[a]].append(indices[b])
+
     has_error = False
     for i, ri in enumerate(rects_and_fields):
-        # This is O(N^2); we can optimize if it becomes a problem.
-        for j in range(i + 1, len(rects_and_fields)):
+        for j in intersecting[i]:
             rj = rects_and_fields[j]
-            if ri.field["page_number"] == rj.field["page_number"] and rects_intersect(ri.rect, rj.rect):
-                has_error = True
-                if ri.field is rj.field:
-                    messages.append(f"FAILURE: intersection between label and entry bounding boxes for `{ri.field['description']}` ({ri.rect}, {rj.rect})")
-                else:
-                    messages.append(f"FAILURE: intersection between {ri.rect_type} bounding box for `{ri.field['description']}` ({ri.rect}) and {rj.rect_type} bounding box for `{rj.field['description']}` ({rj.rect})")
-                if len(messages) >= 20:
-                    messages.append("Aborting further checks; fix bounding boxes and try again")
-                    return messages
+            has_error = True
+            if ri.field is rj.field:
+                messages.append(f"FAILURE: intersection between label and entry bounding boxes for `{ri.field['description']}` ({ri.rect}, {rj.rect})")
+            else:
+                messages.append(f"FAILURE: intersection between {ri.rect_type} bounding box for `{ri.field['description']}` ({ri.rect}) and {rj.rect_type} bounding box for `{rj.field['description']}` ({rj.rect})")
+            if len(messages) >= 20:
+                messages.append("Aborting further checks; fix bounding boxes and try again")
+                return messages
         if ri.rect_type == "entry":
             if "entry_text" in ri.field:
                 font_size = ri.field["entry_text"].get("font_size", 14)
@@ -221,6 +221,32 @@ class TestGetBoundingBoxMessages(unittest.TestCase):
         self.assertTrue(any("SUCCESS" in msg for msg in messages))
         self.assertFalse(any("FAILURE" in msg for msg in messages))
     
+    def test_intersection_among_many_fields(self):
+        """Test that an intersection is found among many non-overlapping rows"""
+        fields = []
+        for i in range(200):
+            fields.append({
+                "description": f"Field{i}",
+                "page_number": 1,
+                "label_bounding_box": [10, 10 + i * 20, 50, 28 + i * 20],
+                "entry_bounding_box": [60, 10 + i * 20, 150, 28 + i * 20]
+            })
+        fields.append({
+            "description": "Late",
+            "page_number": 1,
+            "label_bounding_box": [200, 10, 250, 28],
+            "entry_bounding_box": [100, 75, 190, 85]  # Overlaps Field3's entry
+        })
+
+        data = {"form_fields": fields}
+
+        stream = self.create_json_stream(data)
+        messages = get_bounding_box_messages(stream)
+        failures = [msg for msg in messages if "FAILURE" in msg]
+        self.assertEqual(len(failures), 1)
+        self.assertIn("`Field3`", failures[0])
+        self.assertIn("`Late`", failures[0])
+    
 
 if __name__ == '__main__':
     unittest.main()
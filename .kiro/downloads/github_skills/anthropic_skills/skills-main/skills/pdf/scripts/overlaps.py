@@ -0,0 +1,49 @@
+"""
+Find intersecting pairs among many axis-aligned rectangles.
+
+Used by the pptx inventory (overlapping shapes on a slide) and by the pdf
+check_bounding_boxes script (overlapping form field boxes). Both skills
+ship an identical copy of this module so that each stays self-contained.
+
+Instead of testing every pair, the rectangles are swept from top to bottom:
+each one is compared only with the rectangles whose vertical span is still
+open when it starts. Slides and forms are mostly laid out in rows, so few
+rectangles are open at once and the cost is O(n log n) plus the number of
+pairs whose vertical spans overlap.
+"""
+
+import heapq
+
+
+def overlapping_pairs(rects):
+    """Return the index pairs (i, j), i < j, of rectangles that intersect.
+
+    Args:
+        rects: Sequence of (x0, y0, x1, y1) rectangles
+
+    Returns:
+        Sorted list of (i, j) pairs for which rects[i][0] < rects[j][2] and
+        rects[j][0] < rects[i][2], and likewise for y. Rectangles that only
+        share an edge do not intersect.
+    """
+    order = sorted(range(len(rects)), key=lambda i: rects[i][1])
+    open_ends = []  # Heap of (y1, index) for the rectangles still open
+    active = {}
+    pairs = []
+
+    for i in order:
+        x0, y0, x1, y1 = rects[i]
+
+        # Rectangles ending at or above this top can't meet it or any later one
+        while open_ends and open_ends[0][0] <= y0:
+            del active[heapq.heappop(open_ends)[1]]
+
+        for j, (ax0, ay0, ax1, ay1) in active.items():
+            if ay0 < y1 and ax0 < x1 and x0 < ax1:
+                pairs.append((j, i) if j < i else (i, j))
+
+        active[i] = rects[i]
+        heapq.heappush(open_ends, (y1, i))
+
+    pairs.sort()
+    return pairs
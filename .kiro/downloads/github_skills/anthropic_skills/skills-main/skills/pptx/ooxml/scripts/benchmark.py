@@ -0,0 +1,763 @@
+#!/usr/bin/env python3
+"""
+Benchmark the OOXML toolchain on synthetic documents of configurable size.
+
+Generates .docx/.pptx/.xlsx packages, then times each stage (unpack,
+validate, Document editing, inventory, pack) in a fresh subprocess and
+records its wall time and peak RSS. Results are written as JSON so runs
+from different commits can be compared.
+
+Usage:
+    python benchmark.py [--paragraphs N] [--slides N] ... [--output results.json]
+    python benchmark.py --compare baseline.json [--threshold 10]
+
+Example:
+    python benchmark.py --paragraphs 20000 --tracked-changes 500 --comments 200 \\
+        --slides 200 --shapes 20 --images 50 --output after.json --compare before.json
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import runpy
+import shutil
+import statistics
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+import zlib
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+SKILLS_DIR = SCRIPTS_DIR.parent.parent.parent
+DOCX_SKILL_DIR = SKILLS_DIR / "docx"
+PPTX_SKILL_DIR = SKILLS_DIR / "pptx"
+
+# Stages run for each document kind, in order
+STAGES = {
+    "docx": ["unpack", "validate", "revalidate", "document", "pack"],
+    "pptx": ["unpack", "validate", "revalidate", "inventory", "pack"],
+    "xlsx": ["unpack", "pack"],
+}
+
+# Incremental validation state written by validate.py (see validation/state.py)
+VALIDATION_STATE_FILE = ".ooxml-validation-state.json"
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+PIC_NS = "http://schemas.openxmlformats.org/drawingml/2006/picture"
+WP_NS = "http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"
+S_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+PKG_RELS_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+CT_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+REL_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+# Comment parts: (name, content type, relationship type)
+COMMENT_PARTS = [
+    (
+        "comments.xml",
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.comments+xml",
+        "comments",
+    ),
+    (
+        "commentsExtended.xml",
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.commentsExtended+xml",
+        "http://schemas.microsoft.com/office/2011/relationships/commentsExtended",
+    ),
+    (
+        "commentsIds.xml",
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.commentsIds+xml",
+        "http://schemas.microsoft.com/office/2016/09/relationships/commentsIds",
+    ),
+    (
+        "commentsExtensible.xml",
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.commentsExtensible+xml",
+        "http://schemas.microsoft.com/office/2018/08/relationships/commentsExtensible",
+    ),
+]
+
+XML_HEADER = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+LOREM = (
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod "
+    "tempor incididunt ut labore et dolore magna aliqua."
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark unpack/validate/Document/inventory/pack on synthetic files"
+    )
+    parser.add_argument(
+        "--kinds", nargs="+", choices=list(STAGES), default=list(STAGES)
+    )
+    parser.add_argument("--paragraphs", type=int, default=2000, help="docx paragraphs")
+    parser.add_argument(
+        "--tracked-changes", type=int, default=100, help="docx w:ins/w:del pairs"
+    )
+    parser.add_argument("--comments", type=int, default=50, help="docx comments")
+    parser.add_argument("--slides", type=int, default=50, help="pptx slides")
+    parser.add_argument("--shapes", type=int, default=10, help="pptx shapes per slide")
+    parser.add_argument("--images", type=int, default=10, help="images per docx/pptx")
+    parser.add_argument("--image-size", type=int, default=64, help="image edge in px")
+    parser.add_argument("--sheets", type=int, default=3, help="xlsx worksheets")
+    parser.add_argument("--rows", type=int, default=5000, help="xlsx rows per sheet")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per stage")
+    parser.add_argument("--output", help="Write results JSON to this file")
+    parser.add_argument("--compare", help="Baseline results JSON to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="Percent slowdown or RSS growth reported as a regression (default: 10)",
+    )
+    parser.add_argument(
+        "--workdir", help="Keep generated files here instead of a temp dir"
+    )
+    parser.add_argument("--stage", help=argparse.SUPPRESS)
+    parser.add_argument("--stage-args", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    # Child process: run a single stage and report its measurements
+    if args.stage:
+        print(json.dumps(run_stage(args.stage, json.loads(args.stage_args))))
+        return
+
+    config = {
+        "paragraphs": args.paragraphs,
+        "tracked_changes": args.tracked_changes,
+        "comments": args.comments,
+        "slides": args.slides,
+        "shapes": args.shapes,
+        "images": args.images,
+        "image_size": args.image_size,
+        "sheets": args.sheets,
+        "rows": args.rows,
+        "repeat": args.repeat,
+    }
+
+    if args.workdir:
+        workdir = Path(args.workdir)
+        workdir.mkdir(parents=True, exist_ok=True)
+        results = run_benchmarks(workdir, args.kinds, config)
+    else:
+        with tempfile.TemporaryDirectory(prefix="ooxml_bench_") as temp_dir:
+            results = run_benchmarks(Path(temp_dir), args.kinds, config)
+
+    report = {
+        "environment": describe_environment(),
+        "config": config,
+        "results": results,
+    }
+    print_results(results)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\nWrote {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        if baseline.get("config") != config:
+            print("\nWarning: baseline was recorded with a different configuration")
+        if not compare_results(baseline["results"], results, args.threshold):
+            sys.exit(1)
+
+
+# ==================== Benchmark driver ====================
+
+
+def run_benchmarks(workdir, kinds, config):
+    """Generate one document per kind and time every stage on it."""
+    results = []
+    for kind in kinds:
+        source = workdir / f"synthetic.{kind}"
+        GENERATORS[kind](source, config)
+        unpacked = workdir / f"{kind}_unpacked"
+
+        for stage in STAGES[kind]:
+            runs = []
+            for _ in range(config["repeat"]):
+                if stage == "unpack":
+                    shutil.rmtree(unpacked, ignore_errors=True)
+                elif stage == "validate":
+                    # Cold run: drop results stored by an earlier validation
+                    (unpacked / VALIDATION_STATE_FILE).unlink(missing_ok=True)
+                runs.append(
+                    run_in_subprocess(
+                        stage,
+                        {
+                            "kind": kind,
+                            "source": str(source),
+                            "unpacked": str(unpacked),
+                            "workdir": str(workdir),
+                        },
+                    )
+                )
+
+            results.append(
+                {
+                    "kind": kind,
+                    "stage": stage,
+                    "seconds": statistics.median(run["seconds"] for run in runs),
+                    "peak_rss_mb": max(run["peak_rss_mb"] for run in runs),
+                    "runs": [run["seconds"] for run in runs],
+                    "source_bytes": source.stat().st_size,
+                }
+            )
+    return results
+
+
+def run_in_subprocess(stage, stage_args):
+    """Run one stage in a fresh interpreter so peak RSS is measured per stage."""
+    completed = subprocess.run(
+        [
+            sys.executable,
+            str(Path(__file__).resolve()),
+            "--stage",
+            stage,
+            "--stage-args",
+            json.dumps(stage_args),
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(
+            f"Stage {stage} failed for {stage_args['kind']}:\n{completed.stderr}"
+        )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def run_stage(stage, stage_args):
+    """Run a stage in this process and return its wall time and peak RSS."""
+    source = Path(stage_args["source"])
+    unpacked = Path(stage_args["unpacked"])
+    workdir = Path(stage_args["workdir"])
+
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    start = time.perf_counter()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        if stage == "unpack":
+            run_script(SCRIPTS_DIR / "unpack.py", [str(source), str(unpacked)])
+        elif stage in ("validate", "revalidate"):
+            run_script(
+                SCRIPTS_DIR / "validate.py", [str(unpacked), "--original", str(source)]
+            )
+        elif stage == "pack":
+            from pack import pack_document
+
+            pack_document(unpacked, workdir / f"packed.{source.suffix[1:]}")
+        elif stage == "document":
+            edit_document(unpacked, workdir / "document_edit")
+        elif stage == "inventory":
+            run_script(
+                PPTX_SKILL_DIR / "scripts" / "inventory.py",
+                [str(source), str(workdir / "inventory.json")],
+            )
+        else:
+            raise ValueError(f"Unknown stage: {stage}")
+    seconds = time.perf_counter() - start
+
+    return {"seconds": round(seconds, 4), "peak_rss_mb": peak_rss_mb()}
+
+
+def run_script(script, argv):
+    """Run a command line script in this process, treating exit code 0/1 as done.
+
+    As when the script is run directly, its directory is first on sys.path so
+    it can import the modules next to it.
+    """
+    saved_argv, saved_path = sys.argv, sys.path[:]
+    sys.argv = [str(script)] + argv
+    sys.path.insert(0, str(Path(script).parent))
+    try:
+        runpy.run_path(str(script), run_name="__main__")
+    except SystemExit as e:
+        # validate.py exits 1 on validation errors, which are not failures here
+        if e.code not in (None, 0, 1):
+            raise
+    finally:
+        sys.argv = saved_argv
+        sys.path[:] = saved_path
+
+
+def edit_document(unpacked, edit_dir):
+    """Open the unpacked docx with Document, add a comment and save with validation."""
+    shutil.rmtree(edit_dir, ignore_errors=True)
+    shutil.copytree(unpacked, edit_dir)
+
+    # Document imports ooxml.scripts.* (from pptx/) and its own scripts package
+    sys.path[:0] = [str(DOCX_SKILL_DIR), str(PPTX_SKILL_DIR)]
+    from scripts.document import Document
+
+    doc = Document(edit_dir)
+    paragraphs = doc["word/document.xml"].dom.getElementsByTagName("w:p")
+    target = paragraphs[len(paragraphs) // 2]
+    doc.add_comment(start=target, end=target, text="Benchmark comment")
+    doc.save()
+
+
+def peak_rss_mb():
+    """Return the peak resident set size of this process in MB."""
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes on Linux
+    if sys.platform == "darwin":
+        peak //= 1024
+    return round(peak / 1024, 1)
+
+
+def describe_environment():
+    """Describe the machine and checkout the results were recorded on."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=SCRIPTS_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+# ==================== Reporting ====================
+
+
+def print_results(results):
+    print(f"{'kind':<6} {'stage':<12} {'seconds':>10} {'peak MB':>10}")
+    for result in results:
+        print(
+            f"{result['kind']:<6} {result['stage']:<12} "
+            f"{result['seconds']:>10.3f} {result['peak_rss_mb']:>10.1f}"
+        )
+
+
+def compare_results(baseline, current, threshold):
+    """Print changes against a baseline. Returns False if anything regressed."""
+    baseline_by_stage = {(r["kind"], r["stage"]): r for r in baseline}
+    regressions = []
+
+    print(
+        f"\n{'kind':<6} {'stage':<12} {'base s':>9} {'now s':>9} {'time':>8} "
+        f"{'base MB':>9} {'now MB':>9} {'rss':>8}"
+    )
+    for result in current:
+        key = (result["kind"], result["stage"])
+        base = baseline_by_stage.get(key)
+        if base is None:
+            print(f"{key[0]:<6} {key[1]:<12} (not in baseline)")
+            continue
+
+        time_change = _percent_change(base["seconds"], result["seconds"])
+        rss_change = _percent_change(base["peak_rss_mb"], result["peak_rss_mb"])
+        print(
+            f"{key[0]:<6} {key[1]:<12} {base['seconds']:>9.3f} {result['seconds']:>9.3f} "
+            f"{time_change:>+7.1f}% {base['peak_rss_mb']:>9.1f} "
+            f"{result['peak_rss_mb']:>9.1f} {rss_change:>+7.1f}%"
+        )
+        if time_change > threshold:
+            regressions.append(f"{key[0]} {key[1]}: {time_change:+.1f}% time")
+        if rss_change > threshold:
+            regressions.append(f"{key[0]} {key[1]}: {rss_change:+.1f}% peak RSS")
+
+    if regressions:
+        print(f"\nREGRESSED by more than {threshold}%:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return False
+    print(f"\nNo regressions above {threshold}%")
+    return True
+
+
+def _percent_change(before, after):
+    if not before:
+        return 0.0
+    return (after - before) / before * 100
+
+
+# ==================== Synthetic documents ====================
+
+
+def make_png(size, seed):
+    """Return a size x size RGB PNG filled with noise (so it doesn't compress away)."""
+    rng = random.Random(seed)
+    rows = b"".join(b"\x00" + rng.randbytes(size * 3) for _ in range(size))
+
+    def chunk(kind, data):
+        return (
+            struct.pack(">I", len(data))
+            + kind
+            + data
+            + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+        )
+
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(rows))
+        + chunk(b"IEND", b"")
+    )
+
+
+def _relationships(rels):
+    """Build a .rels part from (id, type, target) tuples."""
+    body = "".join(
+        f'<Relationship Id="{rid}" Type="{_relationship_type(rel_type)}" Target="{target}"/>'
+        for rid, rel_type, target in rels
+    )
+    return f'{XML_HEADER}<Relationships xmlns="{PKG_RELS_NS}">{body}</Relationships>'
+
+
+def _relationship_type(rel_type):
+    """Expand a short officeDocument relationship type like 'image'."""
+    return rel_type if "://" in rel_type else f"{REL_TYPE}/{rel_type}"
+
+
+def _content_types(defaults, overrides):
+    """Build [Content_Types].xml from extension and part name mappings."""
+    body = "".join(
+        f'<Default Extension="{ext}" ContentType="{content_type}"/>'
+        for ext, content_type in defaults.items()
+    ) + "".join(
+        f'<Override PartName="/{part}" ContentType="{content_type}"/>'
+        for part, content_type in overrides.items()
+    )
+    return f'{XML_HEADER}<Types xmlns="{CT_NS}">{body}</Types>'
+
+
+def _write_package(path, parts):
+    """Write a zip package with [Content_Types].xml first."""
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name in sorted(parts, key=lambda name: name != "[Content_Types].xml"):
+            data = parts[name]
+            zf.writestr(name, data.encode("utf-8") if isinstance(data, str) else data)
+
+
+def _package_defaults():
+    return {
+        "rels": "application/vnd.openxmlformats-package.relationships+xml",
+        "xml": "application/xml",
+        "png": "image/png",
+    }
+
+
+def make_docx(path, config):
+    """Generate a .docx with paragraphs, tracked changes, comments and images."""
+    paragraphs = max(config["paragraphs"], 1)
+    tracked = config["tracked_changes"]
+    comments = config["comments"]
+    images = config["images"]
+
+    def spread(count):
+        # Paragraph indexes that get a feature, evenly spaced
+        if count <= 0:
+            return set()
+        step = max(paragraphs // count, 1)
+        return set(range(0, paragraphs, step)[:count])
+
+    tracked_at, comment_at, image_at = spread(tracked), spread(comments), spread(images)
+    rels = []
+    body = []
+    comment_id = 0
+    change_id = 1000
+    image_index = 0
+
+    for i in range(paragraphs):
+        runs = [f'<w:r><w:t xml:space="preserve">Paragraph {i}. {LOREM} </w:t></w:r>']
+        if i in tracked_at:
+            runs.append(
+                f'<w:ins w:id="{change_id}" w:author="Reviewer" w:date="2024-01-01T00:00:00Z">'
+                "<w:r><w:t xml:space='preserve'>inserted text </w:t></w:r></w:ins>"
+                f'<w:del w:id="{change_id + 1}" w:author="Reviewer" w:date="2024-01-01T00:00:00Z">'
+                f"<w:r><w:delText>deleted text</w:delText></w:r></w:del>"
+            )
+            change_id += 2
+        if i in comment_at:
+            runs = (
+                [f'<w:commentRangeStart w:id="{comment_id}"/>']
+                + runs
+                + [
+                    f'<w:commentRangeEnd w:id="{comment_id}"/>',
+                    f'<w:r><w:commentReference w:id="{comment_id}"/></w:r>',
+                ]
+            )
+            comment_id += 1
+        if i in image_at:
+            image_index += 1
+            rid = f"rIdImg{image_index}"
+            rels.append((rid, "image", f"media/image{image_index}.png"))
+            emu = config["image_size"] * 9525
+            runs.append(
+                "<w:r><w:drawing>"
+                f'<wp:inline><wp:extent cx="{emu}" cy="{emu}"/>'
+                f'<wp:docPr id="{image_index}" name="Picture {image_index}"/>'
+                f'<a:graphic><a:graphicData uri="{PIC_NS}">'
+                f'<pic:pic><pic:nvPicPr><pic:cNvPr id="{image_index}" name="image{image_index}.png"/>'
+                "<pic:cNvPicPr/></pic:nvPicPr>"
+                f'<pic:blipFill><a:blip r:embed="{rid}"/><a:stretch><a:fillRect/></a:stretch></pic:blipFill>'
+                f'<pic:spPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="{emu}" cy="{emu}"/></a:xfrm>'
+                '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></pic:spPr>'
+                "</pic:pic></a:graphicData></a:graphic></wp:inline>"
+                "</w:drawing></w:r>"
+            )
+        body.append(f"<w:p>{''.join(runs)}</w:p>")
+
+    document = (
+        f'{XML_HEADER}<w:document xmlns:w="{W_NS}" xmlns:r="{R_NS}" '
+        f'xmlns:a="{A_NS}" xmlns:pic="{PIC_NS}" xmlns:wp="{WP_NS}"><w:body>'
+        + "".join(body)
+        + '<w:sectPr><w:pgSz w:w="12240" w:h="15840"/></w:sectPr></w:body></w:document>'
+    )
+
+    overrides = {
+        "word/document.xml": "application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"
+    }
+    parts = {
+        "word/document.xml": document,
+        "word/settings.xml": f'{XML_HEADER}<w:settings xmlns:w="{W_NS}"/>',
+    }
+    overrides["word/settings.xml"] = (
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.settings+xml"
+    )
+    rels.append(("rIdSettings", "settings", "settings.xml"))
+    if comment_id:
+        # Ship the same comment parts Word (and Document) write, so adding a
+        # comment later extends them instead of creating unreferenced parts
+        comments = "".join(
+            f'<w:comment w:id="{n}" w:author="Reviewer" w:date="2024-01-01T00:00:00Z" w:initials="R">'
+            f"<w:p><w:r><w:t>Comment {n}</w:t></w:r></w:p></w:comment>"
+            for n in range(comment_id)
+        )
+        for name, content_type, rel_type in COMMENT_PARTS:
+            template = (DOCX_SKILL_DIR / "scripts" / "templates" / name).read_text()
+            if name == "comments.xml":
+                template = template.replace("</w:comments>", comments + "</w:comments>")
+            parts[f"word/{name}"] = template
+            overrides[f"word/{name}"] = content_type
+            rels.append((f"rId{name.split('.')[0]}", rel_type, name))
+    for n in range(1, image_index + 1):
+        parts[f"word/media/image{n}.png"] = make_png(config["image_size"], n)
+
+    parts["[Content_Types].xml"] = _content_types(_package_defaults(), overrides)
+    parts["_rels/.rels"] = _relationships(
+        [("rId1", "officeDocument", "word/document.xml")]
+    )
+    parts["word/_rels/document.xml.rels"] = _relationships(rels)
+    _write_package(path, parts)
+
+
+def _theme():
+    """A minimal complete DrawingML theme."""
+    colors = "".join(
+        f'<a:{name}><a:srgbClr val="{value}"/></a:{name}>'
+        for name, value in [
+            ("dk1", "000000"),
+            ("lt1", "FFFFFF"),
+            ("dk2", "1F497D"),
+            ("lt2", "EEECE1"),
+            ("accent1", "4F81BD"),
+            ("accent2", "C0504D"),
+            ("accent3", "9BBB59"),
+            ("accent4", "8064A2"),
+            ("accent5", "4BACC6"),
+            ("accent6", "F79646"),
+            ("hlink", "0000FF"),
+            ("folHlink", "800080"),
+        ]
+    )
+    fonts = '<a:latin typeface="Calibri"/><a:ea typeface=""/><a:cs typeface=""/>'
+    fill = '<a:solidFill><a:schemeClr val="phClr"/></a:solidFill>'
+    line = f'<a:ln w="9525">{fill}</a:ln>'
+    effect = "<a:effectStyle><a:effectLst/></a:effectStyle>"
+    return (
+        f'{XML_HEADER}<a:theme xmlns:a="{A_NS}" name="Synthetic">'
+        f'<a:themeElements><a:clrScheme name="Synthetic">{colors}</a:clrScheme>'
+        f'<a:fontScheme name="Synthetic"><a:majorFont>{fonts}</a:majorFont>'
+        f"<a:minorFont>{fonts}</a:minorFont></a:fontScheme>"
+        f'<a:fmtScheme name="Synthetic"><a:fillStyleLst>{fill * 3}</a:fillStyleLst>'
+        f"<a:lnStyleLst>{line * 3}</a:lnStyleLst>"
+        f"<a:effectStyleLst>{effect * 3}</a:effectStyleLst>"
+        f"<a:bgFillStyleLst>{fill * 3}</a:bgFillStyleLst></a:fmtScheme>"
+        "</a:themeElements></a:theme>"
+    )
+
+
+def make_pptx(path, config):
+    """Generate a .pptx with text shapes and pictures on every slide."""
+    slides = max(config["slides"], 1)
+    shapes = config["shapes"]
+    images = config["images"]
+    image_size = config["image_size"]
+    empty_tree = (
+        '<p:spTree><p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/>'
+        '</p:nvGrpSpPr><p:grpSpPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="0" cy="0"/>'
+        '<a:chOff x="0" y="0"/><a:chExt cx="0" cy="0"/></a:xfrm></p:grpSpPr>'
+    )
+    namespaces = f'xmlns:a="{A_NS}" xmlns:r="{R_NS}" xmlns:p="{P_NS}"'
+    slide_type = (
+        "application/vnd.openxmlformats-officedocument.presentationml.slide+xml"
+    )
+
+    parts = {}
+    overrides = {
+        "ppt/presentation.xml": "application/vnd.openxmlformats-officedocument.presentationml.presentation.main+xml",
+        "ppt/slideMasters/slideMaster1.xml": "application/vnd.openxmlformats-officedocument.presentationml.slideMaster+xml",
+        "ppt/slideLayouts/slideLayout1.xml": "application/vnd.openxmlformats-officedocument.presentationml.slideLayout+xml",
+        "ppt/theme/theme1.xml": "application/vnd.openxmlformats-officedocument.theme+xml",
+    }
+    presentation_rels = [
+        ("rId1", "slideMaster", "slideMasters/slideMaster1.xml"),
+        ("rId2", "theme", "theme/theme1.xml"),
+    ]
+
+    # Spread images round-robin over the slides
+    images_on = [[] for _ in range(slides)]
+    for n in range(1, images + 1):
+        images_on[(n - 1) % slides].append(n)
+
+    for s in range(1, slides + 1):
+        shape_xml = []
+        shape_id = 2
+        for n in range(shapes):
+            x, y = 457200 + (n % 4) * 2000000, 457200 + (n // 4) * 800000
+            shape_xml.append(
+                f'<p:sp><p:nvSpPr><p:cNvPr id="{shape_id}" name="TextBox {shape_id}"/>'
+                '<p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+                f'<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="1828800" cy="640080"/></a:xfrm>'
+                '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></p:spPr>'
+                '<p:txBody><a:bodyPr wrap="square"/><a:lstStyle/>'
+                f'<a:p><a:r><a:rPr lang="en-US" sz="1400"/><a:t>Slide {s} shape {n}: {LOREM[:60]}</a:t></a:r></a:p>'
+                "</p:txBody></p:sp>"
+            )
+            shape_id += 1
+
+        slide_rels = [("rId1", "slideLayout", "../slideLayouts/slideLayout1.xml")]
+        for n in images_on[s - 1]:
+            rid = f"rId{len(slide_rels) + 1}"
+            slide_rels.append((rid, "image", f"../media/image{n}.png"))
+            emu = image_size * 9525
+            shape_xml.append(
+                f'<p:pic><p:nvPicPr><p:cNvPr id="{shape_id}" name="Picture {shape_id}"/>'
+                "<p:cNvPicPr/><p:nvPr/></p:nvPicPr>"
+                f'<p:blipFill><a:blip r:embed="{rid}"/><a:stretch><a:fillRect/></a:stretch></p:blipFill>'
+                f'<p:spPr><a:xfrm><a:off x="{emu * n % 8000000}" y="5000000"/>'
+                f'<a:ext cx="{emu}" cy="{emu}"/></a:xfrm>'
+                '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></p:spPr></p:pic>'
+            )
+            shape_id += 1
+
+        parts[f"ppt/slides/slide{s}.xml"] = (
+            f"{XML_HEADER}<p:sld {namespaces}><p:cSld>{empty_tree}"
+            + "".join(shape_xml)
+            + "</p:spTree></p:cSld><p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr></p:sld>"
+        )
+        parts[f"ppt/slides/_rels/slide{s}.xml.rels"] = _relationships(slide_rels)
+        overrides[f"ppt/slides/slide{s}.xml"] = slide_type
+        presentation_rels.append((f"rId{s + 2}", "slide", f"slides/slide{s}.xml"))
+
+    for n in range(1, images + 1):
+        parts[f"ppt/media/image{n}.png"] = make_png(image_size, n)
+
+    slide_ids = "".join(
+        f'<p:sldId id="{255 + s}" r:id="rId{s + 2}"/>' for s in range(1, slides + 1)
+    )
+    parts["ppt/presentation.xml"] = (
+        f"{XML_HEADER}<p:presentation {namespaces}>"
+        '<p:sldMasterIdLst><p:sldMasterId id="2147483648" r:id="rId1"/></p:sldMasterIdLst>'
+        f"<p:sldIdLst>{slide_ids}</p:sldIdLst>"
+        '<p:sldSz cx="9144000" cy="6858000"/><p:notesSz cx="6858000" cy="9144000"/>'
+        "</p:presentation>"
+    )
+    parts["ppt/slideMasters/slideMaster1.xml"] = (
+        f"{XML_HEADER}<p:sldMaster {namespaces}><p:cSld>{empty_tree}</p:spTree></p:cSld>"
+        '<p:clrMap bg1="lt1" tx1="dk1" bg2="lt2" tx2="dk2" accent1="accent1" '
+        'accent2="accent2" accent3="accent3" accent4="accent4" accent5="accent5" '
+        'accent6="accent6" hlink="hlink" folHlink="folHlink"/>'
+        '<p:sldLayoutIdLst><p:sldLayoutId id="2147483649" r:id="rId1"/></p:sldLayoutIdLst>'
+        "</p:sldMaster>"
+    )
+    parts["ppt/slideLayouts/slideLayout1.xml"] = (
+        f'{XML_HEADER}<p:sldLayout {namespaces} type="blank"><p:cSld name="Blank">'
+        f"{empty_tree}</p:spTree></p:cSld>"
+        "<p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr></p:sldLayout>"
+    )
+    parts["ppt/theme/theme1.xml"] = _theme()
+    parts["ppt/_rels/presentation.xml.rels"] = _relationships(presentation_rels)
+    parts["ppt/slideMasters/_rels/slideMaster1.xml.rels"] = _relationships(
+        [
+            ("rId1", "slideLayout", "../slideLayouts/slideLayout1.xml"),
+            ("rId2", "theme", "../theme/theme1.xml"),
+        ]
+    )
+    parts["ppt/slideLayouts/_rels/slideLayout1.xml.rels"] = _relationships(
+        [("rId1", "slideMaster", "../slideMasters/slideMaster1.xml")]
+    )
+    parts["[Content_Types].xml"] = _content_types(_package_defaults(), overrides)
+    parts["_rels/.rels"] = _relationships(
+        [("rId1", "officeDocument", "ppt/presentation.xml")]
+    )
+    _write_package(path, parts)
+
+
+def make_xlsx(path, config):
+    """Generate a .xlsx with numeric rows and a SUM formula per row."""
+    sheets = max(config["sheets"], 1)
+    rows = config["rows"]
+    overrides = {
+        "xl/workbook.xml": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"
+    }
+    parts = {}
+    workbook_rels = []
+
+    for s in range(1, sheets + 1):
+        row_xml = "".join(
+            f'<row r="{r}"><c r="A{r}"><v>{r}</v></c><c r="B{r}"><v>{r * s}</v></c>'
+            f'<c r="C{r}"><f>SUM(A{r}:B{r})</f></c></row>'
+            for r in range(1, rows + 1)
+        )
+        parts[f"xl/worksheets/sheet{s}.xml"] = (
+            f'{XML_HEADER}<worksheet xmlns="{S_NS}"><sheetData>{row_xml}</sheetData></worksheet>'
+        )
+        overrides[f"xl/worksheets/sheet{s}.xml"] = (
+            "application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"
+        )
+        workbook_rels.append((f"rId{s}", "worksheet", f"worksheets/sheet{s}.xml"))
+
+    sheet_list = "".join(
+        f'<sheet name="Sheet{s}" sheetId="{s}" r:id="rId{s}"/>'
+        for s in range(1, sheets + 1)
+    )
+    parts["xl/workbook.xml"] = (
+        f'{XML_HEADER}<workbook xmlns="{S_NS}" xmlns:r="{R_NS}">'
+        f"<sheets>{sheet_list}</sheets></workbook>"
+    )
+    parts["xl/_rels/workbook.xml.rels"] = _relationships(workbook_rels)
+    parts["[Content_Types].xml"] = _content_types(_package_defaults(), overrides)
+    parts["_rels/.rels"] = _relationships(
+        [("rId1", "officeDocument", "xl/workbook.xml")]
+    )
+    _write_package(path, parts)
+
+
+GENERATORS = {"docx": make_docx, "pptx": make_pptx, "xlsx": make_xlsx}
+
+
+if __name__ == "__main__":
+    main()
@@ -7,14 +7,33 @@ Example usage:
 """
 
 import argparse
+import re
 import shutil
 import subprocess
 import sys
 import tempfile
-import defusedxml.minidom
+import lxml.etree
 import zipfile
 from pathlib import Path
 
+# Incremental validation state written by validate.py; never packaged
+VALIDATION_STATE_FILE = ".ooxml-validation-state.json"
+
+# Parts written first, in the order Office itself writes them
+LEADING_PARTS = ["[Content_Types].xml", "_rels/.rels"]
+
+# Media that is already compressed and is stored in the package as-is
+STORED_SUFFIXES = {".png", ".jpg", ".jpeg", ".gif", ".emz", ".wmz", ".wdp"}
+STORED_SUFFIXES |= {".mp3", ".mp4", ".m4a", ".m4v", ".wma", ".wmv"}
+
+# standalone flag in an XML declaration
+_STANDALONE_PATTERN = re.compile(rb"<\?xml\s[^>]*?standalone\s*=\s*[\"'](yes|no)[\"']")
+
+# Comments and processing instructions (kept as they are), or character data
+# after a tag that contains a double quote. lxml escapes ">" in attribute
+# values and text, so outside comments and PIs a ">" always ends a tag.
+_QUOTED_TEXT = re.compile(rb'<!--.*?-->|<\?.*?\?>|>[^<"]*"[^<]*', re.DOTALL)
+
 
 def main():
     parser = argparse.ArgumentParser(description="Pack a directory into an Office file")
@@ -42,13 +61,14 @@ def main():
         sys.exit(f"Error: {e}")
 
 
-def pack_document(input_dir, output_file, validate=False):
+def pack_document(input_dir, output_file, validate=False, pool=None):
     """Pack a directory into an Office file (.docx/.pptx/.xlsx).
 
     Args:
         input_dir: Path to unpacked Office document directory
         output_file: Path to output Office file
         validate: If True, validates with soffice (default: False)
+        pool: Optional soffice.SofficePool to validate with
 
     Returns:
         bool: True if successful, False if validation failed
@@ -61,34 +81,41 @@ def pack_document(input_dir, output_file, validate=False):
     if output_file.suffix.lower() not in {".docx", ".pptx", ".xlsx"}:
         raise ValueError(f"{output_file} must be a .docx, .pptx, or .xlsx file")
 
-    # Work in temporary directory to avoid modifying original
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_content_dir = Path(temp_dir) / "content"
-        shutil.copytree(input_dir, temp_content_dir)
-
-        # Process XML files to remove pretty-printing whitespace
-        for pattern in ["*.xml", "*.rels"]:
-            for xml_file in temp_content_dir.rglob(pattern):
-                condense_xml(xml_file)
-
-        # Create final Office file as zip archive
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+    # Stream every part straight into the archive, condensing XML on the way
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    try:
         with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
-            for f in temp_content_dir.rglob("*"):
-                if f.is_file():
-                    zf.write(f, f.relative_to(temp_content_dir))
-
-        # Validate if requested
-        if validate:
-            if not validate_document(output_file):
-                output_file.unlink()  # Delete the corrupt file
-                return False
+            for f in _package_files(input_dir):
+                info = zipfile.ZipInfo.from_file(f, f.relative_to(input_dir))
+                if f.suffix.lower() in STORED_SUFFIXES:
+                    info.compress_type = zipfile.ZIP_STORED
+                else:
+                    info.compress_type = zipfile.ZIP_DEFLATED
+
+                if f.name.endswith((".xml", ".rels")):
+                    zf.writestr(info, condensed_xml(f))
+                else:
+                    with open(f, "rb") as src, zf.open(info, "w") as dst:
+                        shutil.copyfileobj(src, dst, 1024 * 1024)
+    except BaseException:
+        output_file.unlink(missing_ok=True)
+        raise
+
+    # Validate if requested
+    if validate:
+        if not validate_document(output_file, pool=pool):
+            output_file.unlink()  # Delete the corrupt file
+            return False
 
     return True
 
 
-def validate_document(doc_path):
-    """Validate document by converting to HTML with soffice."""
+def validate_document(doc_path, pool=None):
+    """Validate document by converting to HTML with soffice.
+
+    Starts a fresh soffice process with a 10 second timeout, or converts on
+    one of pool's long-lived workers (see soffice.SofficePool) if given.
+    """
     # Determine the correct filter based on file extension
     match doc_path.suffix.lower():
         case ".docx":
@@ -100,6 +127,11 @@ def validate_document(doc_path):
 
     with tempfile.TemporaryDirectory() as temp_dir:
         try:
+            if pool is not None:
+                # Raises if the conversion fails or produces no output
+                pool.convert(doc_path, temp_dir, filter_name)
+                return True
+
             result = subprocess.run(
                 [
                     "soffice",
@@ -130,29 +162,81 @@ def validate_document(doc_path):
             return False
 
 
+def _package_files(input_dir):
+    """Return the files to package, with LEADING_PARTS first and the rest sorted."""
+    files = sorted(
+        f.relative_to(input_dir).as_posix()
+        for f in input_dir.rglob("*")
+        if f.is_file() and f.name != VALIDATION_STATE_FILE
+    )
+    leading = [name for name in LEADING_PARTS if name in files]
+    rest = [name for name in files if name not in leading]
+    return [input_dir / name for name in leading + rest]
+
+
 def condense_xml(xml_file):
     """Strip unnecessary whitespace and remove comments."""
-    with open(xml_file, "r", encoding="utf-8") as f:
-        dom = defusedxml.minidom.parse(f)
+    Path(xml_file).write_bytes(condensed_xml(xml_file))
+
+
+def condensed_xml(xml_file):
+    """Return the content of an XML file without whitespace-only text and comments.
 
-    # Process each element to remove whitespace and comments
-    for element in dom.getElementsByTagName("*"):
-        # Skip w:t elements and their processing
-        if element.tagName.endswith(":t"):
+    Text elements (w:t, a:t, t) are left alone, since their whitespace is
+    content. The result is UTF-8 and keeps the standalone declaration.
+    """
+    content = Path(xml_file).read_bytes()
+    parser = lxml.etree.XMLParser(
+        resolve_entities=False, no_network=True, huge_tree=True
+    )
+    tree = lxml.etree.ElementTree(lxml.etree.fromstring(content, parser))
+
+    for element in list(tree.iter(lxml.etree.Element)):
+        # Skip text elements and their processing
+        if element.tag.rpartition("}")[2] == "t":
             continue
 
-        # Remove whitespace-only text nodes and comment nodes
-        for child in list(element.childNodes):
-            if (
-                child.nodeType == child.TEXT_NODE
-                and child.nodeValue
-                and child.nodeValue.strip() == ""
-            ) or child.nodeType == child.COMMENT_NODE:
-                element.removeChild(child)
-
-    # Write back the condensed XML
-    with open(xml_file, "wb") as f:
-        f.write(dom.toxml(encoding="UTF-8"))
+        # Remove whitespace-only text nodes, then comment nodes
+        if element.text and element.text.strip() == "":
+            element.text = None
+        for child in element:
+            if child.tail and child.tail.strip() == "":
+                child.tail = None
+        for child in list(element.iterchildren(lxml.etree.Comment)):
+            _remove_keeping_tail(child)
+
+    declaration = '<?xml version="1.0" encoding="UTF-8"'
+    standalone = _STANDALONE_PATTERN.match(content.removeprefix(b"\xef\xbb\xbf"))
+    if standalone:
+        declaration += f' standalone="{standalone.group(1).decode()}"'
+    body = lxml.etree.tostring(tree, encoding="UTF-8", xml_declaration=False)
+    return declaration.encode() + b"?>" + escape_text_quotes(body)
+
+
+def escape_text_quotes(xml):
+    """Write double quotes in character data of serialized XML as &quot;.
+
+    lxml leaves them bare, minidom always escaped them, so this keeps output
+    byte-identical to what the minidom-based scripts used to write.
+    """
+    return _QUOTED_TEXT.sub(
+        lambda match: (
+            match[0] if match[0].startswith(b"<") else match[0].replace(b'"', b"&quot;")
+        ),
+        xml,
+    )
+
+
+def _remove_keeping_tail(node):
+    """Remove node from its parent without dropping the text that follows it."""
+    parent = node.getparent()
+    if node.tail:
+        previous = node.getprevious()
+        if previous is not None:
+            previous.tail = (previous.tail or "") + node.tail
+        else:
+            parent.text = (parent.text or "") + node.tail
+    parent.remove(node)
 
 
 if __name__ == "__main__":
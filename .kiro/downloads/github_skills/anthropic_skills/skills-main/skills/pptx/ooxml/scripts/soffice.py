@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""
+Pool of long-lived headless LibreOffice workers for document conversion.
+
+Starting soffice costs seconds per call. SofficePool starts its workers once,
+hands them jobs in the order they are submitted (callers block until a worker
+is free) and restarts a worker whose process crashed, retrying the job once.
+pack.validate_document(), pptx/scripts/thumbnail.convert_to_images() and
+xlsx/recalc.recalc() accept a pool through their pool= argument.
+
+Usage:
+    from soffice import SofficePool
+
+    with SofficePool(size=2) as pool:
+        for path in unpacked_dirs:
+            pack_document(path, f"{path}.docx", validate=True, pool=pool)
+        pdf_path = pool.convert("deck.pptx", "out", "pdf")
+
+When LibreOffice's Python UNO bridge (the uno module) can be imported, each
+worker is one soffice process listening on a local socket, and documents are
+loaded and stored over UNO. Otherwise each worker keeps its own LibreOffice
+profile and runs soffice --convert-to against it: a process is still started
+per job, but the profile is created once and parallel jobs never contend for
+the same profile lock.
+"""
+
+import queue
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Default seconds a single job may take before its worker is restarted
+DEFAULT_TIMEOUT = 60
+
+# Macro run by recalculate() when UNO is not available (as in xlsx/recalc.py)
+RECALC_MACRO_URL = (
+    "vnd.sun.star.script:Standard.Module1.RecalculateAndSave"
+    "?language=Basic&location=application"
+)
+RECALC_MACRO = """<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE script:module PUBLIC "-//OpenOffice.org//DTD OfficeDocument 1.0//EN" "module.dtd">
+<script:module xmlns:script="http://openoffice.org/2000/script" script:name="Module1" script:language="StarBasic">
+    Sub RecalculateAndSave()
+      ThisComponent.calculateAll()
+      ThisComponent.store()
+      ThisComponent.close(True)
+    End Sub
+</script:module>"""
+
+# UNO export filters for targets given without one (e.g. "pdf"), by document type
+_DEFAULT_FILTERS = {
+    "pdf": {
+        "com.sun.star.presentation.PresentationDocument": "impress_pdf_Export",
+        "com.sun.star.sheet.SpreadsheetDocument": "calc_pdf_Export",
+        "com.sun.star.drawing.DrawingDocument": "draw_pdf_Export",
+        "com.sun.star.text.TextDocument": "writer_pdf_Export",
+    },
+    "docx": {"com.sun.star.text.TextDocument": "MS Word 2007 XML"},
+    "xlsx": {"com.sun.star.sheet.SpreadsheetDocument": "Calc MS Excel 2007 XML"},
+    "pptx": {
+        "com.sun.star.presentation.PresentationDocument": "Impress MS PowerPoint 2007 XML"
+    },
+}
+
+
+class SofficeError(RuntimeError):
+    """A conversion failed, timed out, or LibreOffice could not be started."""
+
+
+class SofficePool:
+    """
+    Shared headless LibreOffice workers.
+
+    Workers start on start() (or the first job) and stop on close(); use the
+    pool as a context manager to do both. Jobs may be submitted from several
+    threads.
+
+    Args:
+        size: Number of workers, i.e. jobs that run at the same time
+        soffice: LibreOffice executable
+        timeout: Default seconds a job may take (see DEFAULT_TIMEOUT)
+        startup_timeout: Seconds to wait for a worker to come up
+    """
+
+    def __init__(
+        self, size=1, soffice="soffice", timeout=DEFAULT_TIMEOUT, startup_timeout=60
+    ):
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.size = size
+        self.soffice = soffice
+        self.timeout = timeout
+        self.startup_timeout = startup_timeout
+        self._idle = queue.Queue()
+        self._workers = []
+        self._profiles = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def start(self):
+        """Start the workers if they are not running yet. Returns the pool."""
+        with self._lock:
+            if self._workers:
+                return self
+            self._profiles = Path(tempfile.mkdtemp(prefix="soffice_pool_"))
+            worker_class = _UnoWorker if _uno_available() else _CommandWorker
+            try:
+                for n in range(self.size):
+                    worker = worker_class(
+                        self.soffice,
+                        self._profiles / f"worker{n}",
+                        self.startup_timeout,
+                    )
+                    worker.start()
+                    self._workers.append(worker)
+            except BaseException:
+                self._stop_workers()
+                raise
+            for worker in self._workers:
+                self._idle.put(worker)
+        return self
+
+    def close(self):
+        """Stop all workers and remove their profiles."""
+        with self._lock:
+            self._stop_workers()
+
+    def convert(self, input_path, output_dir, target, timeout=None):
+        """
+        Convert a document, like soffice --convert-to.
+
+        Args:
+            input_path: Document to convert
+            output_dir: Directory for the result
+            target: Extension with optional filter, as for --convert-to
+                (e.g. "pdf" or "html:impress_html_Export")
+            timeout: Seconds the job may take (default: the pool's timeout)
+
+        Returns:
+            Path: output_dir / "<input stem>.<extension>"
+
+        Raises:
+            SofficeError: If the conversion fails or produces no file
+        """
+        input_path = Path(input_path).resolve()
+        output_dir = Path(output_dir).resolve()
+        output_path = output_dir / f"{input_path.stem}.{target.split(':')[0]}"
+        self._run(
+            lambda worker, seconds: worker.convert(
+                input_path, output_dir, target, seconds
+            ),
+            timeout,
+        )
+        if not output_path.exists():
+            raise SofficeError(f"Converting {input_path.name} produced no output")
+        return output_path
+
+    def recalculate(self, path, timeout=None):
+        """
+        Recalculate all formulas of a spreadsheet and save it in place.
+
+        Raises:
+            SofficeError: If the document cannot be recalculated or saved
+        """
+        path = Path(path).resolve()
+        self._run(lambda worker, seconds: worker.recalculate(path, seconds), timeout)
+
+    def _run(self, job, timeout):
+        """Run job(worker, timeout) on the next free worker."""
+        self.start()
+        timeout = timeout or self.timeout
+        worker = self._idle.get()
+        try:
+            if not worker.alive():
+                worker.restart()
+            try:
+                return job(worker, timeout)
+            except _WorkerCrashed:
+                # The process died under the job: retry once on a fresh one
+                worker.restart()
+                try:
+                    return job(worker, timeout)
+                except _WorkerCrashed as e:
+                    worker.restart()
+                    raise SofficeError(f"LibreOffice crashed twice: {e}") from e
+        finally:
+            self._idle.put(worker)
+
+    def _stop_workers(self):
+        for worker in self._workers:
+            worker.stop()
+        self._workers = []
+        self._idle = queue.Queue()
+        if self._profiles is not None:
+            shutil.rmtree(self._profiles, ignore_errors=True)
+            self._profiles = None
+
+
+class _WorkerCrashed(Exception):
+    """The worker's soffice process died while running a job."""
+
+
+class _CommandWorker:
+    """Runs soffice per job against a profile of its own (no UNO bridge)."""
+
+    def __init__(self, soffice, profile, startup_timeout):
+        self.soffice = soffice
+        self.profile = profile
+        self.startup_timeout = startup_timeout
+
+    def start(self):
+        # Create the profile up front so that jobs do not pay for it
+        self._call(["--terminate_after_init"], self.startup_timeout)
+        macro_dir = self.profile / "user" / "basic" / "Standard"
+        macro_dir.mkdir(parents=True, exist_ok=True)
+        (macro_dir / "Module1.xba").write_text(RECALC_MACRO)
+
+    def alive(self):
+        return True
+
+    def restart(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def convert(self, input_path, output_dir, target, timeout):
+        self._call(
+            ["--convert-to", target, "--outdir", str(output_dir), str(input_path)],
+            timeout,
+        )
+
+    def recalculate(self, path, timeout):
+        self._call([RECALC_MACRO_URL, str(path)], timeout)
+
+    def _call(self, args, timeout):
+        command = [
+            self.soffice,
+            "--headless",
+            "--norestore",
+            f"-env:UserInstallation={self.profile.as_uri()}",
+            *args,
+        ]
+        try:
+            result = subprocess.run(command, capture_output=True, timeout=timeout)
+        except subprocess.TimeoutExpired as e:
+            raise SofficeError(f"LibreOffice timed out after {timeout}s") from e
+        if result.returncode < 0:
+            raise _WorkerCrashed(f"soffice exited with signal {-result.returncode}")
+        if result.returncode != 0:
+            message = result.stderr.decode(errors="replace").strip()
+            raise SofficeError(message or f"soffice exited with {result.returncode}")
+
+
+class _UnoWorker:
+    """One soffice process listening on a local socket, driven over UNO."""
+
+    def __init__(self, soffice, profile, startup_timeout):
+        self.soffice = soffice
+        self.profile = profile
+        self.startup_timeout = startup_timeout
+        self.process = None
+        self.desktop = None
+        self._timed_out = False
+
+    def start(self):
+        import uno
+        from com.sun.star.connection import NoConnectException
+
+        port = _free_port()
+        self.process = subprocess.Popen(
+            [
+                self.soffice,
+                "--headless",
+                "--invisible",
+                "--nologo",
+                "--nodefault",
+                "--norestore",
+                "--nolockcheck",
+                f"-env:UserInstallation={self.profile.as_uri()}",
+                f"--accept=socket,host=127.0.0.1,port={port};urp;",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+        local = uno.getComponentContext()
+        resolver = local.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local
+        )
+        url = f"uno:socket,host=127.0.0.1,port={port};urp;StarOffice.ComponentContext"
+        deadline = time.monotonic() + self.startup_timeout
+        while True:
+            try:
+                context = resolver.resolve(url)
+                break
+            except NoConnectException:
+                if self.process.poll() is not None or time.monotonic() > deadline:
+                    self.stop()
+                    raise SofficeError("LibreOffice did not start") from None
+                time.sleep(0.2)
+        self.desktop = context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context
+        )
+
+    def alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def restart(self):
+        self.stop()
+        self.start()
+
+    def stop(self):
+        if self.desktop is not None and self.alive():
+            try:
+                self.desktop.terminate()
+                self.process.wait(timeout=10)
+            except Exception:
+                pass
+        if self.process is not None and self.process.poll() is None:
+            self.process.kill()
+            self.process.wait()
+        self.process = None
+        self.desktop = None
+
+    def convert(self, input_path, output_dir, target, timeout):
+        import uno
+
+        extension, _, filter_name = target.partition(":")
+        output_url = uno.systemPathToFileUrl(
+            str(output_dir / f"{input_path.stem}.{extension}")
+        )
+
+        def job():
+            doc = self._load(input_path)
+            try:
+                name = filter_name or _default_filter(doc, extension)
+                doc.storeToURL(output_url, _properties(FilterName=name))
+            finally:
+                doc.close(True)
+
+        self._call(job, timeout)
+
+    def recalculate(self, path, timeout):
+        def job():
+            doc = self._load(path)
+            try:
+                doc.calculateAll()
+                doc.store()
+            finally:
+                doc.close(True)
+
+        self._call(job, timeout)
+
+    def _load(self, path):
+        import uno
+
+        doc = self.desktop.loadComponentFromURL(
+            uno.systemPathToFileUrl(str(path)), "_blank", 0, _properties(Hidden=True)
+        )
+        if doc is None:
+            raise SofficeError(f"LibreOffice could not load {path.name}")
+        return doc
+
+    def _call(self, job, timeout):
+        """Run job, killing the process if it takes longer than timeout."""
+        self._timed_out = False
+        timer = threading.Timer(timeout, self._kill_on_timeout)
+        timer.start()
+        try:
+            job()
+        except SofficeError:
+            raise
+        except Exception as e:
+            if self._timed_out:
+                self.restart()
+                raise SofficeError(f"LibreOffice timed out after {timeout}s") from e
+            if not self.alive():
+                raise _WorkerCrashed(str(e)) from e
+            raise SofficeError(str(e)) from e
+        finally:
+            timer.cancel()
+
+    def _kill_on_timeout(self):
+        self._timed_out = True
+        if self.process is not None:
+            self.process.kill()
+
+
+def _uno_available():
+    try:
+        import uno  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _default_filter(doc, extension):
+    """Pick the export filter for a target given without one."""
+    for service, name in _DEFAULT_FILTERS.get(extension, {}).items():
+        if doc.supportsService(service):
+            return name
+    raise SofficeError(f"No default filter for .{extension}; give one as ext:filter")
+
+
+def _properties(**values):
+    """Build a tuple of UNO PropertyValues."""
+    from com.sun.star.beans import PropertyValue
+
+    properties = []
+    for name, value in values.items():
+        prop = PropertyValue()
+        prop.Name = name
+        prop.Value = value
+        properties.append(prop)
+    return tuple(properties)
+
+
+def _free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
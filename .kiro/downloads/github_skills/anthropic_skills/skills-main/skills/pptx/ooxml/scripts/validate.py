@@ -3,66 +3,308 @@
 Command line tool to validate Office document XML files against XSD schemas and tracked changes.
 
 Usage:
-    python validate.py <dir> --original <original_file>
+    python validate.py <dir> --original <original_file> [--jobs N] [--no-cache] [--stream]
+
+Batch usage:
+    python validate.py --manifest <pairs.json> [--report <report.ndjson>] [--jobs N]
+    python validate.py --glob "<pattern>" [--report <report.json>] [--jobs N]
+
+A manifest is a JSON list of {"unpacked_dir": ..., "original": ...} objects
+(or [unpacked_dir, original] pairs); relative paths are resolved against the
+manifest's directory. A glob matches original .docx/.pptx files, each paired
+with the directory next to it that has the same name without the extension.
+
+Results for unchanged parts are stored in <dir>/.ooxml-validation-state.json
+and reused on the next run; pack.py leaves that file out of the package.
 """
 
 import argparse
+import contextlib
+import glob
+import json
+import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
 from pathlib import Path
 
-from validation import DOCXSchemaValidator, PPTXSchemaValidator, RedliningValidator
+from validation import (
+    DOCXSchemaValidator,
+    PPTXSchemaValidator,
+    RedliningValidator,
+    ValidationIssue,
+    ValidationResult,
+)
+
+SUPPORTED_EXTENSIONS = [".docx", ".pptx", ".xlsx"]
 
 
 def main():
     parser = argparse.ArgumentParser(description="Validate Office document XML files")
     parser.add_argument(
         "unpacked_dir",
+        nargs="?",
         help="Path to unpacked Office document directory",
     )
     parser.add_argument(
         "--original",
-        required=True,
         help="Path to original file (.docx/.pptx/.xlsx)",
     )
+    batch = parser.add_mutually_exclusive_group()
+    batch.add_argument(
+        "--manifest",
+        help="Validate every (unpacked_dir, original) pair listed in this JSON file",
+    )
+    batch.add_argument(
+        "--glob",
+        help="Validate every original file matching this pattern against the "
+        "directory of the same name without the extension",
+    )
+    parser.add_argument(
+        "--report",
+        help="Batch mode: write a JSON report to this path (NDJSON, one "
+        "document per line, if it ends in .ndjson or .jsonl)",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
         action="store_true",
         help="Enable verbose output",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for XSD validation, or for documents in batch "
+        "mode (default: 1, 0 = all CPUs)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-validate every part instead of reusing results stored in the "
+        "unpacked directory for unchanged parts",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream every part with iterparse for the structural checks "
+        "(parts over 64 MB are always streamed)",
+    )
     args = parser.parse_args()
+    assert args.jobs >= 0, "Error: --jobs must be 0 or a positive integer"
+
+    options = {
+        "incremental": not args.no_cache,
+        "streaming": True if args.stream else None,
+    }
+
+    if args.manifest or args.glob:
+        assert args.unpacked_dir is None and args.original is None, (
+            "Error: --manifest/--glob cannot be combined with a single document"
+        )
+        pairs = read_manifest(args.manifest) if args.manifest else glob_pairs(args.glob)
+        success = run_batch(pairs, args.report, args.jobs, args.verbose, **options)
+        sys.exit(0 if success else 1)
 
     # Validate paths
+    assert args.unpacked_dir and args.original, (
+        "Error: an unpacked directory and --original are required "
+        "(or --manifest/--glob for batch mode)"
+    )
     unpacked_dir = Path(args.unpacked_dir)
     original_file = Path(args.original)
-    file_extension = original_file.suffix.lower()
+    _check_pair(unpacked_dir, original_file)
+
+    if original_file.suffix.lower() == ".xlsx":
+        print("Error: Validation not supported for file type .xlsx")
+        sys.exit(1)
+
+    result = run_validators(
+        unpacked_dir, original_file, verbose=args.verbose, jobs=args.jobs, **options
+    )
+    result.render(verbose=args.verbose)
+    if result.passed:
+        print("All validations PASSED!")
+
+    sys.exit(0 if result.passed else 1)
+
+
+def _check_pair(unpacked_dir, original_file):
     assert unpacked_dir.is_dir(), f"Error: {unpacked_dir} is not a directory"
     assert original_file.is_file(), f"Error: {original_file} is not a file"
-    assert file_extension in [".docx", ".pptx", ".xlsx"], (
+    assert original_file.suffix.lower() in SUPPORTED_EXTENSIONS, (
         f"Error: {original_file} must be a .docx, .pptx, or .xlsx file"
     )
 
-    # Run validations
-    match file_extension:
+
+def create_validators(
+    unpacked_dir, original_file, verbose=False, jobs=1, incremental=True, streaming=None
+):
+    """Return the validators that apply to original_file's document type.
+
+    Raises:
+        ValueError: If the file type has no validators (e.g. .xlsx)
+    """
+    match Path(original_file).suffix.lower():
         case ".docx":
-            validators = [DOCXSchemaValidator, RedliningValidator]
+            return [
+                DOCXSchemaValidator(
+                    unpacked_dir,
+                    original_file,
+                    verbose=verbose,
+                    jobs=jobs,
+                    incremental=incremental,
+                    streaming=streaming,
+                ),
+                RedliningValidator(unpacked_dir, original_file, verbose=verbose),
+            ]
         case ".pptx":
-            validators = [PPTXSchemaValidator]
-        case _:
-            print(f"Error: Validation not supported for file type {file_extension}")
-            sys.exit(1)
-
-    # Run validators
-    success = True
-    for V in validators:
-        validator = V(unpacked_dir, original_file, verbose=args.verbose)
-        if not validator.validate():
-            success = False
-
-    if success:
-        print("All validations PASSED!")
+            return [
+                PPTXSchemaValidator(
+                    unpacked_dir,
+                    original_file,
+                    verbose=verbose,
+                    jobs=jobs,
+                    incremental=incremental,
+                    streaming=streaming,
+                )
+            ]
+        case extension:
+            raise ValueError(f"Validation not supported for file type {extension}")
+
+
+def run_validators(unpacked_dir, original_file, **options):
+    """Run every validator for one document and return their combined ValidationResult."""
+    result = ValidationResult()
+    for validator in create_validators(unpacked_dir, original_file, **options):
+        validator.validate()
+        result.extend(validator.result)
+    return result
+
+
+def read_manifest(manifest_path):
+    """Read (unpacked_dir, original) pairs from a JSON manifest.
+
+    Entries are {"unpacked_dir": ..., "original": ...} objects or two-item
+    lists; relative paths are resolved against the manifest's directory.
+    """
+    manifest_path = Path(manifest_path)
+    base = manifest_path.parent
+    with open(manifest_path, encoding="utf-8") as f:
+        entries = json.load(f)
+
+    pairs = []
+    for entry in entries:
+        if isinstance(entry, dict):
+            unpacked_dir, original = entry["unpacked_dir"], entry["original"]
+        else:
+            unpacked_dir, original = entry
+        pairs.append((base / unpacked_dir, base / original))
+    return pairs
+
+
+def glob_pairs(pattern):
+    """Pair every original file matching pattern with its same-named directory."""
+    pairs = []
+    for match in sorted(glob.glob(pattern, recursive=True)):
+        original = Path(match)
+        if original.suffix.lower() in SUPPORTED_EXTENSIONS:
+            pairs.append((original.with_suffix(""), original))
+    return pairs
+
+
+def validate_one(unpacked_dir, original_file, verbose=False, **options):
+    """Validate one document and return a report record for it.
+
+    The record lists every issue found (errors, warnings and info) as a
+    dict; "failed_checks" names the checks with errors and "notes" holds
+    their notes (such as the redlining word diff) by check name. A document
+    that cannot be validated at all gets a single "setup" error.
+    """
+    record = {"unpacked_dir": str(unpacked_dir), "original": str(original_file)}
+    start = time.perf_counter()
+    try:
+        _check_pair(Path(unpacked_dir), Path(original_file))
+        result = run_validators(
+            unpacked_dir, original_file, verbose=verbose, jobs=1, **options
+        )
+        issues = result.issues
+        failed_checks = result.failed_checks
+        notes = result.notes
+    except Exception as e:
+        # Assertions from _check_pair already read "Error: ..."
+        message = str(e).removeprefix("Error: ")
+        issues = [ValidationIssue("setup", message)]
+        failed_checks = ["setup"]
+        notes = {}
+    record["passed"] = not failed_checks
+    record["seconds"] = round(time.perf_counter() - start, 3)
+    record["failed_checks"] = failed_checks
+    record["issues"] = [asdict(issue) for issue in issues]
+    record["notes"] = notes
+    return record
+
+
+def _validate_pair(args):
+    unpacked_dir, original_file, verbose, options = args
+    return validate_one(unpacked_dir, original_file, verbose=verbose, **options)
+
+
+def validate_batch(pairs, jobs=1, verbose=False, **options):
+    """Validate many documents, yielding one report record each in input order.
+
+    With jobs != 1 the documents are spread over a process pool. Each worker
+    keeps its compiled schemas in the process-wide cache, so every schema is
+    compiled at most once per worker rather than once per document.
+    """
+    tasks = [(str(u), str(o), verbose, options) for u, o in pairs]
+    jobs = min(jobs or os.cpu_count() or 1, len(tasks))
+    if jobs <= 1:
+        yield from map(_validate_pair, tasks)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(_validate_pair, tasks)
+
+
+def run_batch(pairs, report_path=None, jobs=1, verbose=False, **options):
+    """Validate pairs, print one line per document and optionally write a report.
+
+    Returns:
+        bool: True if every document passed
+    """
+    ndjson = report_path is not None and report_path.endswith((".ndjson", ".jsonl"))
+    records = []
+    start = time.perf_counter()
+    with contextlib.ExitStack() as stack:
+        report = None
+        if report_path:
+            report = stack.enter_context(open(report_path, "w", encoding="utf-8"))
+
+        for record in validate_batch(pairs, jobs, verbose, **options):
+            status = "PASSED" if record["passed"] else "FAILED"
+            print(f"{status} - {record['unpacked_dir']} ({record['seconds']:.2f}s)")
+            if verbose:
+                for issue in record["issues"]:
+                    if issue["severity"] == "error":
+                        print(f"  {ValidationIssue(**issue).format()}")
+                for note in record["notes"].values():
+                    print(note)
+            if ndjson:
+                report.write(json.dumps(record) + "\n")
+                report.flush()
+            records.append(record)
+
+        failed = sum(not record["passed"] for record in records)
+        seconds = round(time.perf_counter() - start, 3)
+        if report is not None and not ndjson:
+            summary = {"documents": len(records), "failed": failed, "seconds": seconds}
+            json.dump({"summary": summary, "documents": records}, report, indent=2)
 
-    sys.exit(0 if success else 1)
+    print(f"{len(records) - failed}/{len(records)} documents passed in {seconds:.2f}s")
+    return failed == 0
 
 
 if __name__ == "__main__":
@@ -6,10 +6,15 @@ from .base import BaseSchemaValidator
 from .docx import DOCXSchemaValidator
 from .pptx import PPTXSchemaValidator
 from .redlining import RedliningValidator
+from .result import CheckResult, ValidationError, ValidationIssue, ValidationResult
 
 __all__ = [
     "BaseSchemaValidator",
+    "CheckResult",
     "DOCXSchemaValidator",
     "PPTXSchemaValidator",
     "RedliningValidator",
+    "ValidationError",
+    "ValidationIssue",
+    "ValidationResult",
 ]
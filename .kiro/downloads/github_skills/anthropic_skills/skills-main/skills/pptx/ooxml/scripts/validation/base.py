@@ -2,11 +2,237 @@
 Base validator with common validation logic for document files.
 """
 
+import copy
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import lxml.etree
 
+from .package import get_original_package
+from .result import WARNING, CheckResult, ValidationIssue, ValidationResult
+from .state import STATE_FILE_NAME, ValidationState, schema_fingerprint
+from .visitor import Rule, iter_streamed, run_rules
+
+# Placeholder tags like {{ name }} removed from text before XSD validation
+_TEMPLATE_TAG_PATTERN = re.compile(r"\{\{[^}]*\}\}")
+
+# Compiled XSD schemas shared by every validator in this process.
+# Maps the resolved schema path to its lxml.etree.XMLSchema, or to the
+# XMLSchemaParseError raised when the schema itself does not compile.
+_SCHEMA_CACHE = {}
+
+
+def load_schema(schema_path):
+    """Compile an XSD schema, or return the already compiled instance.
+
+    Compiled schemas cannot be pickled or written to disk, so the cache lives
+    for the lifetime of the process. Long-running callers (batch validation,
+    worker pools) should call preload_schemas() once to warm it up.
+
+    Args:
+        schema_path: Path to the .xsd file
+
+    Returns:
+        lxml.etree.XMLSchema: The compiled schema
+
+    Raises:
+        lxml.etree.XMLSchemaParseError: If the schema does not compile
+    """
+    key = str(Path(schema_path).resolve())
+    schema = _SCHEMA_CACHE.get(key)
+    if schema is None:
+        with open(key, "rb") as xsd_file:
+            parser = lxml.etree.XMLParser()
+            xsd_doc = lxml.etree.parse(xsd_file, parser=parser, base_url=key)
+        try:
+            schema = lxml.etree.XMLSchema(xsd_doc)
+        except lxml.etree.XMLSchemaParseError as e:
+            schema = e
+        _SCHEMA_CACHE[key] = schema
+    if isinstance(schema, Exception):
+        raise schema.with_traceback(None)
+    return schema
+
+
+# Validator instance owned by each XSD worker process
+_worker_validator = None
+
+
+def _init_xsd_worker(validator_class, unpacked_dir, original_file):
+    """Build the per-process validator and compile its schemas up front."""
+    global _worker_validator
+    _worker_validator = validator_class(unpacked_dir, original_file)
+    validator_class.preload_schemas()
+
+
+def _validate_file_in_worker(xml_file):
+    """Validate one file with this worker's validator."""
+    return _worker_validator.validate_file_against_xsd(xml_file)
+
+
+class UniqueIdRule(Rule):
+    """IDs listed in UNIQUE_ID_REQUIREMENTS must be unique per file or globally.
+
+    Elements inside mc:AlternateContent are ignored, since the Choice and
+    Fallback branches legitimately repeat the same IDs. Globally scoped IDs
+    are summarized per file and checked across files in finish().
+    """
+
+    name = "unique_ids"
+
+    def __init__(self, requirements, mc_namespace):
+        super().__init__()
+        self.requirements = requirements
+        self.alternate_content = f"{{{mc_namespace}}}AlternateContent"
+        self.scopes = (self.alternate_content,)
+        self.file_ids = {}
+        self.items = []
+
+    def start_file(self, context):
+        super().start_file(context)
+        self.file_ids = {}  # Track IDs that must be unique within this file
+        # Document-order list of ["error", line, message] and
+        # ["global", id_value, line, tag] entries
+        self.items = []
+
+    def start(self, elem, context):
+        if context.inside(self.alternate_content):
+            return
+
+        # Get the element name without namespace
+        tag = elem.tag.split("}")[-1].lower()
+
+        # Check if this element type has ID uniqueness requirements
+        if tag not in self.requirements:
+            return
+        attr_name, scope = self.requirements[tag]
+
+        # Look for the specified attribute
+        id_value = None
+        for attr, value in elem.attrib.items():
+            if attr.split("}")[-1].lower() == attr_name:
+                id_value = value
+                break
+        if id_value is None:
+            return
+
+        if scope == "global":
+            self.items.append(["global", id_value, elem.sourceline, tag])
+        elif scope == "file":
+            # Check file-level uniqueness
+            seen = self.file_ids.setdefault((tag, attr_name), {})
+            if id_value in seen:
+                self.items.append(
+                    [
+                        "error",
+                        elem.sourceline,
+                        f"Duplicate {attr_name}='{id_value}' in <{tag}> "
+                        f"(first occurrence at line {seen[id_value]})",
+                    ]
+                )
+            else:
+                seen[id_value] = elem.sourceline
+
+    def end_file(self, context):
+        return {"items": self.items}
+
+    def file_error(self, context, error):
+        return {"items": [["error", None, f"Error: {error}"]]}
+
+    def finish(self, summaries):
+        self.summaries = summaries
+        global_ids = {}  # Track globally unique IDs across all files
+        for part_name, summary in summaries.items():
+            for item in summary["items"]:
+                if item[0] == "error":
+                    self.issues.append(self.issue(part_name, item[1], item[2]))
+                    continue
+
+                # Check global uniqueness
+                _, id_value, line, tag = item
+                if id_value in global_ids:
+                    prev_file, prev_line, prev_tag = global_ids[id_value]
+                    self.issues.append(
+                        self.issue(
+                            part_name,
+                            line,
+                            f"Global ID '{id_value}' in <{tag}> already used in "
+                            f"{prev_file} at line {prev_line} in <{prev_tag}>",
+                        )
+                    )
+                else:
+                    global_ids[id_value] = (part_name, line, tag)
+
+
+class RelationshipsRule(Rule):
+    """Summarizes the Relationship entries of every .rels file.
+
+    Each summary is {"relationships": [[id, type, target, line], ...]}, or
+    {"error": message} if the file could not be read.
+    """
+
+    name = "relationships"
+
+    def __init__(self, relationships_namespace):
+        super().__init__()
+        self.tags = (f"{{{relationships_namespace}}}Relationship",)
+        self.relationships = []
+
+    def applies_to(self, xml_file):
+        return xml_file.name.endswith(".rels")
+
+    def start_file(self, context):
+        super().start_file(context)
+        self.relationships = []
+
+    def start(self, elem, context):
+        if elem.getparent() is None:
+            return  # Only descendants of the root are relationships
+        self.relationships.append(
+            [elem.get("Id"), elem.get("Type", ""), elem.get("Target"), elem.sourceline]
+        )
+
+    def end_file(self, context):
+        return {"relationships": self.relationships}
+
+    def file_error(self, context, error):
+        return {"error": str(error)}
+
+
+class RelationshipReferenceRule(Rule):
+    """Collects r:id attributes of every non-.rels part.
+
+    Each summary is {"references": [[line, element_name, rid], ...]}, or
+    {"error": message} if the file could not be read.
+    """
+
+    name = "relationship_references"
+
+    def __init__(self, office_relationships_namespace):
+        super().__init__()
+        self.rid_attr = f"{{{office_relationships_namespace}}}id"
+        self.references = []
+
+    def applies_to(self, xml_file):
+        return not xml_file.name.endswith(".rels")
+
+    def start_file(self, context):
+        super().start_file(context)
+        self.references = []
+
+    def start(self, elem, context):
+        rid = elem.get(self.rid_attr)
+        if rid:
+            self.references.append([elem.sourceline, elem.tag.split("}")[-1], rid])
+
+    def end_file(self, context):
+        return {"references": self.references}
+
+    def file_error(self, context, error):
+        return {"error": str(error)}
+
 
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
@@ -84,6 +310,10 @@ class BaseSchemaValidator:
     # Folders where we should clean ignorable namespaces
     MAIN_CONTENT_FOLDERS = {"word", "ppt", "xl"}
 
+    # Files larger than this are streamed with iterparse for the structural
+    # (non-XSD) checks instead of being kept in the tree cache
+    STREAMING_THRESHOLD = 64 * 1024 * 1024
+
     # All allowed OOXML namespaces (superset of all document types)
     OOXML_NAMESPACES = {
         "http://schemas.openxmlformats.org/officeDocument/2006/math",
@@ -103,10 +333,23 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file, verbose=False):
+    def __init__(
+        self,
+        unpacked_dir,
+        original_file,
+        verbose=False,
+        jobs=1,
+        incremental=False,
+        streaming=None,
+    ):
         self.unpacked_dir = Path(unpacked_dir).resolve()
         self.original_file = Path(original_file)
         self.verbose = verbose
+        # Worker processes for XSD validation (1 = serial, 0/None = all CPUs)
+        self.jobs = jobs
+        # Stream structural checks: True = always, False = never,
+        # None = only for files larger than STREAMING_THRESHOLD
+        self.streaming = streaming
 
         # Set schemas directory
         self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
@@ -117,176 +360,284 @@ class BaseSchemaValidator:
             f for pattern in patterns for f in self.unpacked_dir.rglob(pattern)
         ]
 
-        if not self.xml_files:
-            print(f"Warning: No XML files found in {self.unpacked_dir}")
+        # Checks recorded by the last validate() run
+        self.result = ValidationResult()
+
+        # Parsed trees shared by all checks: str(path) -> ((mtime_ns, size), tree)
+        self._tree_cache = {}
+
+        # Finished structural rules by name, with the file state they ran on
+        self._rule_results = None
+        self._rule_signature = None
+
+        # Per-part results persisted in the unpacked dir between runs
+        self._state = None
+        if incremental:
+            self._state = ValidationState(
+                self.unpacked_dir,
+                f"{type(self).__name__}:{schema_fingerprint(self.schemas_dir)}",
+            )
+            self._state.prune(self.xml_files)
+
+    @classmethod
+    def preload_schemas(cls):
+        """Compile every schema in SCHEMA_MAPPINGS into the process-wide cache."""
+        schemas_dir = Path(__file__).parent.parent.parent / "schemas"
+        for schema in sorted(set(cls.SCHEMA_MAPPINGS.values())):
+            try:
+                load_schema(schemas_dir / schema)
+            except lxml.etree.XMLSchemaParseError:
+                continue  # Reported per file when the schema is used
 
     def validate(self):
-        """Run all validation checks and return True if all pass."""
+        """Run all validation checks and return True if all pass.
+
+        The checks and their issues are left in self.result; nothing is
+        printed. Use self.result.render() for the command line output.
+        """
         raise NotImplementedError("Subclasses must implement the validate method")
 
+    def _record(self, name, issues, **messages):
+        """Add a finished check to self.result and return whether it passed.
+
+        Args:
+            name: Check name
+            issues: ValidationIssue objects found by the check
+            **messages: Rendering options of CheckResult (failure, success, ...)
+        """
+        return self.result.add(CheckResult(name, list(issues), **messages))
+
+    def _part_name(self, path):
+        """Return the part name (relative POSIX path) of a file in unpacked_dir."""
+        return Path(path).relative_to(self.unpacked_dir).as_posix()
+
+    def _parse_xml(self, xml_file):
+        """Parse an XML file, reusing the cached tree if the file is unchanged.
+
+        The returned tree is shared between all checks and must be treated as
+        read-only. Use _parse_xml_copy() for passes that modify the tree.
+        Streamed files are not cached, so their tree is freed after use.
+
+        Raises:
+            lxml.etree.XMLSyntaxError: If the file is not well-formed
+        """
+        key = str(xml_file)
+        stat = Path(xml_file).stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        cached = self._tree_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        tree = lxml.etree.parse(key)
+        if not self._should_stream(xml_file):
+            self._tree_cache[key] = (signature, tree)
+        return tree
+
+    def _should_stream(self, xml_file):
+        """Return True if structural checks should stream this file with iterparse."""
+        if self.streaming is not None:
+            return self.streaming
+        try:
+            return Path(xml_file).stat().st_size > self.STREAMING_THRESHOLD
+        except OSError:
+            return False
+
+    def _get_root(self, xml_file):
+        """Return the root element; its children are only loaded if not streaming.
+
+        Raises:
+            lxml.etree.XMLSyntaxError: If the start of the file is not well-formed
+        """
+        if not self._should_stream(xml_file):
+            return self._parse_xml(xml_file).getroot()
+        for _, elem in iter_streamed(xml_file, events=("start",)):
+            return elem
+
+    def _parse_xml_copy(self, xml_file):
+        """Return a private copy of the cached tree that may be modified."""
+        return copy.deepcopy(self._parse_xml(xml_file))
+
+    def _state_entry(self, xml_file):
+        """Return the stored results for a file, or None if not incremental."""
+        if self._state is None:
+            return None
+        return self._state.entry(xml_file)
+
+    def _cached_result(self, xml_file, key, compute):
+        """Return compute(xml_file), reusing the stored result if the file is unchanged."""
+        entry = self._state_entry(xml_file)
+        if entry is None:
+            return compute(xml_file)
+        if key not in entry:
+            entry[key] = compute(xml_file)
+            self._state.mark_dirty()
+        return entry[key]
+
+    def _save_state(self):
+        if self._state is not None:
+            self._state.save()
+
     def validate_xml(self):
         """Validate that all XML files are well-formed."""
-        errors = []
+        issues = []
+        if not self.xml_files:
+            issues.append(
+                ValidationIssue(
+                    "xml",
+                    f"No XML files found in {self.unpacked_dir}",
+                    severity=WARNING,
+                )
+            )
 
         for xml_file in self.xml_files:
-            try:
-                # Try to parse the XML file
-                lxml.etree.parse(str(xml_file))
-            except lxml.etree.XMLSyntaxError as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Line {e.lineno}: {e.msg}"
-                )
-            except Exception as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Unexpected error: {str(e)}"
+            error = self._cached_result(xml_file, "syntax", self._check_well_formed)
+            if error:
+                line, message = error
+                issues.append(
+                    ValidationIssue(
+                        "xml", message, file=self._part_name(xml_file), line=line
+                    )
                 )
+        self._save_state()
 
-        if errors:
-            print(f"FAILED - Found {len(errors)} XML violations:")
-            for error in errors:
-                print(error)
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - All XML files are well-formed")
-            return True
+        return self._record(
+            "xml",
+            issues,
+            failure="Found {count} XML violations:",
+            success="All XML files are well-formed",
+        )
+
+    def _check_well_formed(self, xml_file):
+        """Return None if the file parses, else [line, message] of the error."""
+        try:
+            # Try to parse the XML file
+            if self._should_stream(xml_file):
+                for _ in iter_streamed(xml_file):
+                    pass
+            else:
+                self._parse_xml(xml_file)
+        except lxml.etree.XMLSyntaxError as e:
+            return [e.lineno, e.msg]
+        except Exception as e:
+            return [None, f"Unexpected error: {str(e)}"]
+        return None
 
     def validate_namespaces(self):
         """Validate that namespace prefixes in Ignorable attributes are declared."""
-        errors = []
+        issues = []
 
         for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
+            undeclared = self._cached_result(
+                xml_file, "namespaces", self._find_undeclared_ignorable
+            )
+            issues.extend(
+                ValidationIssue(
+                    "namespaces",
+                    f"Namespace '{ns}' in Ignorable but not declared",
+                    file=self._part_name(xml_file),
+                )
+                for ns in undeclared
+            )
+        self._save_state()
 
-                for attr_val in [
-                    v for k, v in root.attrib.items() if k.endswith("Ignorable")
-                ]:
-                    undeclared = set(attr_val.split()) - declared
-                    errors.extend(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                        f"Namespace '{ns}' in Ignorable but not declared"
-                        for ns in undeclared
-                    )
-            except lxml.etree.XMLSyntaxError:
-                continue
+        return self._record(
+            "namespaces",
+            issues,
+            failure="{count} namespace issues:",
+            success="All namespace prefixes properly declared",
+        )
 
-        if errors:
-            print(f"FAILED - {len(errors)} namespace issues:")
-            for error in errors:
-                print(error)
-            return False
-        if self.verbose:
-            print("PASSED - All namespace prefixes properly declared")
-        return True
+    def _find_undeclared_ignorable(self, xml_file):
+        """Return prefixes listed in mc:Ignorable but not declared on the root."""
+        try:
+            root = self._get_root(xml_file)
+        except lxml.etree.XMLSyntaxError:
+            return []
+        declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
 
-    def validate_unique_ids(self):
-        """Validate that specific IDs are unique according to OOXML requirements."""
-        errors = []
-        global_ids = {}  # Track globally unique IDs across all files
+        undeclared = []
+        for attr_val in [v for k, v in root.attrib.items() if k.endswith("Ignorable")]:
+            undeclared.extend(set(attr_val.split()) - declared)
+        return undeclared
 
-        for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                file_ids = {}  # Track IDs that must be unique within this file
+    def _structural_rules(self):
+        """Return the rules evaluated by the shared single-pass walk.
 
-                # Remove all mc:AlternateContent elements from the tree
-                mc_elements = root.xpath(
-                    ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
-                )
-                for elem in mc_elements:
-                    elem.getparent().remove(elem)
-
-                # Now check IDs in the cleaned tree
-                for elem in root.iter():
-                    # Get the element name without namespace
-                    tag = (
-                        elem.tag.split("}")[-1].lower()
-                        if "}" in elem.tag
-                        else elem.tag.lower()
-                    )
+        Subclasses extend this list with their format-specific checks.
+        """
+        return [
+            UniqueIdRule(self.UNIQUE_ID_REQUIREMENTS, self.MC_NAMESPACE),
+            RelationshipsRule(self.PACKAGE_RELATIONSHIPS_NAMESPACE),
+            RelationshipReferenceRule(self.OFFICE_RELATIONSHIPS_NAMESPACE),
+        ]
 
-                    # Check if this element type has ID uniqueness requirements
-                    if tag in self.UNIQUE_ID_REQUIREMENTS:
-                        attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
-
-                        # Look for the specified attribute
-                        id_value = None
-                        for attr, value in elem.attrib.items():
-                            attr_local = (
-                                attr.split("}")[-1].lower()
-                                if "}" in attr
-                                else attr.lower()
-                            )
-                            if attr_local == attr_name:
-                                id_value = value
-                                break
-
-                        if id_value is not None:
-                            if scope == "global":
-                                # Check global uniqueness
-                                if id_value in global_ids:
-                                    prev_file, prev_line, prev_tag = global_ids[
-                                        id_value
-                                    ]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
-                                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
-                                    )
-                                else:
-                                    global_ids[id_value] = (
-                                        xml_file.relative_to(self.unpacked_dir),
-                                        elem.sourceline,
-                                        tag,
-                                    )
-                            elif scope == "file":
-                                # Check file-level uniqueness
-                                key = (tag, attr_name)
-                                if key not in file_ids:
-                                    file_ids[key] = {}
-
-                                if id_value in file_ids[key]:
-                                    prev_line = file_ids[key][id_value]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
-                                        f"(first occurrence at line {prev_line})"
-                                    )
-                                else:
-                                    file_ids[key][id_value] = elem.sourceline
+    def _get_rule(self, name):
+        """Return a finished structural rule, walking all files on first use.
 
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+        Every rule from _structural_rules() is evaluated in the same
+        traversal. The results are reused until any XML file changes. In
+        incremental mode only changed files are walked; the summaries of the
+        others come from the state file.
+        """
+        signature = []
+        for xml_file in self.xml_files:
+            try:
+                stat = xml_file.stat()
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append(None)
+
+        if self._rule_results is None or self._rule_signature != signature:
+            rules = self._structural_rules()
+            cached = None
+            if self._state is not None:
+
+                def cached(xml_file):
+                    return self._state_entry(xml_file).get("rules")
+
+            per_file = run_rules(
+                rules,
+                self.xml_files,
+                self.unpacked_dir,
+                self._parse_xml,
+                cached,
+                self._should_stream,
+            )
+            if self._state is not None:
+                for xml_file in self.xml_files:
+                    entry = self._state_entry(xml_file)
+                    if "rules" not in entry:
+                        part_name = xml_file.relative_to(self.unpacked_dir).as_posix()
+                        entry["rules"] = per_file[part_name]
+                        self._state.mark_dirty()
+                self._save_state()
+            self._rule_results = {rule.name: rule for rule in rules}
+            self._rule_signature = signature
+        return self._rule_results[name]
 
-        if errors:
-            print(f"FAILED - Found {len(errors)} ID uniqueness violations:")
-            for error in errors:
-                print(error)
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - All required IDs are unique")
-            return True
+    def validate_unique_ids(self):
+        """Validate that specific IDs are unique according to OOXML requirements."""
+        return self._record(
+            "unique_ids",
+            self._get_rule("unique_ids").issues,
+            failure="Found {count} ID uniqueness violations:",
+            success="All required IDs are unique",
+        )
 
     def validate_file_references(self):
         """
         Validate that all .rels files properly reference files and that all files are referenced.
         """
-        errors = []
+        issues = []
 
         # Find all .rels files
         rels_files = list(self.unpacked_dir.rglob("*.rels"))
 
         if not rels_files:
-            if self.verbose:
-                print("PASSED - No .rels files found")
-            return True
+            return self._record(
+                "file_references", issues, success="No .rels files found"
+            )
 
         # Get all files in the unpacked directory (excluding reference files)
         all_files = []
@@ -294,6 +645,7 @@ class BaseSchemaValidator:
             if (
                 file_path.is_file()
                 and file_path.name != "[Content_Types].xml"
+                and file_path.name != STATE_FILE_NAME
                 and not file_path.name.endswith(".rels")
             ):  # This file is not referenced by .rels
                 all_files.append(file_path.resolve())
@@ -301,16 +653,21 @@ class BaseSchemaValidator:
         # Track all files that are referenced by any .rels file
         all_referenced_files = set()
 
-        if self.verbose:
-            print(
-                f"Found {len(rels_files)} .rels files and {len(all_files)} target files"
-            )
+        details = [
+            f"Found {len(rels_files)} .rels files and {len(all_files)} target files"
+        ]
+
+        # Relationship entries of every .rels file, from the shared walk
+        relationships = self._get_rule("relationships").summaries
 
         # Check each .rels file
         for rels_file in rels_files:
             try:
-                # Parse relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                summary = relationships[
+                    rels_file.relative_to(self.unpacked_dir).as_posix()
+                ]
+                if "error" in summary:
+                    raise ValueError(summary["error"])
 
                 # Get the directory where this .rels file is located
                 rels_dir = rels_file.parent
@@ -319,11 +676,7 @@ class BaseSchemaValidator:
                 referenced_files = set()
                 broken_refs = []
 
-                for rel in rels_root.findall(
-                    ".//ns:Relationship",
-                    namespaces={"ns": self.PACKAGE_RELATIONSHIPS_NAMESPACE},
-                ):
-                    target = rel.get("Target")
+                for _, _, target, line in summary["relationships"]:
                     if target and not target.startswith(
                         ("http", "mailto:")
                     ):  # Skip external URLs
@@ -344,55 +697,63 @@ class BaseSchemaValidator:
                                 referenced_files.add(target_path)
                                 all_referenced_files.add(target_path)
                             else:
-                                broken_refs.append((target, rel.sourceline))
+                                broken_refs.append((target, line))
                         except (OSError, ValueError):
-                            broken_refs.append((target, rel.sourceline))
+                            broken_refs.append((target, line))
 
                 # Report broken references
-                if broken_refs:
-                    rel_path = rels_file.relative_to(self.unpacked_dir)
-                    for broken_ref, line_num in broken_refs:
-                        errors.append(
-                            f"  {rel_path}: Line {line_num}: Broken reference to {broken_ref}"
+                for broken_ref, line_num in broken_refs:
+                    issues.append(
+                        ValidationIssue(
+                            "file_references",
+                            f"Broken reference to {broken_ref}",
+                            file=self._part_name(rels_file),
+                            line=line_num,
                         )
+                    )
 
             except Exception as e:
-                rel_path = rels_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error parsing {rel_path}: {e}")
+                issues.append(
+                    ValidationIssue(
+                        "file_references",
+                        f"Error parsing: {e}",
+                        file=self._part_name(rels_file),
+                    )
+                )
 
         # Check for unreferenced files (files that exist but are not referenced anywhere)
         unreferenced_files = set(all_files) - all_referenced_files
 
-        if unreferenced_files:
-            for unref_file in sorted(unreferenced_files):
-                unref_rel_path = unref_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Unreferenced file: {unref_rel_path}")
-
-        if errors:
-            print(f"FAILED - Found {len(errors)} relationship validation errors:")
-            for error in errors:
-                print(error)
-            print(
-                "CRITICAL: These errors will cause the document to appear corrupt. "
-                + "Broken references MUST be fixed, "
-                + "and unreferenced files MUST be referenced or removed."
-            )
-            return False
-        else:
-            if self.verbose:
-                print(
-                    "PASSED - All references are valid and all files are properly referenced"
+        for unref_file in sorted(unreferenced_files):
+            issues.append(
+                ValidationIssue(
+                    "file_references",
+                    "Unreferenced file",
+                    file=self._part_name(unref_file),
                 )
-            return True
+            )
+
+        return self._record(
+            "file_references",
+            issues,
+            failure="Found {count} relationship validation errors:",
+            success="All references are valid and all files are properly referenced",
+            note="CRITICAL: These errors will cause the document to appear corrupt. "
+            "Broken references MUST be fixed, "
+            "and unreferenced files MUST be referenced or removed.",
+            details=details,
+        )
 
     def validate_all_relationship_ids(self):
         """
         Validate that all r:id attributes in XML files reference existing IDs
         in their corresponding .rels files, and optionally validate relationship types.
         """
-        import lxml.etree
+        issues = []
 
-        errors = []
+        # Relationships and r:id references of every file, from the shared walk
+        relationships = self._get_rule("relationships").summaries
+        references = self._get_rule("relationship_references").summaries
 
         # Process each XML file that might contain r:id references
         for xml_file in self.xml_files:
@@ -406,26 +767,31 @@ class BaseSchemaValidator:
             rels_file = rels_dir / f"{xml_file.name}.rels"
 
             # Skip if there's no corresponding .rels file (that's okay)
-            if not rels_file.exists():
+            rels_summary = relationships.get(
+                rels_file.relative_to(self.unpacked_dir).as_posix()
+            )
+            if rels_summary is None:
                 continue
 
+            xml_rel_path = xml_file.relative_to(self.unpacked_dir)
             try:
-                # Parse the .rels file to get valid relationship IDs and their types
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-                rid_to_type = {}
+                if "error" in rels_summary:
+                    raise ValueError(rels_summary["error"])
 
-                for rel in rels_root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rid = rel.get("Id")
-                    rel_type = rel.get("Type", "")
+                # Collect valid relationship IDs and their types
+                rid_to_type = {}
+                for rid, rel_type, _, line in rels_summary["relationships"]:
                     if rid:
                         # Check for duplicate rIds
                         if rid in rid_to_type:
-                            rels_rel_path = rels_file.relative_to(self.unpacked_dir)
-                            errors.append(
-                                f"  {rels_rel_path}: Line {rel.sourceline}: "
-                                f"Duplicate relationship ID '{rid}' (IDs must be unique)"
+                            issues.append(
+                                ValidationIssue(
+                                    "relationship_ids",
+                                    f"Duplicate relationship ID '{rid}' "
+                                    "(IDs must be unique)",
+                                    file=self._part_name(rels_file),
+                                    line=line,
+                                )
                             )
                         # Extract just the type name from the full URL
                         type_name = (
@@ -433,55 +799,56 @@ class BaseSchemaValidator:
                         )
                         rid_to_type[rid] = type_name
 
-                # Parse the XML file to find all r:id references
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all elements with r:id attributes
-                for elem in xml_root.iter():
-                    # Check for r:id attribute (relationship ID)
-                    rid_attr = elem.get(f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id")
-                    if rid_attr:
-                        xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                        elem_name = (
-                            elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
-                        )
-
-                        # Check if the ID exists
-                        if rid_attr not in rid_to_type:
-                            errors.append(
-                                f"  {xml_rel_path}: Line {elem.sourceline}: "
+                # All elements with r:id attributes in the XML file
+                xml_summary = references[xml_rel_path.as_posix()]
+                if "error" in xml_summary:
+                    raise ValueError(xml_summary["error"])
+
+                for line, elem_name, rid_attr in xml_summary["references"]:
+                    # Check if the ID exists
+                    if rid_attr not in rid_to_type:
+                        issues.append(
+                            ValidationIssue(
+                                "relationship_ids",
                                 f"<{elem_name}> references non-existent relationship '{rid_attr}' "
-                                f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})"
+                                f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})",
+                                file=xml_rel_path.as_posix(),
+                                line=line,
                             )
-                        # Check if we have type expectations for this element
-                        elif self.ELEMENT_RELATIONSHIP_TYPES:
-                            expected_type = self._get_expected_relationship_type(
-                                elem_name
-                            )
-                            if expected_type:
-                                actual_type = rid_to_type[rid_attr]
-                                # Check if the actual type matches or contains the expected type
-                                if expected_type not in actual_type.lower():
-                                    errors.append(
-                                        f"  {xml_rel_path}: Line {elem.sourceline}: "
+                        )
+                    # Check if we have type expectations for this element
+                    elif self.ELEMENT_RELATIONSHIP_TYPES:
+                        expected_type = self._get_expected_relationship_type(elem_name)
+                        if expected_type:
+                            actual_type = rid_to_type[rid_attr]
+                            # Check if the actual type matches or contains the expected type
+                            if expected_type not in actual_type.lower():
+                                issues.append(
+                                    ValidationIssue(
+                                        "relationship_ids",
                                         f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
-                                        f"but should point to a '{expected_type}' relationship"
+                                        f"but should point to a '{expected_type}' relationship",
+                                        file=xml_rel_path.as_posix(),
+                                        line=line,
                                     )
+                                )
 
             except Exception as e:
-                xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error processing {xml_rel_path}: {e}")
-
-        if errors:
-            print(f"FAILED - Found {len(errors)} relationship ID reference errors:")
-            for error in errors:
-                print(error)
-            print("\nThese ID mismatches will cause the document to appear corrupt!")
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - All relationship ID references are valid")
-            return True
+                issues.append(
+                    ValidationIssue(
+                        "relationship_ids",
+                        f"Error processing: {e}",
+                        file=xml_rel_path.as_posix(),
+                    )
+                )
+
+        return self._record(
+            "relationship_ids",
+            issues,
+            failure="Found {count} relationship ID reference errors:",
+            success="All relationship ID references are valid",
+            note="These ID mismatches will cause the document to appear corrupt!",
+        )
 
     def _get_expected_relationship_type(self, element_name):
         """
@@ -521,17 +888,22 @@ class BaseSchemaValidator:
 
     def validate_content_types(self):
         """Validate that all content files are properly declared in [Content_Types].xml."""
-        errors = []
+        issues = []
+        failure = "Found {count} content type declaration errors:"
 
         # Find [Content_Types].xml file
         content_types_file = self.unpacked_dir / "[Content_Types].xml"
         if not content_types_file.exists():
-            print("FAILED - [Content_Types].xml file not found")
-            return False
+            issues.append(
+                ValidationIssue(
+                    "content_types", "File not found", file="[Content_Types].xml"
+                )
+            )
+            return self._record("content_types", issues, failure=failure)
 
         try:
             # Parse and get all declared parts and extensions
-            root = lxml.etree.parse(str(content_types_file)).getroot()
+            root = self._parse_xml(content_types_file).getroot()
             declared_parts = set()
             declared_extensions = set()
 
@@ -592,17 +964,18 @@ class BaseSchemaValidator:
                 ):
                     continue
 
-                try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
-                    root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
+                root_name = self._cached_result(xml_file, "root", self._root_name)
+                if root_name is None:
+                    continue  # Skip unparseable files
 
-                    if root_name in declarable_roots and path_str not in declared_parts:
-                        errors.append(
-                            f"  {path_str}: File with <{root_name}> root not declared in [Content_Types].xml"
+                if root_name in declarable_roots and path_str not in declared_parts:
+                    issues.append(
+                        ValidationIssue(
+                            "content_types",
+                            f"File with <{root_name}> root not declared in [Content_Types].xml",
+                            file=path_str,
                         )
-
-                except Exception:
-                    continue  # Skip unparseable files
+                    )
 
             # Check all non-XML files for Default extension declarations
             for file_path in all_files:
@@ -618,32 +991,43 @@ class BaseSchemaValidator:
                 if extension and extension not in declared_extensions:
                     # Check if it's a known media extension that should be declared
                     if extension in media_extensions:
-                        relative_path = file_path.relative_to(self.unpacked_dir)
-                        errors.append(
-                            f'  {relative_path}: File with extension \'{extension}\' not declared in [Content_Types].xml - should add: <Default Extension="{extension}" ContentType="{media_extensions[extension]}"/>'
+                        issues.append(
+                            ValidationIssue(
+                                "content_types",
+                                f"File with extension '{extension}' not declared in [Content_Types].xml - should add: "
+                                f'<Default Extension="{extension}" ContentType="{media_extensions[extension]}"/>',
+                                file=self._part_name(file_path),
+                            )
                         )
 
         except Exception as e:
-            errors.append(f"  Error parsing [Content_Types].xml: {e}")
-
-        if errors:
-            print(f"FAILED - Found {len(errors)} content type declaration errors:")
-            for error in errors:
-                print(error)
-            return False
-        else:
-            if self.verbose:
-                print(
-                    "PASSED - All content files are properly declared in [Content_Types].xml"
+            issues.append(
+                ValidationIssue(
+                    "content_types", f"Error parsing: {e}", file="[Content_Types].xml"
                 )
-            return True
+            )
+        self._save_state()
+
+        return self._record(
+            "content_types",
+            issues,
+            failure=failure,
+            success="All content files are properly declared in [Content_Types].xml",
+        )
 
-    def validate_file_against_xsd(self, xml_file, verbose=False):
+    def _root_name(self, xml_file):
+        """Return the local name of a file's root element, or None if unparseable."""
+        try:
+            root_tag = self._get_root(xml_file).tag
+        except Exception:
+            return None
+        return root_tag.split("}")[-1] if "}" in root_tag else root_tag
+
+    def validate_file_against_xsd(self, xml_file):
         """Validate a single XML file against XSD schema, comparing with original.
 
         Args:
             xml_file: Path to XML file to validate
-            verbose: Enable verbose output
 
         Returns:
             tuple: (is_valid, new_errors_set) where is_valid is True/False/None (skipped)
@@ -670,34 +1054,22 @@ class BaseSchemaValidator:
         new_errors = current_errors - original_errors
 
         if new_errors:
-            if verbose:
-                relative_path = xml_file.relative_to(unpacked_dir)
-                print(f"FAILED - {relative_path}: {len(new_errors)} new error(s)")
-                for error in list(new_errors)[:3]:
-                    truncated = error[:250] + "..." if len(error) > 250 else error
-                    print(f"  - {truncated}")
             return False, new_errors
         else:
             # All errors existed in original
-            if verbose:
-                print(
-                    f"PASSED - No new errors (original had {len(current_errors)} errors)"
-                )
             return True, set()
 
     def validate_against_xsd(self):
         """Validate XML files against XSD schemas, showing only new errors compared to original."""
-        new_errors = []
+        issues = []
         original_error_count = 0
         valid_count = 0
         skipped_count = 0
+        new_error_count = 0
 
-        for xml_file in self.xml_files:
-            relative_path = str(xml_file.relative_to(self.unpacked_dir))
-            is_valid, new_file_errors = self.validate_file_against_xsd(
-                xml_file, verbose=False
-            )
-
+        for xml_file, (is_valid, new_file_errors) in zip(
+            self.xml_files, self._validate_files_against_xsd()
+        ):
             if is_valid is None:
                 skipped_count += 1
                 continue
@@ -711,32 +1083,107 @@ class BaseSchemaValidator:
                 continue
 
             # Has new errors
-            new_errors.append(f"  {relative_path}: {len(new_file_errors)} new error(s)")
-            for error in list(new_file_errors)[:3]:  # Show first 3 errors
-                new_errors.append(
-                    f"    - {error[:250]}..." if len(error) > 250 else f"    - {error}"
-                )
+            new_error_count += 1
+            part_name = self._part_name(xml_file)
+            issues.extend(
+                ValidationIssue("xsd", error, file=part_name)
+                for error in sorted(new_file_errors)
+            )
 
-        # Print summary
-        if self.verbose:
-            print(f"Validated {len(self.xml_files)} files:")
-            print(f"  - Valid: {valid_count}")
-            print(f"  - Skipped (no schema): {skipped_count}")
-            if original_error_count:
-                print(f"  - With original errors (ignored): {original_error_count}")
-            print(
-                f"  - With NEW errors: {len(new_errors) > 0 and len([e for e in new_errors if not e.startswith('    ')]) or 0}"
+        # Summary shown in verbose mode
+        details = [
+            f"Validated {len(self.xml_files)} files:",
+            f"  - Valid: {valid_count}",
+            f"  - Skipped (no schema): {skipped_count}",
+        ]
+        if original_error_count:
+            details.append(
+                f"  - With original errors (ignored): {original_error_count}"
             )
+        details.append(f"  - With NEW errors: {new_error_count}")
+
+        # Rendering shows the first 3 errors of each file
+        return self._record(
+            "xsd",
+            issues,
+            failure="Found NEW validation errors:",
+            success="No new XSD validation errors introduced",
+            details=details,
+            per_file_limit=3,
+        )
 
-        if new_errors:
-            print("\nFAILED - Found NEW validation errors:")
-            for error in new_errors:
-                print(error)
-            return False
-        else:
-            if self.verbose:
-                print("\nPASSED - No new XSD validation errors introduced")
-            return True
+    def _validate_files_against_xsd(self):
+        """Run validate_file_against_xsd over all XML files.
+
+        With jobs != 1 the files are spread over a process pool in which every
+        worker builds its own validator and compiles the schemas once. In
+        incremental mode, files whose content and original part are unchanged
+        reuse their stored result. Results are returned in self.xml_files
+        order either way.
+        """
+        results = {}
+        pending = []
+        for xml_file in self.xml_files:
+            cached = self._cached_xsd_result(xml_file)
+            if cached is None:
+                pending.append(xml_file)
+            else:
+                results[xml_file] = cached
+
+        for xml_file, result in zip(pending, self._run_xsd(pending)):
+            results[xml_file] = result
+            self._store_xsd_result(xml_file, result)
+        self._save_state()
+
+        return [results[xml_file] for xml_file in self.xml_files]
+
+    def _run_xsd(self, xml_files):
+        """Validate files against XSD, in a process pool if jobs != 1."""
+        jobs = self.jobs or os.cpu_count() or 1
+        jobs = min(jobs, len(xml_files))
+        if jobs <= 1:
+            return [self.validate_file_against_xsd(xml_file) for xml_file in xml_files]
+
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_xsd_worker,
+            initargs=(type(self), self.unpacked_dir, self.original_file),
+        ) as executor:
+            # Small chunks keep one huge slide or sheet from stalling a worker
+            chunksize = max(1, len(xml_files) // (jobs * 8))
+            return list(
+                executor.map(_validate_file_in_worker, xml_files, chunksize=chunksize)
+            )
+
+    def _original_fingerprint(self, xml_file):
+        """Identify the original version of a part, for keying stored XSD results."""
+        part_name = xml_file.relative_to(self.unpacked_dir).as_posix()
+        try:
+            return self.original_package.fingerprint(part_name)
+        except Exception:
+            return None
+
+    def _cached_xsd_result(self, xml_file):
+        """Return the stored (is_valid, new_errors) for an unchanged file, or None."""
+        entry = self._state_entry(xml_file)
+        if entry is None or "xsd" not in entry:
+            return None
+        original, is_valid, new_errors = entry["xsd"]
+        if original != self._original_fingerprint(xml_file):
+            return None
+        return is_valid, set(new_errors)
+
+    def _store_xsd_result(self, xml_file, result):
+        entry = self._state_entry(xml_file)
+        if entry is None:
+            return
+        is_valid, new_errors = result
+        entry["xsd"] = [
+            self._original_fingerprint(xml_file),
+            is_valid,
+            sorted(new_errors),
+        ]
+        self._state.mark_dirty()
 
     def _get_schema_path(self, xml_file):
         """Determine the appropriate schema path for an XML file."""
@@ -762,64 +1209,61 @@ class BaseSchemaValidator:
 
         return None
 
-    def _clean_ignorable_namespaces(self, xml_doc):
-        """Remove attributes and elements not in allowed namespaces."""
-        # Create a clean copy
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
+    def _preprocess_for_xsd(self, xml_doc, clean_namespaces):
+        """Return a copy of xml_doc prepared for XSD validation.
 
-        # Remove attributes not in allowed namespaces
-        for elem in xml_copy.iter():
-            attrs_to_remove = []
+        Works on a single deep copy in one traversal:
+        - Template tags ({{ ... }}) are removed from text and tails of all
+          elements except w:t, so placeholders don't fail validation
+        - The mc:Ignorable attribute is removed from the root
+        - If clean_namespaces is set, attributes and elements outside
+          OOXML_NAMESPACES are dropped (a dropped element takes its tail)
 
-            for attr in elem.attrib:
-                # Check if attribute is from a namespace other than allowed ones
-                if "{" in attr:
-                    ns = attr.split("}")[0][1:]
-                    if ns not in self.OOXML_NAMESPACES:
-                        attrs_to_remove.append(attr)
-
-            # Remove collected attributes
-            for attr in attrs_to_remove:
-                del elem.attrib[attr]
-
-        # Remove elements not in allowed namespaces
-        self._remove_ignorable_elements(xml_copy)
+        The input tree is not modified.
+        """
+        xml_doc = copy.deepcopy(xml_doc)
+        root = xml_doc.getroot()
 
-        return lxml.etree.ElementTree(xml_copy)
+        # Remove mc:Ignorable attribute from root
+        root.attrib.pop(f"{{{self.MC_NAMESPACE}}}Ignorable", None)
 
-    def _remove_ignorable_elements(self, root):
-        """Recursively remove all elements not in allowed namespaces."""
         elements_to_remove = []
-
-        # Find elements to remove
-        for elem in list(root):
-            # Skip non-element nodes (comments, processing instructions, etc.)
-            if not hasattr(elem, "tag") or callable(elem.tag):
-                continue
-
-            tag_str = str(elem.tag)
-            if tag_str.startswith("{"):
-                ns = tag_str.split("}")[0][1:]
-                if ns not in self.OOXML_NAMESPACES:
+        walker = lxml.etree.iterwalk(root, events=("start",))
+        for _, elem in walker:
+            tag = elem.tag
+            if tag.startswith("{"):
+                ns, _, local = tag[1:].partition("}")
+            else:
+                ns, local = None, tag
+
+            if clean_namespaces:
+                # The root itself is never removed
+                if (
+                    ns is not None
+                    and ns not in self.OOXML_NAMESPACES
+                    and elem is not root
+                ):
                     elements_to_remove.append(elem)
+                    walker.skip_subtree()
                     continue
 
-            # Recursively clean child elements
-            self._remove_ignorable_elements(elem)
-
-        # Remove collected elements
-        for elem in elements_to_remove:
-            root.remove(elem)
+                for attr in [
+                    attr
+                    for attr in elem.attrib
+                    if attr.startswith("{")
+                    and attr[1:].partition("}")[0] not in self.OOXML_NAMESPACES
+                ]:
+                    del elem.attrib[attr]
 
-    def _preprocess_for_mc_ignorable(self, xml_doc):
-        """Preprocess XML to handle mc:Ignorable attribute properly."""
-        # Remove mc:Ignorable attributes before validation
-        root = xml_doc.getroot()
+            # Text inside w:t is content and keeps its template tags
+            if local != "t":
+                if elem.text and "{{" in elem.text:
+                    elem.text = _TEMPLATE_TAG_PATTERN.sub("", elem.text) or None
+                if elem.tail and "{{" in elem.tail:
+                    elem.tail = _TEMPLATE_TAG_PATTERN.sub("", elem.tail) or None
 
-        # Remove mc:Ignorable attribute from root
-        if f"{{{self.MC_NAMESPACE}}}Ignorable" in root.attrib:
-            del root.attrib[f"{{{self.MC_NAMESPACE}}}Ignorable"]
+        for elem in elements_to_remove:
+            elem.getparent().remove(elem)
 
         return xml_doc
 
@@ -830,28 +1274,28 @@ class BaseSchemaValidator:
             return None, None  # Skip file
 
         try:
-            # Load schema
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
-
-            # Load and preprocess XML
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
-
-            xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
-            xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
+            # Load XML from the shared tree cache (preprocessing works on copies)
+            xml_doc = self._parse_xml(xml_file)
+            return self._validate_tree_xsd(
+                xml_doc, schema_path, xml_file.relative_to(base_path)
+            )
+        except Exception as e:
+            return False, {str(e)}
 
-            # Clean ignorable namespaces if needed
-            relative_path = xml_file.relative_to(base_path)
-            if (
-                relative_path.parts
-                and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
-            ):
-                xml_doc = self._clean_ignorable_namespaces(xml_doc)
+    def _validate_tree_xsd(self, xml_doc, schema_path, relative_path):
+        """Validate a parsed tree against an XSD schema. Returns (is_valid, errors_set)."""
+        try:
+            # Load schema (compiled once per process)
+            schema = load_schema(schema_path)
+
+            # Clean ignorable namespaces only in the main content folders
+            xml_doc = self._preprocess_for_xsd(
+                xml_doc,
+                clean_namespaces=bool(
+                    relative_path.parts
+                    and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
+                ),
+            )
 
             # Validate
             if schema.validate(xml_doc):
@@ -866,85 +1310,53 @@ class BaseSchemaValidator:
         except Exception as e:
             return False, {str(e)}
 
+    @property
+    def original_package(self):
+        """In-memory view of the original file, shared by validators in this process."""
+        return get_original_package(self.original_file)
+
     def _get_original_file_errors(self, xml_file):
         """Get XSD validation errors from a single file in the original document.
 
+        Parts are read straight from the original zip and their error sets are
+        memoized on the shared OriginalPackage.
+
         Args:
             xml_file: Path to the XML file in unpacked_dir to check
 
         Returns:
             set: Set of error messages from the original file
         """
-        import tempfile
-        import zipfile
-
         # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
         xml_file = Path(xml_file).resolve()
         unpacked_dir = self.unpacked_dir.resolve()
         relative_path = xml_file.relative_to(unpacked_dir)
+        part_name = relative_path.as_posix()
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Extract original file
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
-
-            # Find corresponding file in original
-            original_xml_file = temp_path / relative_path
-
-            if not original_xml_file.exists():
-                # File didn't exist in original, so no original errors
-                return set()
-
-            # Validate the specific file in original
-            is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
+        package = self.original_package
+        if part_name not in package.xsd_errors:
+            package.xsd_errors[part_name] = self._validate_original_part_xsd(
+                package, relative_path
             )
-            return errors if errors else set()
-
-    def _remove_template_tags_from_text_nodes(self, xml_doc):
-        """Remove template tags from XML text nodes and collect warnings.
+        return package.xsd_errors[part_name]
 
-        Template tags follow the pattern {{ ... }} and are used as placeholders
-        for content replacement. They should be removed from text content before
-        XSD validation while preserving XML structure.
+    def _validate_original_part_xsd(self, package, relative_path):
+        """Validate one part of the original package. Returns its set of XSD errors."""
+        if relative_path.as_posix() not in package.names():
+            # File didn't exist in original, so no original errors
+            return set()
 
-        Returns:
-            tuple: (cleaned_xml_doc, warnings_list)
-        """
-        warnings = []
-        template_pattern = re.compile(r"\{\{[^}]*\}\}")
-
-        # Create a copy of the document to avoid modifying the original
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
-
-        def process_text_content(text, content_type):
-            if not text:
-                return text
-            matches = list(template_pattern.finditer(text))
-            if matches:
-                for match in matches:
-                    warnings.append(
-                        f"Found template tag in {content_type}: {match.group()}"
-                    )
-                return template_pattern.sub("", text)
-            return text
-
-        # Process all text nodes in the document
-        for elem in xml_copy.iter():
-            # Skip processing if this is a w:t element
-            if not hasattr(elem, "tag") or callable(elem.tag):
-                continue
-            tag_str = str(elem.tag)
-            if tag_str.endswith("}t") or tag_str == "t":
-                continue
+        schema_path = self._get_schema_path(relative_path)
+        if not schema_path:
+            return set()
 
-            elem.text = process_text_content(elem.text, "text content")
-            elem.tail = process_text_content(elem.tail, "tail content")
+        try:
+            xml_doc = package.parse(relative_path.as_posix())
+        except Exception as e:
+            return {str(e)}
 
-        return lxml.etree.ElementTree(xml_copy), warnings
+        is_valid, errors = self._validate_tree_xsd(xml_doc, schema_path, relative_path)
+        return errors if errors else set()
 
 
 if __name__ == "__main__":
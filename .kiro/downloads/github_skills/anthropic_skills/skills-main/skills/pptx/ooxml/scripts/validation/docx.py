@@ -3,26 +3,150 @@ Validator for Word document XML files against XSD schemas.
 """
 
 import re
-import tempfile
-import zipfile
-
-import lxml.etree
 
 from .base import BaseSchemaValidator
+from .result import INFO, WARNING, ValidationIssue, ValidationResult
+from .visitor import Rule
+
+WORD_2006_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+
+W_T = f"{{{WORD_2006_NAMESPACE}}}t"
+W_P = f"{{{WORD_2006_NAMESPACE}}}p"
+W_DEL = f"{{{WORD_2006_NAMESPACE}}}del"
+W_INS = f"{{{WORD_2006_NAMESPACE}}}ins"
+W_DEL_TEXT = f"{{{WORD_2006_NAMESPACE}}}delText"
+
+
+def _text_preview(text):
+    """Show a preview of element text for error messages."""
+    return repr(text)[:50] + "..." if len(repr(text)) > 50 else repr(text)
+
+
+class DocumentXmlRule(Rule):
+    """Base for rules that only check document.xml files."""
+
+    def applies_to(self, xml_file):
+        return xml_file.name == "document.xml"
+
+
+class WhitespacePreservationRule(DocumentXmlRule):
+    """w:t elements with leading/trailing whitespace need xml:space='preserve'."""
+
+    name = "whitespace_preservation"
+    tags = (W_T,)
+    needs_text = True
+
+    def start(self, elem, context):
+        text = elem.text
+        if not text:
+            return
+        # Check if text starts or ends with whitespace
+        if re.match(r"^\s.*", text) or re.match(r".*\s$", text):
+            # Check if xml:space="preserve" attribute exists
+            if elem.get(f"{{{XML_NAMESPACE}}}space") != "preserve":
+                self.report(
+                    context,
+                    elem,
+                    "w:t element with whitespace missing xml:space='preserve': "
+                    f"{_text_preview(text)}",
+                )
+
+
+class DeletionRule(DocumentXmlRule):
+    """w:t elements must not appear inside w:del (XSD does not catch this)."""
+
+    name = "deletions"
+    tags = (W_T,)
+    scopes = (W_DEL,)
+    needs_text = True
+
+    def start(self, elem, context):
+        if elem.text and context.inside(W_DEL):
+            self.report(
+                context,
+                elem,
+                f"<w:t> found within <w:del>: {_text_preview(elem.text)}",
+            )
+
+
+class InsertionRule(DocumentXmlRule):
+    """w:delText is only allowed inside w:ins when nested within a w:del."""
+
+    name = "insertions"
+    tags = (W_DEL_TEXT,)
+    scopes = (W_INS, W_DEL)
+    needs_text = True
+
+    def start(self, elem, context):
+        if context.inside(W_INS) and not context.inside(W_DEL):
+            self.report(
+                context,
+                elem,
+                f"<w:delText> within <w:ins>: {_text_preview(elem.text or '')}",
+            )
+
+
+class ParagraphCountRule(DocumentXmlRule):
+    """Counts w:p elements; the last document.xml walked wins."""
+
+    name = "paragraph_count"
+    tags = (W_P,)
+
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+        self._file_count = 0
+
+    def start_file(self, context):
+        super().start_file(context)
+        self._file_count = 0
+
+    def start(self, elem, context):
+        # The root element itself is not a paragraph, even if it were a w:p
+        if elem.getparent() is not None:
+            self._file_count += 1
+
+    def end_file(self, context):
+        return {"count": self._file_count}
+
+    def file_error(self, context, error):
+        return {"error": str(error)}
+
+    def finish(self, summaries):
+        self.summaries = summaries
+        for part_name, summary in summaries.items():
+            if "error" in summary:
+                self.issues.append(
+                    ValidationIssue(
+                        self.name,
+                        "Error counting paragraphs in unpacked document: "
+                        f"{summary['error']}",
+                        file=part_name,
+                        severity=WARNING,
+                    )
+                )
+            else:
+                self.count = summary["count"]
 
 
 class DOCXSchemaValidator(BaseSchemaValidator):
     """Validator for Word document XML files against XSD schemas."""
 
     # Word-specific namespace
-    WORD_2006_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+    WORD_2006_NAMESPACE = WORD_2006_NAMESPACE
 
     # Word-specific element to relationship type mappings
     # Start with empty mapping - add specific cases as we discover them
     ELEMENT_RELATIONSHIP_TYPES = {}
 
     def validate(self):
-        """Run all validation checks and return True if all pass."""
+        """Run all validation checks and return True if all pass.
+
+        The checks and their issues are left in self.result.
+        """
+        self.result = ValidationResult()
+
         # Test 0: XML well-formedness
         if not self.validate_xml():
             return False
@@ -69,205 +193,92 @@ class DOCXSchemaValidator(BaseSchemaValidator):
 
         return all_valid
 
+    def _structural_rules(self):
+        return super()._structural_rules() + [
+            WhitespacePreservationRule(),
+            DeletionRule(),
+            InsertionRule(),
+            ParagraphCountRule(),
+        ]
+
     def validate_whitespace_preservation(self):
         """
         Validate that w:t elements with whitespace have xml:space='preserve'.
         """
-        errors = []
-
-        for xml_file in self.xml_files:
-            # Only check document.xml files
-            if xml_file.name != "document.xml":
-                continue
-
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all w:t elements
-                for elem in root.iter(f"{{{self.WORD_2006_NAMESPACE}}}t"):
-                    if elem.text:
-                        text = elem.text
-                        # Check if text starts or ends with whitespace
-                        if re.match(r"^\s.*", text) or re.match(r".*\s$", text):
-                            # Check if xml:space="preserve" attribute exists
-                            xml_space_attr = f"{{{self.XML_NAMESPACE}}}space"
-                            if (
-                                xml_space_attr not in elem.attrib
-                                or elem.attrib[xml_space_attr] != "preserve"
-                            ):
-                                # Show a preview of the text
-                                text_preview = (
-                                    repr(text)[:50] + "..."
-                                    if len(repr(text)) > 50
-                                    else repr(text)
-                                )
-                                errors.append(
-                                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                    f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {text_preview}"
-                                )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
-
-        if errors:
-            print(f"FAILED - Found {len(errors)} whitespace preservation violations:")
-            for error in errors:
-                print(error)
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - All whitespace is properly preserved")
-            return True
+        return self._record(
+            "whitespace_preservation",
+            self._get_rule("whitespace_preservation").issues,
+            failure="Found {count} whitespace preservation violations:",
+            success="All whitespace is properly preserved",
+        )
 
     def validate_deletions(self):
         """
         Validate that w:t elements are not within w:del elements.
         For some reason, XSD validation does not catch this, so we do it manually.
         """
-        errors = []
-
-        for xml_file in self.xml_files:
-            # Only check document.xml files
-            if xml_file.name != "document.xml":
-                continue
-
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all w:t elements that are descendants of w:del elements
-                namespaces = {"w": self.WORD_2006_NAMESPACE}
-                xpath_expression = ".//w:del//w:t"
-                problematic_t_elements = root.xpath(
-                    xpath_expression, namespaces=namespaces
-                )
-                for t_elem in problematic_t_elements:
-                    if t_elem.text:
-                        # Show a preview of the text
-                        text_preview = (
-                            repr(t_elem.text)[:50] + "..."
-                            if len(repr(t_elem.text)) > 50
-                            else repr(t_elem.text)
-                        )
-                        errors.append(
-                            f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                            f"Line {t_elem.sourceline}: <w:t> found within <w:del>: {text_preview}"
-                        )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
-
-        if errors:
-            print(f"FAILED - Found {len(errors)} deletion validation violations:")
-            for error in errors:
-                print(error)
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - No w:t elements found within w:del elements")
-            return True
+        return self._record(
+            "deletions",
+            self._get_rule("deletions").issues,
+            failure="Found {count} deletion validation violations:",
+            success="No w:t elements found within w:del elements",
+        )
 
     def count_paragraphs_in_unpacked(self):
         """Count the number of paragraphs in the unpacked document."""
-        count = 0
-
-        for xml_file in self.xml_files:
-            # Only check document.xml files
-            if xml_file.name != "document.xml":
-                continue
-
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
-            except Exception as e:
-                print(f"Error counting paragraphs in unpacked document: {e}")
-
-        return count
+        return self._get_rule("paragraph_count").count
 
     def count_paragraphs_in_original(self):
-        """Count the number of paragraphs in the original docx file."""
-        count = 0
+        """Count the number of paragraphs in the original docx file.
 
-        try:
-            # Create temporary directory to unpack original
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Unpack original docx
-                with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                    zip_ref.extractall(temp_dir)
-
-                # Parse document.xml
-                doc_xml_path = temp_dir + "/word/document.xml"
-                root = lxml.etree.parse(doc_xml_path).getroot()
-
-                # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
-
-        except Exception as e:
-            print(f"Error counting paragraphs in original document: {e}")
+        Raises:
+            Exception: If document.xml cannot be read from the original file
+        """
+        # Parse document.xml straight from the original package
+        root = self.original_package.parse("word/document.xml").getroot()
 
-        return count
+        # Count all w:p elements
+        return len(root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p"))
 
     def validate_insertions(self):
         """
         Validate that w:delText elements are not within w:ins elements.
         w:delText is only allowed in w:ins if nested within a w:del.
         """
-        errors = []
-
-        for xml_file in self.xml_files:
-            if xml_file.name != "document.xml":
-                continue
-
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                namespaces = {"w": self.WORD_2006_NAMESPACE}
-
-                # Find w:delText in w:ins that are NOT within w:del
-                invalid_elements = root.xpath(
-                    ".//w:ins//w:delText[not(ancestor::w:del)]",
-                    namespaces=namespaces
-                )
-
-                for elem in invalid_elements:
-                    text_preview = (
-                        repr(elem.text or "")[:50] + "..."
-                        if len(repr(elem.text or "")) > 50
-                        else repr(elem.text or "")
-                    )
-                    errors.append(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                        f"Line {elem.sourceline}: <w:delText> within <w:ins>: {text_preview}"
-                    )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
-
-        if errors:
-            print(f"FAILED - Found {len(errors)} insertion validation violations:")
-            for error in errors:
-                print(error)
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - No w:delText elements within w:ins elements")
-            return True
+        return self._record(
+            "insertions",
+            self._get_rule("insertions").issues,
+            failure="Found {count} insertion validation violations:",
+            success="No w:delText elements within w:ins elements",
+        )
 
     def compare_paragraph_counts(self):
-        """Compare paragraph counts between original and new document."""
-        original_count = self.count_paragraphs_in_original()
-        new_count = self.count_paragraphs_in_unpacked()
+        """Record paragraph counts of the original and new document as info."""
+        rule = self._get_rule("paragraph_count")
+        issues = list(rule.issues)
+        try:
+            original_count = self.count_paragraphs_in_original()
+        except Exception as e:
+            original_count = 0
+            issues.append(
+                ValidationIssue(
+                    rule.name,
+                    f"Error counting paragraphs in original document: {e}",
+                    severity=WARNING,
+                )
+            )
+        new_count = rule.count
 
         diff = new_count - original_count
         diff_str = f"+{diff}" if diff > 0 else str(diff)
-        print(f"\nParagraphs: {original_count} → {new_count} ({diff_str})")
+        issues.append(
+            ValidationIssue(
+                rule.name,
+                f"Paragraphs: {original_count} → {new_count} ({diff_str})",
+                severity=INFO,
+            )
+        )
+        self._record(rule.name, issues)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,93 @@
+"""
+Read-only view of the original Office file used as the validation baseline.
+"""
+
+import functools
+import zipfile
+from pathlib import Path
+
+import lxml.etree
+
+
+class OriginalPackage:
+    """Lazily reads parts of an original .docx/.pptx/.xlsx without extracting it.
+
+    Members are read from the zip archive on demand and kept in memory, so
+    comparing against the original never unpacks the whole package to disk.
+
+    Attributes:
+        path: Path to the original Office file
+        xsd_errors: Memoized XSD error sets per part, keyed by part name
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.xsd_errors = {}
+        self._names = None
+        self._infos = None
+        self._trees = {}
+
+    def names(self):
+        """Return the set of part names (e.g. 'word/document.xml') in the package."""
+        if self._names is None:
+            with zipfile.ZipFile(self.path, "r") as zip_ref:
+                self._names = set(zip_ref.namelist())
+        return self._names
+
+    def fingerprint(self, part_name):
+        """Return 'crc32:size' of a part from the zip directory, or None if absent.
+
+        Identifies the part's content without decompressing it.
+        """
+        part_name = str(part_name).replace("\\", "/")
+        if self._infos is None:
+            with zipfile.ZipFile(self.path, "r") as zip_ref:
+                self._infos = {info.filename: info for info in zip_ref.infolist()}
+        info = self._infos.get(part_name)
+        if info is None:
+            return None
+        return f"{info.CRC:08x}:{info.file_size}"
+
+    def read(self, part_name):
+        """Return the raw bytes of a part, or None if it is not in the package."""
+        part_name = str(part_name).replace("\\", "/")
+        if part_name not in self.names():
+            return None
+        with zipfile.ZipFile(self.path, "r") as zip_ref:
+            return zip_ref.read(part_name)
+
+    def parse(self, part_name):
+        """Parse a part and return its cached tree.
+
+        The tree is shared between callers and must be treated as read-only.
+
+        Raises:
+            KeyError: If the part is not in the package
+            lxml.etree.XMLSyntaxError: If the part is not well-formed
+        """
+        part_name = str(part_name).replace("\\", "/")
+        if part_name not in self._trees:
+            content = self.read(part_name)
+            if content is None:
+                raise KeyError(f"{part_name} not found in {self.path}")
+            self._trees[part_name] = lxml.etree.ElementTree(
+                lxml.etree.fromstring(content)
+            )
+        return self._trees[part_name]
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_package(path, mtime_ns, size):
+    return OriginalPackage(path)
+
+
+def get_original_package(path):
+    """Return the shared OriginalPackage for a file.
+
+    Validators running against the same original in one process share a
+    single instance, so each part is read and parsed at most once. The
+    instance is replaced if the file changes on disk.
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    return _cached_package(str(path), stat.st_mtime_ns, stat.st_size)
@@ -5,6 +5,40 @@ Validator for PowerPoint presentation XML files against XSD schemas.
 import re
 
 from .base import BaseSchemaValidator
+from .result import ValidationIssue, ValidationResult
+from .visitor import Rule
+
+# UUID pattern: 8-4-4-4-12 hex digits with optional braces/hyphens
+UUID_PATTERN = re.compile(
+    r"^[\{\(]?[0-9A-Fa-f]{8}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{12}[\}\)]?$"
+)
+
+
+def looks_like_uuid(value):
+    """Check if a value has the general structure of a UUID."""
+    # Remove common UUID delimiters
+    clean_value = value.strip("{}()").replace("-", "")
+    # Check if it's 32 hex-like characters (could include invalid hex chars)
+    return len(clean_value) == 32 and all(c.isalnum() for c in clean_value)
+
+
+class UuidIdRule(Rule):
+    """ID attributes that look like UUIDs must contain only hex values."""
+
+    name = "uuid_ids"
+
+    def start(self, elem, context):
+        for attr, value in elem.attrib.items():
+            # Check if this is an ID attribute
+            attr_name = attr.split("}")[-1].lower()
+            if attr_name.endswith("id"):
+                # Check if value looks like a UUID (has the right length and pattern structure)
+                if looks_like_uuid(value) and not UUID_PATTERN.match(value):
+                    self.report(
+                        context,
+                        elem,
+                        f"ID '{value}' appears to be a UUID but contains invalid hex characters",
+                    )
 
 
 class PPTXSchemaValidator(BaseSchemaValidator):
@@ -26,7 +60,12 @@ class PPTXSchemaValidator(BaseSchemaValidator):
     }
 
     def validate(self):
-        """Run all validation checks and return True if all pass."""
+        """Run all validation checks and return True if all pass.
+
+        The checks and their issues are left in self.result.
+        """
+        self.result = ValidationResult()
+
         # Test 0: XML well-formedness
         if not self.validate_xml():
             return False
@@ -74,88 +113,56 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
         return all_valid
 
+    def _structural_rules(self):
+        return super()._structural_rules() + [UuidIdRule()]
+
     def validate_uuid_ids(self):
         """Validate that ID attributes that look like UUIDs contain only hex values."""
-        import lxml.etree
-
-        errors = []
-        # UUID pattern: 8-4-4-4-12 hex digits with optional braces/hyphens
-        uuid_pattern = re.compile(
-            r"^[\{\(]?[0-9A-Fa-f]{8}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{12}[\}\)]?$"
+        return self._record(
+            "uuid_ids",
+            self._get_rule("uuid_ids").issues,
+            failure="Found {count} UUID ID validation errors:",
+            success="All UUID-like IDs contain valid hex values",
         )
 
-        for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Check all elements for ID attributes
-                for elem in root.iter():
-                    for attr, value in elem.attrib.items():
-                        # Check if this is an ID attribute
-                        attr_name = attr.split("}")[-1].lower()
-                        if attr_name == "id" or attr_name.endswith("id"):
-                            # Check if value looks like a UUID (has the right length and pattern structure)
-                            if self._looks_like_uuid(value):
-                                # Validate that it contains only hex characters in the right positions
-                                if not uuid_pattern.match(value):
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: ID '{value}' appears to be a UUID but contains invalid hex characters"
-                                    )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
-
-        if errors:
-            print(f"FAILED - Found {len(errors)} UUID ID validation errors:")
-            for error in errors:
-                print(error)
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - All UUID-like IDs contain valid hex values")
-            return True
-
     def _looks_like_uuid(self, value):
         """Check if a value has the general structure of a UUID."""
-        # Remove common UUID delimiters
-        clean_value = value.strip("{}()").replace("-", "")
-        # Check if it's 32 hex-like characters (could include invalid hex chars)
-        return len(clean_value) == 32 and all(c.isalnum() for c in clean_value)
+        return looks_like_uuid(value)
 
     def validate_slide_layout_ids(self):
         """Validate that sldLayoutId elements in slide masters reference valid slide layouts."""
         import lxml.etree
 
-        errors = []
+        issues = []
 
         # Find all slide master files
         slide_masters = list(self.unpacked_dir.glob("ppt/slideMasters/*.xml"))
 
         if not slide_masters:
-            if self.verbose:
-                print("PASSED - No slide masters found")
-            return True
+            return self._record(
+                "slide_layout_ids", issues, success="No slide masters found"
+            )
 
         for slide_master in slide_masters:
             try:
                 # Parse the slide master file
-                root = lxml.etree.parse(str(slide_master)).getroot()
+                root = self._parse_xml(slide_master).getroot()
 
                 # Find the corresponding _rels file for this slide master
                 rels_file = slide_master.parent / "_rels" / f"{slide_master.name}.rels"
 
                 if not rels_file.exists():
-                    errors.append(
-                        f"  {slide_master.relative_to(self.unpacked_dir)}: "
-                        f"Missing relationships file: {rels_file.relative_to(self.unpacked_dir)}"
+                    issues.append(
+                        ValidationIssue(
+                            "slide_layout_ids",
+                            f"Missing relationships file: {self._part_name(rels_file)}",
+                            file=self._part_name(slide_master),
+                        )
                     )
                     continue
 
                 # Parse the relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self._parse_xml(rels_file).getroot()
 
                 # Build a set of valid relationship IDs that point to slide layouts
                 valid_layout_rids = set()
@@ -176,40 +183,41 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                     layout_id = sld_layout_id.get("id")
 
                     if r_id and r_id not in valid_layout_rids:
-                        errors.append(
-                            f"  {slide_master.relative_to(self.unpacked_dir)}: "
-                            f"Line {sld_layout_id.sourceline}: sldLayoutId with id='{layout_id}' "
-                            f"references r:id='{r_id}' which is not found in slide layout relationships"
+                        issues.append(
+                            ValidationIssue(
+                                "slide_layout_ids",
+                                f"sldLayoutId with id='{layout_id}' references "
+                                f"r:id='{r_id}' which is not found in slide layout relationships",
+                                file=self._part_name(slide_master),
+                                line=sld_layout_id.sourceline,
+                            )
                         )
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {slide_master.relative_to(self.unpacked_dir)}: Error: {e}"
+                issues.append(
+                    ValidationIssue(
+                        "slide_layout_ids",
+                        f"Error: {e}",
+                        file=self._part_name(slide_master),
+                    )
                 )
 
-        if errors:
-            print(f"FAILED - Found {len(errors)} slide layout ID validation errors:")
-            for error in errors:
-                print(error)
-            print(
-                "Remove invalid references or add missing slide layouts to the relationships file."
-            )
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - All slide layout IDs reference valid slide layouts")
-            return True
+        return self._record(
+            "slide_layout_ids",
+            issues,
+            failure="Found {count} slide layout ID validation errors:",
+            success="All slide layout IDs reference valid slide layouts",
+            note="Remove invalid references or add missing slide layouts to the relationships file.",
+        )
 
     def validate_no_duplicate_slide_layouts(self):
         """Validate that each slide has exactly one slideLayout reference."""
-        import lxml.etree
-
-        errors = []
+        issues = []
         slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
 
         for rels_file in slide_rels_files:
             try:
-                root = lxml.etree.parse(str(rels_file)).getroot()
+                root = self._parse_xml(rels_file).getroot()
 
                 # Find all slideLayout relationships
                 layout_rels = [
@@ -221,44 +229,51 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                 ]
 
                 if len(layout_rels) > 1:
-                    errors.append(
-                        f"  {rels_file.relative_to(self.unpacked_dir)}: has {len(layout_rels)} slideLayout references"
+                    issues.append(
+                        ValidationIssue(
+                            "duplicate_slide_layouts",
+                            f"has {len(layout_rels)} slideLayout references",
+                            file=self._part_name(rels_file),
+                        )
                     )
 
             except Exception as e:
-                errors.append(
-                    f"  {rels_file.relative_to(self.unpacked_dir)}: Error: {e}"
+                issues.append(
+                    ValidationIssue(
+                        "duplicate_slide_layouts",
+                        f"Error: {e}",
+                        file=self._part_name(rels_file),
+                    )
                 )
 
-        if errors:
-            print("FAILED - Found slides with duplicate slideLayout references:")
-            for error in errors:
-                print(error)
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - All slides have exactly one slideLayout reference")
-            return True
+        return self._record(
+            "duplicate_slide_layouts",
+            issues,
+            failure="Found slides with duplicate slideLayout references:",
+            success="All slides have exactly one slideLayout reference",
+        )
 
     def validate_notes_slide_references(self):
         """Validate that each notesSlide file is referenced by only one slide."""
         import lxml.etree
 
-        errors = []
+        issues = []
         notes_slide_references = {}  # Track which slides reference each notesSlide
 
         # Find all slide relationship files
         slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
 
         if not slide_rels_files:
-            if self.verbose:
-                print("PASSED - No slide relationship files found")
-            return True
+            return self._record(
+                "notes_slide_references",
+                issues,
+                success="No slide relationship files found",
+            )
 
         for rels_file in slide_rels_files:
             try:
                 # Parse the relationships file
-                root = lxml.etree.parse(str(rels_file)).getroot()
+                root = self._parse_xml(rels_file).getroot()
 
                 # Find all notesSlide relationships
                 for rel in root.findall(
@@ -283,32 +298,35 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                             )
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {rels_file.relative_to(self.unpacked_dir)}: Error: {e}"
+                issues.append(
+                    ValidationIssue(
+                        "notes_slide_references",
+                        f"Error: {e}",
+                        file=self._part_name(rels_file),
+                    )
                 )
 
-        # Check for duplicate references
+        # Check for duplicate references, reported on each referencing slide
         for target, references in notes_slide_references.items():
             if len(references) > 1:
-                slide_names = [ref[0] for ref in references]
-                errors.append(
-                    f"  Notes slide '{target}' is referenced by multiple slides: {', '.join(slide_names)}"
+                slide_names = ", ".join(ref[0] for ref in references)
+                issues.extend(
+                    ValidationIssue(
+                        "notes_slide_references",
+                        f"Notes slide '{target}' is referenced by multiple slides: "
+                        f"{slide_names}",
+                        file=self._part_name(rels_file),
+                    )
+                    for _, rels_file in references
                 )
-                for slide_name, rels_file in references:
-                    errors.append(f"    - {rels_file.relative_to(self.unpacked_dir)}")
 
-        if errors:
-            print(
-                f"FAILED - Found {len([e for e in errors if not e.startswith('    ')])} notes slide reference validation errors:"
-            )
-            for error in errors:
-                print(error)
-            print("Each slide may optionally have its own slide file.")
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - All notes slide references are unique")
-            return True
+        return self._record(
+            "notes_slide_references",
+            issues,
+            failure="Found {count} notes slide reference validation errors:",
+            success="All notes slide references are unique",
+            note="Each slide may optionally have its own slide file.",
+        )
 
 
 if __name__ == "__main__":
@@ -4,9 +4,11 @@ Validator for tracked changes in Word documents.
 
 import subprocess
 import tempfile
-import zipfile
 from pathlib import Path
 
+from .package import get_original_package
+from .result import CheckResult, ValidationIssue, ValidationResult
+
 
 class RedliningValidator:
     """Validator for tracked changes in Word documents."""
@@ -18,14 +20,20 @@ class RedliningValidator:
         self.namespaces = {
             "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
         }
+        # Check recorded by the last validate() run
+        self.result = ValidationResult()
 
     def validate(self):
-        """Main validation method that returns True if valid, False otherwise."""
+        """Main validation method that returns True if valid, False otherwise.
+
+        The outcome is left in self.result; nothing is printed.
+        """
+        self.result = ValidationResult()
+
         # Verify unpacked directory exists and has correct structure
         modified_file = self.unpacked_dir / "word" / "document.xml"
         if not modified_file.exists():
-            print(f"FAILED - Modified document.xml not found at {modified_file}")
-            return False
+            return self._record(f"Modified document.xml not found at {modified_file}")
 
         # First, check if there are any tracked changes by Claude to validate
         try:
@@ -52,69 +60,70 @@ class RedliningValidator:
 
             # Redlining validation is only needed if tracked changes by Claude have been used.
             if not claude_del_elements and not claude_ins_elements:
-                if self.verbose:
-                    print("PASSED - No tracked changes by Claude found.")
-                return True
+                return self._record(success="No tracked changes by Claude found.")
 
         except Exception:
             # If we can't parse the XML, continue with full validation
             pass
 
-        # Create temporary directory for unpacking original docx
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Unpack original docx
-            try:
-                with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
-                    zip_ref.extractall(temp_path)
-            except Exception as e:
-                print(f"FAILED - Error unpacking original docx: {e}")
-                return False
-
-            original_file = temp_path / "word" / "document.xml"
-            if not original_file.exists():
-                print(
-                    f"FAILED - Original document.xml not found in {self.original_docx}"
-                )
-                return False
-
-            # Parse both XML files using xml.etree.ElementTree for redlining validation
-            try:
-                import xml.etree.ElementTree as ET
-
-                modified_tree = ET.parse(modified_file)
-                modified_root = modified_tree.getroot()
-                original_tree = ET.parse(original_file)
-                original_root = original_tree.getroot()
-            except ET.ParseError as e:
-                print(f"FAILED - Error parsing XML files: {e}")
-                return False
-
-            # Remove Claude's tracked changes from both documents
-            self._remove_claude_tracked_changes(original_root)
-            self._remove_claude_tracked_changes(modified_root)
-
-            # Extract and compare text content
-            modified_text = self._extract_text_content(modified_root)
-            original_text = self._extract_text_content(original_root)
-
-            if modified_text != original_text:
-                # Show detailed character-level differences for each paragraph
-                error_message = self._generate_detailed_diff(
-                    original_text, modified_text
-                )
-                print(error_message)
-                return False
+        # Read the original document.xml straight from the docx in memory
+        try:
+            original_content = get_original_package(self.original_docx).read(
+                "word/document.xml"
+            )
+        except Exception as e:
+            return self._record(f"Error unpacking original docx: {e}")
+
+        if original_content is None:
+            return self._record(
+                f"Original document.xml not found in {self.original_docx}"
+            )
+
+        # Parse both XML files using xml.etree.ElementTree for redlining validation
+        try:
+            import xml.etree.ElementTree as ET
 
-            if self.verbose:
-                print("PASSED - All changes by Claude are properly tracked")
-            return True
+            modified_tree = ET.parse(modified_file)
+            modified_root = modified_tree.getroot()
+            original_root = ET.fromstring(original_content)
+        except ET.ParseError as e:
+            return self._record(f"Error parsing XML files: {e}")
+
+        # Remove Claude's tracked changes from both documents
+        self._remove_claude_tracked_changes(original_root)
+        self._remove_claude_tracked_changes(modified_root)
+
+        # Extract and compare text content
+        modified_text = self._extract_text_content(modified_root)
+        original_text = self._extract_text_content(original_root)
+
+        if modified_text != original_text:
+            # Show detailed character-level differences for each paragraph
+            return self._record(
+                "Document text doesn't match after removing Claude's tracked changes",
+                note=self._generate_detailed_diff(original_text, modified_text),
+            )
+
+        return self._record(success="All changes by Claude are properly tracked")
+
+    def _record(self, error=None, success="", note=""):
+        """Add the check outcome to self.result and return whether it passed."""
+        issues = []
+        if error is not None:
+            issues.append(ValidationIssue("redlining", error, file="word/document.xml"))
+        return self.result.add(
+            CheckResult(
+                "redlining",
+                issues,
+                failure="Redlining validation failed:",
+                success=success,
+                note=note,
+            )
+        )
 
     def _generate_detailed_diff(self, original_text, modified_text):
         """Generate detailed word-level differences using git word diff."""
         error_parts = [
-            "FAILED - Document text doesn't match after removing Claude's tracked changes",
             "",
             "Likely causes:",
             "  1. Modified text inside another author's <w:ins> or <w:del> tags",
@@ -0,0 +1,206 @@
+"""
+Structured results of a validation run.
+
+Validators record what they find as ValidationIssue objects grouped into
+one CheckResult per check, instead of printing. Nothing is formatted until
+ValidationResult.render() (the command line output) or to_dict() (reports)
+is called, so large sets of issues cost little when they are only counted.
+"""
+
+import sys
+from dataclasses import asdict, dataclass, field
+
+ERROR = "error"
+WARNING = "warning"
+INFO = "info"
+
+# Longest issue message shown by render() for checks with per_file_limit set
+MAX_RENDERED_MESSAGE = 250
+
+
+@dataclass
+class ValidationIssue:
+    """One problem found by a check.
+
+    Attributes:
+        rule: Name of the check that found it (e.g. "unique_ids", "xsd")
+        message: Description, without the file and line
+        file: Part name relative to the unpacked directory, if any
+        line: Line number in that part, if known
+        severity: ERROR fails the check; WARNING and INFO are informational
+    """
+
+    rule: str
+    message: str
+    file: str | None = None
+    line: int | None = None
+    severity: str = ERROR
+
+    def format(self):
+        """Return the issue as a single line: 'file: Line N: message'."""
+        location = [self.file] if self.file else []
+        if self.line is not None:
+            location.append(f"Line {self.line}")
+        return ": ".join(location + [self.message])
+
+
+@dataclass
+class CheckResult:
+    """Outcome of one check and the issues it found.
+
+    Attributes:
+        name: Check name, also used as the rule of its issues
+        issues: Issues found, in reporting order
+        failure: Heading printed when the check fails; '{count}' is replaced
+            by the number of errors
+        success: Line printed in verbose mode when the check passes
+        note: Advice printed after the issues of a failed check
+        details: Extra lines printed in verbose mode only
+        per_file_limit: If set, issues are grouped by file and at most this
+            many (truncated) messages are shown per file
+    """
+
+    name: str
+    issues: list = field(default_factory=list)
+    failure: str = "Found {count} {name} errors:"
+    success: str = ""
+    note: str = ""
+    details: list = field(default_factory=list)
+    per_file_limit: int | None = None
+
+    @property
+    def errors(self):
+        return [issue for issue in self.issues if issue.severity == ERROR]
+
+    @property
+    def passed(self):
+        return not any(issue.severity == ERROR for issue in self.issues)
+
+    def render_lines(self, verbose=False):
+        """Return the lines the command line tool prints for this check."""
+        lines = list(self.details) if verbose else []
+        errors = self.errors
+        for issue in self.issues:
+            if issue.severity == WARNING:
+                lines.append(f"Warning: {issue.format()}")
+            elif issue.severity != ERROR:
+                lines.append(issue.format())
+
+        if not errors:
+            if verbose and self.success:
+                lines.append(f"PASSED - {self.success}")
+            return lines
+
+        count = len(errors)
+        lines.append(f"FAILED - {self.failure.format(count=count, name=self.name)}")
+        if self.per_file_limit is None:
+            lines.extend(f"  {issue.format()}" for issue in errors)
+        else:
+            by_file = {}
+            for issue in errors:
+                by_file.setdefault(issue.file, []).append(issue.message)
+            for part_name, messages in by_file.items():
+                lines.append(f"  {part_name}: {len(messages)} new error(s)")
+                for message in messages[: self.per_file_limit]:
+                    if len(message) > MAX_RENDERED_MESSAGE:
+                        message = message[:MAX_RENDERED_MESSAGE] + "..."
+                    lines.append(f"    - {message}")
+        if self.note:
+            lines.append(self.note)
+        return lines
+
+
+class ValidationResult:
+    """All checks run by one or more validators on a document."""
+
+    def __init__(self):
+        self.checks = []
+
+    def add(self, check):
+        """Append a CheckResult and return whether it passed."""
+        self.checks.append(check)
+        return check.passed
+
+    def extend(self, other):
+        """Append the checks of another ValidationResult."""
+        self.checks.extend(other.checks)
+
+    @property
+    def issues(self):
+        return [issue for check in self.checks for issue in check.issues]
+
+    @property
+    def errors(self):
+        return [issue for check in self.checks for issue in check.errors]
+
+    @property
+    def passed(self):
+        return all(check.passed for check in self.checks)
+
+    @property
+    def failed_checks(self):
+        return [check.name for check in self.checks if not check.passed]
+
+    @property
+    def notes(self):
+        """Notes of the failed checks (e.g. the redlining diff), by check name."""
+        return {
+            check.name: check.note
+            for check in self.checks
+            if check.note and not check.passed
+        }
+
+    def render(self, verbose=False, file=None):
+        """Print the checks in the command line tool's format.
+
+        Failures, warnings and notes are always printed; passed checks and
+        details only in verbose mode.
+        """
+        file = file or sys.stdout
+        for check in self.checks:
+            for line in check.render_lines(verbose):
+                print(line, file=file)
+
+    def summary(self, limit=20):
+        """Return a multi-line description of the errors found.
+
+        At most limit errors are listed, followed by the notes of the failed
+        checks.
+        """
+        errors = self.errors
+        lines = [
+            f"Validation failed: {len(errors)} error(s) in "
+            f"{', '.join(self.failed_checks)}"
+        ]
+        lines.extend(f"  [{issue.rule}] {issue.format()}" for issue in errors[:limit])
+        if len(errors) > limit:
+            lines.append(f"  ... and {len(errors) - limit} more")
+        lines.extend(self.notes.values())
+        return "\n".join(lines)
+
+    def to_dict(self):
+        """Return a JSON-serializable form of the result."""
+        return {
+            "passed": self.passed,
+            "checks": [
+                {
+                    "name": check.name,
+                    "passed": check.passed,
+                    "issues": [asdict(issue) for issue in check.issues],
+                    "note": check.note if check.note and not check.passed else None,
+                }
+                for check in self.checks
+            ],
+        }
+
+
+class ValidationError(ValueError):
+    """Raised when a document fails validation; carries the ValidationResult."""
+
+    def __init__(self, result):
+        super().__init__(result.summary())
+        self.result = result
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
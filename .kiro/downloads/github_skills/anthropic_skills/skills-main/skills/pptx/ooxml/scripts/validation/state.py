@@ -0,0 +1,110 @@
+"""
+Persistent per-part validation results for incremental validation.
+
+The state file lives in the unpacked directory and maps each part to the
+hash of its content and the results of every per-file check. On the next
+run only parts whose content changed are parsed and validated again;
+cross-file checks are recomputed from the stored summaries.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+# Name of the state file written into the unpacked directory.
+# pack.py skips this name when building the Office file.
+STATE_FILE_NAME = ".ooxml-validation-state.json"
+
+# Bump whenever a check changes what it stores or reports
+STATE_VERSION = 2
+
+
+def schema_fingerprint(schemas_dir):
+    """Return a short hash identifying the installed set of XSD schemas."""
+    digest = hashlib.sha256()
+    for xsd in sorted(Path(schemas_dir).rglob("*.xsd")):
+        digest.update(f"{xsd.relative_to(schemas_dir).as_posix()}:".encode())
+        digest.update(hashlib.sha256(xsd.read_bytes()).digest())
+    return digest.hexdigest()[:16]
+
+
+class ValidationState:
+    """Cached per-part results, keyed by part name and content hash.
+
+    Args:
+        unpacked_dir: Unpacked Office document directory holding the state file
+        key: Identifies the validator and schema set; stored results are
+            discarded when it differs from the key they were written with
+    """
+
+    def __init__(self, unpacked_dir, key):
+        self.unpacked_dir = Path(unpacked_dir)
+        self.path = self.unpacked_dir / STATE_FILE_NAME
+        self.key = key
+        self._files = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("version") == STATE_VERSION and data.get("key") == self.key:
+            self._files = data.get("files", {})
+
+    def entry(self, xml_file):
+        """Return the mutable result dict for a part's current content.
+
+        Entries whose content hash no longer matches are reset. Cached
+        results are stored under check-specific keys; callers that add or
+        change a key must call mark_dirty().
+        """
+        part_name = Path(xml_file).relative_to(self.unpacked_dir).as_posix()
+        stat = Path(xml_file).stat()
+        signature = [stat.st_mtime_ns, stat.st_size]
+
+        entry = self._files.get(part_name)
+        if entry is not None and entry.get("stat") == signature:
+            return entry
+
+        sha256 = hashlib.sha256(Path(xml_file).read_bytes()).hexdigest()
+        if entry is None or entry.get("sha256") != sha256:
+            entry = {"sha256": sha256}
+        entry["stat"] = signature
+        self._files[part_name] = entry
+        self._dirty = True
+        return entry
+
+    def mark_dirty(self):
+        """Note that an entry was updated and the state needs saving."""
+        self._dirty = True
+
+    def prune(self, xml_files):
+        """Drop entries for parts that no longer exist."""
+        keep = {
+            Path(xml_file).relative_to(self.unpacked_dir).as_posix()
+            for xml_file in xml_files
+        }
+        for part_name in list(self._files):
+            if part_name not in keep:
+                del self._files[part_name]
+                self._dirty = True
+
+    def save(self):
+        """Write the state file if anything changed. Failures are not fatal."""
+        if not self._dirty:
+            return
+        data = {"version": STATE_VERSION, "key": self.key, "files": self._files}
+        temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            temp_path.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(temp_path, self.path)
+            self._dirty = False
+        except OSError:
+            temp_path.unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -0,0 +1,252 @@
+"""
+Single-pass rule engine for structural checks on OOXML parts.
+
+Each Rule declares the element tags it wants to see and the ancestor tags
+it needs to know about. run_rules() walks every file once and dispatches
+each element to all interested rules, instead of every check doing its own
+full-tree traversal.
+
+Rules reduce each file to a JSON-serializable summary and compute their
+issues from the summaries of all files in finish(). Summaries can therefore
+be stored between runs (see state.py) and reused for unchanged files.
+
+Files can be walked from a parsed tree or streamed with iterparse, which
+clears each element once it has been dispatched so memory stays bounded
+for very large parts.
+"""
+
+import lxml.etree
+
+from .result import ValidationIssue
+
+
+class Rule:
+    """Base class for a check dispatched by run_rules().
+
+    Attributes:
+        name: Key used to look up the finished rule and its stored summaries
+        tags: Clark-notation tags ('{ns}local') passed to start(), or None
+            to receive every element
+        scopes: Tags whose open elements the rule queries via
+            WalkContext.inside() (the element itself counts as open)
+        needs_text: If True, start() is called once the element is complete,
+            so elem.text is available when streaming. Only use this for
+            rules on leaf elements like w:t, so document order is kept.
+        issues: ValidationIssue objects collected across all files
+        summaries: Per-file summaries by relative part name, in walk order
+    """
+
+    name = None
+    tags = None
+    scopes = ()
+    needs_text = False
+
+    def __init__(self):
+        self.issues = []
+        self.summaries = {}
+        self._file_errors = []
+
+    def applies_to(self, xml_file):
+        """Return True if the rule should see elements of this file."""
+        return True
+
+    def start_file(self, context):
+        """Called before the first element of each applicable file."""
+        self._file_errors = []
+
+    def start(self, elem, context):
+        """Called for each element matching self.tags, in document order."""
+
+    def end_file(self, context):
+        """Return the JSON-serializable summary of the file just walked.
+
+        Errors are stored as [line, message] pairs; line may be None.
+        """
+        return {"errors": self._file_errors}
+
+    def file_error(self, context, error):
+        """Return the summary for a file that could not be checked."""
+        return {"errors": [[None, f"Error: {error}"]]}
+
+    def report(self, context, elem, message):
+        """Record an error for an element of the current file."""
+        self._file_errors.append([elem.sourceline, message])
+
+    def issue(self, part_name, line, message):
+        """Return a ValidationIssue of this rule for a part."""
+        return ValidationIssue(self.name, message, file=part_name, line=line)
+
+    def finish(self, summaries):
+        """Compute the results from the summaries of all files.
+
+        Args:
+            summaries: dict of relative part name -> summary, in walk order
+        """
+        self.summaries = summaries
+        for part_name, summary in summaries.items():
+            self.issues.extend(
+                self.issue(part_name, line, message)
+                for line, message in summary.get("errors", ())
+            )
+
+
+class WalkContext:
+    """Per-file state shared by all rules during a walk."""
+
+    def __init__(self, xml_file, relative_path):
+        self.xml_file = xml_file
+        self.relative_path = relative_path
+        self._open = {}
+
+    def inside(self, tag):
+        """Return True if an element with this tag encloses the current one."""
+        return self._open.get(tag, 0) > 0
+
+
+def walk_tree(rules, tree, context):
+    """Dispatch every element of a parsed tree to the given rules.
+
+    Args:
+        rules: Rules that apply to this file
+        tree: Parsed lxml tree (not modified)
+        context: WalkContext for the file
+    """
+    _dispatch(rules, lxml.etree.iterwalk(tree, events=("start", "end")), context)
+
+
+def stream_file(rules, xml_file, context):
+    """Dispatch every element of a file to the given rules without keeping the tree.
+
+    Elements are cleared after their end event and removed from their
+    parent, so only the path from the root to the current element is held
+    in memory.
+
+    Raises:
+        lxml.etree.XMLSyntaxError: If the file is not well-formed
+    """
+    events = lxml.etree.iterparse(str(xml_file), events=("start", "end"))
+    _dispatch(rules, events, context, clear=True)
+
+
+def iter_streamed(xml_file, events=("end",)):
+    """Yield (event, element) pairs from iterparse, clearing finished elements.
+
+    Raises:
+        lxml.etree.XMLSyntaxError: If the file is not well-formed
+    """
+    for event, elem in lxml.etree.iterparse(str(xml_file), events=events):
+        yield event, elem
+        if event == "end":
+            _release(elem)
+
+
+def _release(elem):
+    """Free a finished element and any earlier siblings still attached."""
+    elem.clear(keep_tail=True)
+    parent = elem.getparent()
+    if parent is not None:
+        while elem.getprevious() is not None:
+            del parent[0]
+
+
+def _dispatch(rules, events, context, clear=False):
+    """Feed (event, element) pairs to the rules interested in each element."""
+    on_start = {}
+    on_end = {}
+    start_all = []
+    end_all = []
+    scopes = set()
+    for rule in rules:
+        scopes.update(rule.scopes)
+        by_tag, catch_all = (
+            (on_end, end_all) if rule.needs_text else (on_start, start_all)
+        )
+        if rule.tags is None:
+            catch_all.append(rule)
+        else:
+            for tag in rule.tags:
+                by_tag.setdefault(tag, []).append(rule)
+
+    open_counts = context._open
+    for event, elem in events:
+        tag = elem.tag
+        if event == "start":
+            if tag in scopes:
+                open_counts[tag] = open_counts.get(tag, 0) + 1
+            for rule in start_all:
+                rule.start(elem, context)
+            for rule in on_start.get(tag, ()):
+                rule.start(elem, context)
+        else:
+            for rule in end_all:
+                rule.start(elem, context)
+            for rule in on_end.get(tag, ()):
+                rule.start(elem, context)
+            if tag in scopes:
+                open_counts[tag] -= 1
+            if clear:
+                _release(elem)
+
+
+def _walk_file(rules, xml_file, relative_path, parse, stream):
+    """Walk one file and return {rule name: summary} for the given rules."""
+    context = WalkContext(xml_file, relative_path)
+    try:
+        for rule in rules:
+            rule.start_file(context)
+        if stream:
+            stream_file(rules, xml_file, context)
+        else:
+            walk_tree(rules, parse(xml_file), context)
+        return {rule.name: rule.end_file(context) for rule in rules}
+    except Exception as e:
+        return {rule.name: rule.file_error(context, e) for rule in rules}
+
+
+def run_rules(rules, xml_files, base_dir, parse, cached=None, stream=None):
+    """Run all rules over the given files with one traversal per file.
+
+    Args:
+        rules: Rule instances; results are left on the instances
+        xml_files: Files to walk, in reporting order
+        base_dir: Directory that error paths are reported relative to
+        parse: Callable returning the parsed lxml tree for a file
+        cached: Optional callable returning the stored {rule name: summary}
+            dict for a file, or None if the file has to be walked
+        stream: Optional predicate; files for which it returns True are
+            streamed with iterparse instead of being parsed with parse()
+
+    Returns:
+        dict: relative part name -> {rule name: summary} for every file
+    """
+    per_file = {}
+    for xml_file in xml_files:
+        applicable = [rule for rule in rules if rule.applies_to(xml_file)]
+        relative_path = xml_file.relative_to(base_dir)
+
+        summaries = cached(xml_file) if cached else None
+        if summaries is None:
+            summaries = {}
+            if applicable:
+                summaries = _walk_file(
+                    applicable,
+                    xml_file,
+                    relative_path,
+                    parse,
+                    stream is not None and stream(xml_file),
+                )
+        per_file[relative_path.as_posix()] = summaries
+
+    for rule in rules:
+        rule.finish(
+            {
+                part_name: summaries[rule.name]
+                for part_name, summaries in per_file.items()
+                if rule.name in summaries
+            }
+        )
+    return per_file
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
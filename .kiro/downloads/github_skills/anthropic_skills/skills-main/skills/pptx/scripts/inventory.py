@@ -11,25 +11,42 @@ This module provides functionality to:
 - Export to JSON with clean, structured data
 
 Classes:
+    FontIndex: Maps font family and style names to installed font files
     ParagraphData: Represents a text paragraph with formatting
     ShapeData: Represents a shape with position and text content
 
 Main Functions:
     extract_text_inventory: Extract all text from a presentation
-    save_inventory: Save extracted data to JSON
+    iter_text_inventory: Extract all text slide by slide
+    extract_slide_inventory: Extract the text shapes of one slide
+    save_inventory: Save extracted data to JSON, one slide at a time
 
 Usage:
-    python inventory.py input.pptx output.json
+    python inventory.py input.pptx output.json [--jobs N]
 """
 
 import argparse
+import functools
 import json
+import os
 import platform
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
-
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+from overlaps import overlapping_pairs
 from PIL import Image, ImageDraw, ImageFont
 from pptx import Presentation
 from pptx.enum.text import PP_ALIGN
@@ -46,6 +63,12 @@ InventoryData = Dict[
 ]  # Dict of slide_id -> {shape_id -> ShapeData}
 InventoryDict = Dict[str, Dict[str, ShapeDict]]  # JSON-serializable inventory
 
+# Fonts kept loaded by load_font(), keyed by (path, size, index)
+FONT_CACHE_SIZE = 256
+
+# Text widths remembered by text_length() before the cache is cleared
+TEXT_WIDTH_CACHE_SIZE = 65536
+
 
 def main():
     """Main entry point for command-line usage."""
@@ -60,6 +83,9 @@ Examples:
   python inventory.py presentation.pptx inventory.json --issues-only
     Extracts only text shapes that have overflow or overlap issues
 
+  python inventory.py presentation.pptx inventory.json --jobs 0
+    Extracts slides in parallel using all CPUs
+
 The output JSON includes:
   - All text content organized by slide and shape
   - Correct absolute positions for shapes in groups
@@ -76,9 +102,20 @@ The output JSON includes:
         action="store_true",
         help="Include only text shapes that have overflow or overlap issues",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for extracting slides (default: 1, 0 = all CPUs)",
+    )
 
     args = parser.parse_args()
 
+    if args.jobs < 0:
+        print("Error: --jobs must be 0 or a positive integer")
+        sys.exit(1)
+
     input_path = Path(args.input)
     if not input_path.exists():
         print(f"Error: Input file not found: {args.input}")
@@ -94,17 +131,27 @@ The output JSON includes:
             print(
                 "Filtering to include only text shapes with issues (overflow/overlap)"
             )
-        inventory = extract_text_inventory(input_path, issues_only=args.issues_only)
+        inventory = iter_text_inventory(
+            input_path, issues_only=args.issues_only, jobs=args.jobs
+        )
+
+        # Count shapes per slide while each slide is written out
+        shape_counts: List[int] = []
+
+        def counted(slides):
+            for slide_key, shapes in slides:
+                shape_counts.append(len(shapes))
+                yield slide_key, shapes
 
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        save_inventory(inventory, output_path)
+        save_inventory(counted(inventory), output_path)
 
         print(f"Output saved to: {args.output}")
 
         # Report statistics
-        total_slides = len(inventory)
-        total_shapes = sum(len(shapes) for shapes in inventory.values())
+        total_slides = len(shape_counts)
+        total_shapes = sum(shape_counts)
         if args.issues_only:
             if total_shapes > 0:
                 print(
@@ -132,11 +179,202 @@ class ShapeWithPosition:
     shape: BaseShape
     absolute_left: int  # in EMUs
     absolute_top: int  # in EMUs
+    path: Tuple[int, ...] = ()  # Indices from slide.shapes down through groups
+
+
+class FontIndex:
+    """Index of installed fonts by family and style, built once per process.
+
+    Every font file under the platform's font directories (searched
+    recursively) is opened once to read its family and style names from the
+    font's metadata; each face of a font collection is indexed separately.
+    File names are indexed too, for fonts whose metadata cannot be read and
+    for the file-name based lookups that get_font_path() always did.
+    """
+
+    def __init__(
+        self,
+        font_dirs: Optional[List[str]] = None,
+        extensions: Optional[List[str]] = None,
+    ):
+        if font_dirs is None or extensions is None:
+            default_dirs, default_extensions = self.platform_defaults()
+            font_dirs = default_dirs if font_dirs is None else font_dirs
+            extensions = default_extensions if extensions is None else extensions
+        self.font_dirs = [Path(d).expanduser() for d in font_dirs]
+        self.extensions = tuple(ext.lower() for ext in extensions)
+        self._families: Optional[Dict[str, Dict[str, Tuple[str, int]]]] = None
+        self._files: Dict[str, str] = {}
+
+    @staticmethod
+    def platform_defaults() -> Tuple[List[str], List[str]]:
+        """Return the font directories and file extensions for this platform."""
+        if platform.system() == "Darwin":  # macOS
+            return (
+                ["/System/Library/Fonts/", "/Library/Fonts/", "~/Library/Fonts/"],
+                [".ttf", ".otf", ".ttc", ".dfont"],
+            )
+        # Linux
+        return (
+            ["/usr/share/fonts/truetype/", "/usr/local/share/fonts/", "~/.fonts/"],
+            [".ttf", ".otf"],
+        )
+
+    @staticmethod
+    def _normalize(name: str) -> str:
+        return name.lower().replace(" ", "").replace("-", "").replace("_", "")
+
+    def _build(self) -> None:
+        """Scan the font directories and read each font's names."""
+        self._families = {}
+        for font_dir in self.font_dirs:
+            if not font_dir.is_dir():
+                continue
+            for dirpath, _, filenames in os.walk(font_dir):
+                for filename in sorted(filenames):
+                    if not filename.lower().endswith(self.extensions):
+                        continue
+                    path = os.path.join(dirpath, filename)
+                    # The first directory listed wins, as in a path search
+                    self._files.setdefault(filename.lower(), path)
+                    self._index_faces(path)
+
+    def _index_faces(self, path: str) -> None:
+        """Add every face of a font file to the family index."""
+        for index in range(64):  # Collections (.ttc) hold several faces
+            try:
+                font = ImageFont.truetype(path, size=12, index=index)
+                family, style = font.getname()
+            except Exception:
+                return
+            if family:
+                key = self._normalize(family)
+                styles = self._families.setdefault(key, {})  # type: ignore
+                styles.setdefault(self._normalize(style or "Regular"), (path, index))
+            if not path.lower().endswith(".ttc"):
+                return
+
+    def find(
+        self, font_name: str, bold: bool = False, italic: bool = False
+    ) -> Optional[Tuple[str, int]]:
+        """Return (path, face index) of the best match for a font, or None.
+
+        Fonts are matched by family name first, preferring the requested
+        style; then by file name (exact variants, then a substring match).
+        """
+        if self._families is None:
+            self._build()
+
+        styles = self._families.get(self._normalize(font_name))  # type: ignore
+        if styles:
+            wanted = {
+                (False, False): ["regular", "book", "normal", "roman", "medium"],
+                (True, False): ["bold"],
+                (False, True): ["italic", "oblique"],
+                (True, True): ["bolditalic", "boldoblique"],
+            }[(bool(bold), bool(italic))]
+            for style in wanted + ["regular", "book", "normal", "roman"]:
+                if style in styles:
+                    return styles[style]
+            return next(iter(styles.values()))
+
+        # Same file name variants get_font_path() used to probe for
+        variations = [
+            font_name,
+            font_name.lower(),
+            font_name.replace(" ", ""),
+            font_name.replace(" ", "-"),
+        ]
+        for variant in variations:
+            for ext in self.extensions:
+                path = self._files.get(f"{variant}{ext}".lower())
+                if path:
+                    return path, 0
+
+        # Then files containing the font name
+        font_name_lower = font_name.lower().replace(" ", "")
+        for filename, path in self._files.items():
+            if font_name_lower in filename:
+                return path, 0
+        return None
+
+
+_font_index: Optional[FontIndex] = None
+
+
+def get_font_index() -> FontIndex:
+    """Return the process-wide FontIndex, creating it on first use."""
+    global _font_index
+    if _font_index is None:
+        _font_index = FontIndex()
+    return _font_index
+
+
+@functools.lru_cache(maxsize=FONT_CACHE_SIZE)
+def load_font(path: Optional[str], size: int, index: int = 0) -> Any:
+    """Load a font at a given size, reusing fonts that were loaded before.
+
+    Falls back to PIL's default font if path is None or cannot be loaded.
+    The returned font is shared and must not be modified.
+    """
+    if path:
+        try:
+            return ImageFont.truetype(path, size=size, index=index)
+        except Exception:
+            pass
+    return ImageFont.load_default()
+
+
+_text_widths: Dict[Tuple[Any, str], float] = {}
+
+
+def text_length(draw: Any, font: Any, text: str) -> float:
+    """Return draw.textlength(text, font=font), memoized per font and text.
+
+    Fonts come from load_font(), so a given font and size is the same object
+    in every shape and slide, and repeated layouts measure their text once.
+    """
+    key = (font, text)
+    width = _text_widths.get(key)
+    if width is None:
+        if len(_text_widths) >= TEXT_WIDTH_CACHE_SIZE:
+            _text_widths.clear()
+        width = _text_widths[key] = draw.textlength(text, font=font)
+    return width
+
+
+def _join_words(words: List[str], start: int, end: int) -> str:
+    """Join words[start:end] into a line the way greedy wrapping builds it.
+
+    Empty words (from repeated spaces) before the first non-empty word add
+    no separator, so a line never starts with the spaces that ended the
+    previous one.
+    """
+    while start < end and not words[start]:
+        start += 1
+    return " ".join(words[start:end])
 
 
 class ParagraphData:
     """Data structure for paragraph properties extracted from a PowerPoint paragraph."""
 
+    __slots__ = (
+        "text",
+        "bullet",
+        "level",
+        "alignment",
+        "space_before",
+        "space_after",
+        "font_name",
+        "font_size",
+        "bold",
+        "italic",
+        "underline",
+        "color",
+        "theme_color",
+        "line_spacing",
+    )
+
     def __init__(self, paragraph: Any):
         """Initialize from a PowerPoint paragraph object.
 
@@ -264,7 +502,35 @@ class ParagraphData:
 
 
 class ShapeData:
-    """Data structure for shape properties extracted from a PowerPoint shape."""
+    """Data structure for shape properties extracted from a PowerPoint shape.
+
+    Everything is read from the shape when the record is created, and no
+    python-pptx objects are kept, so records are small and can be pickled.
+    Use get_shape() to find the shape again on its slide.
+    """
+
+    __slots__ = (
+        "shape_id",
+        "shape_path",
+        "slide_width_emu",
+        "slide_height_emu",
+        "placeholder_type",
+        "default_font_size",
+        "left",
+        "top",
+        "width",
+        "height",
+        "left_emu",
+        "top_emu",
+        "width_emu",
+        "height_emu",
+        "frame_overflow_bottom",
+        "slide_overflow_right",
+        "slide_overflow_bottom",
+        "overlapping_shapes",
+        "warnings",
+        "paragraphs",
+    )
 
     @staticmethod
     def emu_to_inches(emu: int) -> float:
@@ -286,61 +552,8 @@ class ShapeData:
         Returns:
             Path to the font file, or None if not found
         """
-        system = platform.system()
-
-        # Common font file variations to try
-        font_variations = [
-            font_name,
-            font_name.lower(),
-            font_name.replace(" ", ""),
-            font_name.replace(" ", "-"),
-        ]
-
-        # Define font directories and extensions by platform
-        if system == "Darwin":  # macOS
-            font_dirs = [
-                "/System/Library/Fonts/",
-                "/Library/Fonts/",
-                "~/Library/Fonts/",
-            ]
-            extensions = [".ttf", ".otf", ".ttc", ".dfont"]
-        else:  # Linux
-            font_dirs = [
-                "/usr/share/fonts/truetype/",
-                "/usr/local/share/fonts/",
-                "~/.fonts/",
-            ]
-            extensions = [".ttf", ".otf"]
-
-        # Try to find the font file
-        from pathlib import Path
-
-        for font_dir in font_dirs:
-            font_dir_path = Path(font_dir).expanduser()
-            if not font_dir_path.exists():
-                continue
-
-            # First try exact matches
-            for variant in font_variations:
-                for ext in extensions:
-                    font_path = font_dir_path / f"{variant}{ext}"
-                    if font_path.exists():
-                        return str(font_path)
-
-            # Then try fuzzy matching - find files containing the font name
-            try:
-                for file_path in font_dir_path.iterdir():
-                    if file_path.is_file():
-                        file_name_lower = file_path.name.lower()
-                        font_name_lower = font_name.lower().replace(" ", "")
-                        if font_name_lower in file_name_lower and any(
-                            file_name_lower.endswith(ext) for ext in extensions
-                        ):
-                            return str(file_path)
-            except (OSError, PermissionError):
-                continue
-
-        return None
+        match = get_font_index().find(font_name)
+        return match[0] if match else None
 
     @staticmethod
     def get_slide_dimensions(slide: Any) -> tuple[Optional[int], Optional[int]]:
@@ -391,6 +604,7 @@ class ShapeData:
         absolute_left: Optional[int] = None,
         absolute_top: Optional[int] = None,
         slide: Optional[Any] = None,
+        shape_path: Tuple[int, ...] = (),
     ):
         """Initialize from a PowerPoint shape object.
 
@@ -399,9 +613,11 @@ class ShapeData:
             absolute_left: Absolute left position in EMUs (for shapes in groups)
             absolute_top: Absolute top position in EMUs (for shapes in groups)
             slide: Optional slide object to get dimensions and layout information
+            shape_path: Indices leading to the shape from slide.shapes through
+                any groups, used by get_shape()
         """
-        self.shape = shape  # Store reference to original shape
         self.shape_id: str = ""  # Will be set after sorting
+        self.shape_path = shape_path
 
         # Get slide dimensions from slide object
         self.slide_width_emu, self.slide_height_emu = (
@@ -461,31 +677,38 @@ class ShapeData:
             str, float
         ] = {}  # Dict of shape_id -> overlap area in sq inches
         self.warnings: List[str] = []
-        self._estimate_frame_overflow()
+
+        # Paragraphs with text, read once and kept as plain data
+        text_frame = getattr(shape, "text_frame", None)
+        self.paragraphs: List[ParagraphData] = (
+            [ParagraphData(p) for p in text_frame.paragraphs if p.text.strip()]
+            if text_frame
+            else []
+        )
+
+        self._estimate_frame_overflow(shape)
         self._calculate_slide_overflow()
-        self._detect_bullet_issues()
+        self._detect_bullet_issues(shape)
 
-    @property
-    def paragraphs(self) -> List[ParagraphData]:
-        """Calculate paragraphs from the shape's text frame."""
-        if not self.shape or not hasattr(self.shape, "text_frame"):
-            return []
-
-        paragraphs = []
-        for paragraph in self.shape.text_frame.paragraphs:  # type: ignore
-            if paragraph.text.strip():
-                paragraphs.append(ParagraphData(paragraph))
-        return paragraphs
-
-    def _get_default_font_size(self) -> int:
+    def get_shape(self, slide: Any) -> BaseShape:
+        """Return the shape this record was extracted from.
+
+        Args:
+            slide: The slide the shape is on, from the same presentation
+                file (or an unmodified copy of it)
+        """
+        shape = slide.shapes[self.shape_path[0]]
+        for idx in self.shape_path[1:]:
+            shape = shape.shapes[idx]  # type: ignore
+        return shape
+
+    def _get_default_font_size(self, shape: BaseShape) -> int:
         """Get default font size from theme text styles or use conservative default."""
         try:
-            if not (
-                hasattr(self.shape, "part") and hasattr(self.shape.part, "slide_layout")
-            ):
+            if not (hasattr(shape, "part") and hasattr(shape.part, "slide_layout")):
                 return 14
 
-            slide_master = self.shape.part.slide_layout.slide_master  # type: ignore
+            slide_master = shape.part.slide_layout.slide_master  # type: ignore
             if not hasattr(slide_master, "element"):
                 return 14
 
@@ -532,39 +755,71 @@ class ShapeData:
         )
 
     def _wrap_text_line(self, line: str, max_width_px: int, draw, font) -> List[str]:
-        """Wrap a single line of text to fit within max_width_px."""
+        """Wrap a single line of text to fit within max_width_px.
+
+        Lines are filled greedily, word by word. Line widths are estimated
+        from the cached widths of the individual words and spaces; only a
+        line whose estimate is within one space width of max_width_px is
+        measured as a whole, since kerning or shaping across word boundaries
+        can move its width by a fraction of that.
+        """
         if not line:
             return [""]
 
-        # Use textlength for efficient width calculation
-        if draw.textlength(line, font=font) <= max_width_px:
-            return [line]
-
-        # Need to wrap - split into words
-        wrapped = []
         words = line.split(" ")
-        current_line = ""
+        space_width = text_length(draw, font, " ")
+        margin = max(space_width, 1.0)
 
+        # prefix[i] is the width of words[:i]; first[i] the index of the
+        # first non-empty word at or after i (empty words add no width)
+        prefix = [0.0]
         for word in words:
-            test_line = current_line + (" " if current_line else "") + word
-            if draw.textlength(test_line, font=font) <= max_width_px:
-                current_line = test_line
-            else:
-                if current_line:
-                    wrapped.append(current_line)
-                current_line = word
+            prefix.append(prefix[-1] + text_length(draw, font, word))
+        first = [len(words)] * (len(words) + 1)
+        for i in range(len(words) - 1, -1, -1):
+            first[i] = i if words[i] else first[i + 1]
+
+        def fits(estimate: float, start: int, end: int) -> bool:
+            if estimate <= max_width_px - margin:
+                return True
+            if estimate > max_width_px + margin:
+                return False
+            text = line if start < 0 else _join_words(words, start, end)
+            return text_length(draw, font, text) <= max_width_px
+
+        def line_fits(start: int, end: int) -> bool:
+            begin = first[start]
+            if begin >= end:
+                return True  # Only empty words: an empty line
+            estimate = prefix[end] - prefix[begin] + space_width * (end - begin - 1)
+            return fits(estimate, start, end)
+
+        # The whole line keeps all of its spaces
+        if fits(prefix[-1] + space_width * (len(words) - 1), -1, -1):
+            return [line]
 
-        if current_line:
-            wrapped.append(current_line)
+        # Need to wrap
+        wrapped = []
+        start = 0
+        while start < len(words):
+            # A line always takes its first word, even if that word is too wide
+            end = start + 1
+            while end < len(words) and line_fits(start, end + 1):
+                end += 1
+
+            current_line = _join_words(words, start, end)
+            if current_line:
+                wrapped.append(current_line)
+            start = end
 
         return wrapped
 
-    def _estimate_frame_overflow(self) -> None:
+    def _estimate_frame_overflow(self, shape: BaseShape) -> None:
         """Estimate if text overflows the shape bounds using PIL text measurement."""
-        if not self.shape or not hasattr(self.shape, "text_frame"):
+        if not hasattr(shape, "text_frame"):
             return
 
-        text_frame = self.shape.text_frame  # type: ignore
+        text_frame = shape.text_frame  # type: ignore
         if not text_frame or not text_frame.paragraphs:
             return
 
@@ -578,30 +833,29 @@ class ShapeData:
         draw = ImageDraw.Draw(dummy_img)
 
         # Get default font size from placeholder or use conservative estimate
-        default_font_size = self._get_default_font_size()
+        default_font_size = self._get_default_font_size(shape)
 
         # Calculate total height of all paragraphs
         total_height_px = 0
+        paragraphs_with_text = iter(self.paragraphs)
 
         for para_idx, paragraph in enumerate(text_frame.paragraphs):
             if not paragraph.text.strip():
                 continue
 
-            para_data = ParagraphData(paragraph)
+            para_data = next(paragraphs_with_text)
 
             # Load font for this paragraph
             font_name = para_data.font_name or "Arial"
             font_size = int(para_data.font_size or default_font_size)
 
-            font = None
-            font_path = self.get_font_path(font_name)
-            if font_path:
-                try:
-                    font = ImageFont.truetype(font_path, size=font_size)
-                except Exception:
-                    font = ImageFont.load_default()
+            match = get_font_index().find(
+                font_name, bold=bool(para_data.bold), italic=bool(para_data.italic)
+            )
+            if match:
+                font = load_font(match[0], font_size, match[1])
             else:
-                font = ImageFont.load_default()
+                font = load_font(None, font_size)
 
             # Wrap all lines in this paragraph
             all_wrapped_lines = []
@@ -657,12 +911,12 @@ class ShapeData:
             if overflow_inches > 0.01:  # Only report significant overflows
                 self.slide_overflow_bottom = overflow_inches
 
-    def _detect_bullet_issues(self) -> None:
+    def _detect_bullet_issues(self, shape: BaseShape) -> None:
         """Detect bullet point formatting issues in paragraphs."""
-        if not self.shape or not hasattr(self.shape, "text_frame"):
+        if not hasattr(shape, "text_frame"):
             return
 
-        text_frame = self.shape.text_frame  # type: ignore
+        text_frame = shape.text_frame  # type: ignore
         if not text_frame or not text_frame.paragraphs:
             return
 
@@ -764,7 +1018,10 @@ def is_valid_shape(shape: BaseShape) -> bool:
 
 
 def collect_shapes_with_absolute_positions(
-    shape: BaseShape, parent_left: int = 0, parent_top: int = 0
+    shape: BaseShape,
+    parent_left: int = 0,
+    parent_top: int = 0,
+    path: Tuple[int, ...] = (),
 ) -> List[ShapeWithPosition]:
     """Recursively collect all shapes with valid text, calculating absolute positions.
 
@@ -776,6 +1033,7 @@ def collect_shapes_with_absolute_positions(
         shape: The shape to process
         parent_left: Accumulated left offset from parent groups (in EMUs)
         parent_top: Accumulated top offset from parent groups (in EMUs)
+        path: Indices leading to shape from slide.shapes through its groups
 
     Returns:
         List of ShapeWithPosition objects with absolute positions
@@ -791,10 +1049,10 @@ def collect_shapes_with_absolute_positions(
         abs_group_top = parent_top + group_top
 
         # Process children with accumulated offsets
-        for child in shape.shapes:  # type: ignore
+        for idx, child in enumerate(shape.shapes):  # type: ignore
             result.extend(
                 collect_shapes_with_absolute_positions(
-                    child, abs_group_left, abs_group_top
+                    child, abs_group_left, abs_group_top, path + (idx,)
                 )
             )
         return result
@@ -810,6 +1068,7 @@ def collect_shapes_with_absolute_positions(
                 shape=shape,
                 absolute_left=parent_left + shape_left,
                 absolute_top=parent_top + shape_top,
+                path=path,
             )
         ]
 
@@ -888,31 +1147,144 @@ def detect_overlaps(shapes: List[ShapeData]) -> None:
     Args:
         shapes: List of ShapeData objects with shape_id attributes set
     """
-    n = len(shapes)
+    for i, shape in enumerate(shapes):
+        assert shape.shape_id, f"Shape at index {i} has no shape_id"
+
+    rects = [
+        (shape.left, shape.top, shape.left + shape.width, shape.top + shape.height)
+        for shape in shapes
+    ]
+
+    # Only pairs that intersect at all can overlap by more than the tolerance.
+    # Pairs come back sorted, so each shape lists its overlaps in shape order.
+    for i, j in overlapping_pairs(rects):
+        shape1 = shapes[i]
+        shape2 = shapes[j]
+
+        rect1 = (shape1.left, shape1.top, shape1.width, shape1.height)
+        rect2 = (shape2.left, shape2.top, shape2.width, shape2.height)
+
+        overlaps, overlap_area = calculate_overlap(rect1, rect2)
+
+        if overlaps:
+            # Add shape IDs with overlap area in square inches
+            shape1.overlapping_shapes[shape2.shape_id] = overlap_area
+            shape2.overlapping_shapes[shape1.shape_id] = overlap_area
+
+
+def extract_slide_inventory(
+    slide: Any, issues_only: bool = False
+) -> Dict[str, ShapeData]:
+    """Extract the text shapes of one slide.
+
+    Args:
+        slide: The PowerPoint slide object
+        issues_only: If True, only include shapes that have overflow or overlap issues
+
+    Returns a dictionary {shape-N: ShapeData}, empty if the slide has no
+    text shapes. Shapes are sorted by visual position (top-to-bottom,
+    left-to-right).
+    """
+    # Collect all valid shapes from this slide with absolute positions
+    shapes_with_positions = []
+    for idx, shape in enumerate(slide.shapes):  # type: ignore
+        shapes_with_positions.extend(
+            collect_shapes_with_absolute_positions(shape, path=(idx,))
+        )
+
+    if not shapes_with_positions:
+        return {}
+
+    # Convert to ShapeData with absolute positions and slide reference
+    shape_data_list = [
+        ShapeData(
+            swp.shape,
+            swp.absolute_left,
+            swp.absolute_top,
+            slide,
+            swp.path,
+        )
+        for swp in shapes_with_positions
+    ]
+
+    # Sort by visual position and assign stable IDs in one step
+    sorted_shapes = sort_shapes_by_position(shape_data_list)
+    for idx, shape_data in enumerate(sorted_shapes):
+        shape_data.shape_id = f"shape-{idx}"
+
+    # Detect overlaps using the stable shape IDs
+    if len(sorted_shapes) > 1:
+        detect_overlaps(sorted_shapes)
+
+    # Filter for issues only if requested (after overlap detection)
+    if issues_only:
+        sorted_shapes = [sd for sd in sorted_shapes if sd.has_any_issues]
+
+    # Create slide inventory using the stable shape IDs
+    return {shape_data.shape_id: shape_data for shape_data in sorted_shapes}
 
-    # Compare each pair of shapes
-    for i in range(n):
-        for j in range(i + 1, n):
-            shape1 = shapes[i]
-            shape2 = shapes[j]
 
-            # Ensure shape IDs are set
-            assert shape1.shape_id, f"Shape at index {i} has no shape_id"
-            assert shape2.shape_id, f"Shape at index {j} has no shape_id"
+# Presentation opened once by each worker process of extract_text_inventory
+_worker_presentation: Optional[Any] = None
 
-            rect1 = (shape1.left, shape1.top, shape1.width, shape1.height)
-            rect2 = (shape2.left, shape2.top, shape2.width, shape2.height)
 
-            overlaps, overlap_area = calculate_overlap(rect1, rect2)
+def _open_worker_presentation(pptx_path: str) -> None:
+    global _worker_presentation
+    _worker_presentation = Presentation(pptx_path)
 
-            if overlaps:
-                # Add shape IDs with overlap area in square inches
-                shape1.overlapping_shapes[shape2.shape_id] = overlap_area
-                shape2.overlapping_shapes[shape1.shape_id] = overlap_area
+
+def _extract_worker_slide(slide_idx: int, issues_only: bool) -> Dict[str, ShapeData]:
+    assert _worker_presentation is not None
+    slide = _worker_presentation.slides[slide_idx]
+    return extract_slide_inventory(slide, issues_only)
+
+
+def iter_text_inventory(
+    pptx_path: Path,
+    prs: Optional[Any] = None,
+    issues_only: bool = False,
+    jobs: int = 1,
+) -> Iterator[Tuple[str, Dict[str, ShapeData]]]:
+    """Extract text content slide by slide.
+
+    Takes the same arguments as extract_text_inventory and yields its
+    (slide-N, {shape-N: ShapeData}) items in slide order, so a caller that
+    writes each slide out as it arrives never holds the whole inventory.
+    """
+    if prs is None:
+        prs = Presentation(str(pptx_path))
+    slide_count = len(prs.slides)
+    jobs = min(jobs or os.cpu_count() or 1, slide_count)
+
+    if jobs <= 1:
+        for slide_idx, slide in enumerate(prs.slides):
+            shapes = extract_slide_inventory(slide, issues_only)
+            if shapes:
+                yield f"slide-{slide_idx}", shapes
+        return
+
+    # Each worker opens the presentation once, then extracts whole slides
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_open_worker_presentation,
+        initargs=(str(pptx_path),),
+    ) as executor:
+        slide_inventories = executor.map(
+            _extract_worker_slide,
+            range(slide_count),
+            [issues_only] * slide_count,
+            chunksize=max(1, slide_count // (jobs * 4)),
+        )
+        for slide_idx, shapes in enumerate(slide_inventories):
+            if shapes:
+                yield f"slide-{slide_idx}", shapes
 
 
 def extract_text_inventory(
-    pptx_path: Path, prs: Optional[Any] = None, issues_only: bool = False
+    pptx_path: Path,
+    prs: Optional[Any] = None,
+    issues_only: bool = False,
+    jobs: int = 1,
 ) -> InventoryData:
     """Extract text content from all slides in a PowerPoint presentation.
 
@@ -920,58 +1292,15 @@ def extract_text_inventory(
         pptx_path: Path to the PowerPoint file
         prs: Optional Presentation object to use. If not provided, will load from pptx_path.
         issues_only: If True, only include shapes that have overflow or overlap issues
+        jobs: Worker processes to spread the slides over (0 = all CPUs). Workers
+            read the slides from pptx_path, so it must match prs.
 
     Returns a nested dictionary: {slide-N: {shape-N: ShapeData}}
     Shapes are sorted by visual position (top-to-bottom, left-to-right).
     The ShapeData objects contain the full shape information and can be
     converted to dictionaries for JSON serialization using to_dict().
     """
-    if prs is None:
-        prs = Presentation(str(pptx_path))
-    inventory: InventoryData = {}
-
-    for slide_idx, slide in enumerate(prs.slides):
-        # Collect all valid shapes from this slide with absolute positions
-        shapes_with_positions = []
-        for shape in slide.shapes:  # type: ignore
-            shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
-
-        if not shapes_with_positions:
-            continue
-
-        # Convert to ShapeData with absolute positions and slide reference
-        shape_data_list = [
-            ShapeData(
-                swp.shape,
-                swp.absolute_left,
-                swp.absolute_top,
-                slide,
-            )
-            for swp in shapes_with_positions
-        ]
-
-        # Sort by visual position and assign stable IDs in one step
-        sorted_shapes = sort_shapes_by_position(shape_data_list)
-        for idx, shape_data in enumerate(sorted_shapes):
-            shape_data.shape_id = f"shape-{idx}"
-
-        # Detect overlaps using the stable shape IDs
-        if len(sorted_shapes) > 1:
-            detect_overlaps(sorted_shapes)
-
-        # Filter for issues only if requested (after overlap detection)
-        if issues_only:
-            sorted_shapes = [sd for sd in sorted_shapes if sd.has_any_issues]
-
-        if not sorted_shapes:
-            continue
-
-        # Create slide inventory using the stable shape IDs
-        inventory[f"slide-{slide_idx}"] = {
-            shape_data.shape_id: shape_data for shape_data in sorted_shapes
-        }
-
-    return inventory
+    return dict(iter_text_inventory(pptx_path, prs, issues_only, jobs))
 
 
 def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> InventoryDict:
@@ -988,11 +1317,9 @@ def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> Invento
     Returns:
         Nested dictionary with all data serialized for JSON
     """
-    inventory = extract_text_inventory(pptx_path, issues_only=issues_only)
-
-    # Convert ShapeData objects to dictionaries
+    # Convert ShapeData objects to dictionaries as each slide is extracted
     dict_inventory: InventoryDict = {}
-    for slide_key, shapes in inventory.items():
+    for slide_key, shapes in iter_text_inventory(pptx_path, issues_only=issues_only):
         dict_inventory[slide_key] = {
             shape_key: shape_data.to_dict() for shape_key, shape_data in shapes.items()
         }
@@ -1000,20 +1327,54 @@ def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> Invento
     return dict_inventory
 
 
-def save_inventory(inventory: InventoryData, output_path: Path) -> None:
-    """Save inventory to JSON file with proper formatting.
+def write_inventory(
+    inventory: Union[InventoryData, Iterable[Tuple[str, Dict[str, ShapeData]]]],
+    f: TextIO,
+) -> None:
+    """Write an inventory as JSON, one slide at a time.
+
+    The output is the same as json.dump(..., indent=2, ensure_ascii=False) of
+    the whole inventory converted with to_dict(), but only one slide's
+    dictionaries exist at any time.
 
-    Converts ShapeData objects to dictionaries for JSON serialization.
+    Args:
+        inventory: Inventory dictionary, or (slide key, shapes) items such as
+            those yielded by iter_text_inventory
+        f: Text file to write to
     """
-    # Convert ShapeData objects to dictionaries
-    json_inventory: InventoryDict = {}
-    for slide_key, shapes in inventory.items():
-        json_inventory[slide_key] = {
+    items = inventory.items() if isinstance(inventory, dict) else inventory
+    separator = "{"
+    for slide_key, shapes in items:
+        slide_dict = {
             shape_key: shape_data.to_dict() for shape_key, shape_data in shapes.items()
         }
+        slide_json = json.dumps(slide_dict, indent=2, ensure_ascii=False)
+        # JSON strings escape newlines, so every newline here is indentation
+        f.write(f"{separator}\n  {json.dumps(slide_key, ensure_ascii=False)}: ")
+        f.write(slide_json.replace("\n", "\n  "))
+        separator = ","
+    f.write("{}" if separator == "{" else "\n}")
+
+
+def save_inventory(
+    inventory: Union[InventoryData, Iterable[Tuple[str, Dict[str, ShapeData]]]],
+    output_path: Path,
+) -> None:
+    """Save inventory to JSON file with proper formatting.
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(json_inventory, f, indent=2, ensure_ascii=False)
+    Converts ShapeData objects to dictionaries for JSON serialization, one
+    slide at a time (see write_inventory). The JSON is written to a temporary
+    file next to output_path and only moved into place once every slide has
+    been written, so a failed extraction never leaves a truncated file behind.
+    """
+    temp_path = output_path.with_name(f"{output_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            write_inventory(inventory, f)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
 
 
 if __name__ == "__main__":
@@ -2,7 +2,7 @@
 """Apply text replacements to PowerPoint presentation.
 
 Usage:
-    python replace.py <input.pptx> <replacements.json> <output.pptx>
+    python replace.py <input.pptx> <replacements.json> <output.pptx> [--jobs N]
 
 The replacements JSON should have the structure output by inventory.py.
 ALL text shapes identified by inventory.py will have their text cleared
@@ -211,8 +211,15 @@ def check_duplicate_keys(pairs):
     return result
 
 
-def apply_replacements(pptx_file: str, json_file: str, output_file: str):
-    """Apply text replacements from JSON to PowerPoint presentation."""
+def apply_replacements(pptx_file: str, json_file: str, output_file: str, jobs: int = 1):
+    """Apply text replacements from JSON to PowerPoint presentation.
+
+    jobs is the number of worker processes (0 = all CPUs) used to re-extract
+    the inventory of the updated presentation when checking for issues. The
+    first inventory always runs on prs itself: reading it adds empty
+    formatting elements that end up in the saved file, so extracting it in
+    other processes would change the output.
+    """
 
     # Load presentation
     prs = Presentation(pptx_file)
@@ -260,11 +267,8 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
         for shape_key, shape_data in shapes_dict.items():
             shapes_processed += 1
 
-            # Get the shape directly from ShapeData
-            shape = shape_data.shape
-            if not shape:
-                print(f"Warning: {shape_key} has no shape reference")
-                continue
+            # Find the shape on the slide from its position in the shape tree
+            shape = shape_data.get_shape(prs.slides[slide_index])
 
             # ShapeData already validates text_frame in __init__
             text_frame = shape.text_frame  # type: ignore
@@ -298,7 +302,7 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
         prs.save(str(tmp_path))
 
     try:
-        updated_inventory = extract_text_inventory(tmp_path)
+        updated_inventory = extract_text_inventory(tmp_path, jobs=jobs)
         updated_overflow = detect_frame_overflow(updated_inventory)
     finally:
         tmp_path.unlink()  # Clean up temp file
@@ -355,13 +359,18 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
 
 def main():
     """Main entry point for command-line usage."""
-    if len(sys.argv) != 4:
+    args = sys.argv[1:]
+    jobs = 1
+    if len(args) == 5 and args[3] in ("-j", "--jobs") and args[4].isdigit():
+        jobs = int(args.pop())
+        args.pop()
+    if len(args) != 3:
         print(__doc__)
         sys.exit(1)
 
-    input_pptx = Path(sys.argv[1])
-    replacements_json = Path(sys.argv[2])
-    output_pptx = Path(sys.argv[3])
+    input_pptx = Path(args[0])
+    replacements_json = Path(args[1])
+    output_pptx = Path(args[2])
 
     if not input_pptx.exists():
         print(f"Error: Input file '{input_pptx}' not found")
@@ -372,7 +381,9 @@ def main():
         sys.exit(1)
 
     try:
-        apply_replacements(str(input_pptx), str(replacements_json), str(output_pptx))
+        apply_replacements(
+            str(input_pptx), str(replacements_json), str(output_pptx), jobs
+        )
     except Exception as e:
         print(f"Error applying replacements: {e}")
         import traceback
@@ -19,7 +19,7 @@ Grid limits by column count:
 - 6 cols: max 42 slides per grid (6×7)
 
 Usage:
-    python thumbnail.py input.pptx [output_prefix] [--cols N] [--outline-placeholders]
+    python thumbnail.py input.pptx [output_prefix] [--cols N] [--outline-placeholders] [--jobs N]
 
 Examples:
     python thumbnail.py presentation.pptx
@@ -86,6 +86,14 @@ def main():
         action="store_true",
         help="Outline text placeholders with a colored border",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for extracting placeholder regions "
+        "(default: 1, 0 = all CPUs)",
+    )
 
     args = parser.parse_args()
 
@@ -113,7 +121,7 @@ def main():
             if args.outline_placeholders:
                 print("Extracting placeholder regions...")
                 placeholder_regions, slide_dimensions = get_placeholder_regions(
-                    input_path
+                    input_path, jobs=args.jobs
                 )
                 if placeholder_regions:
                     print(f"Found placeholders on {len(placeholder_regions)} slides")
@@ -156,16 +164,17 @@ def create_hidden_slide_placeholder(size):
     return img
 
 
-def get_placeholder_regions(pptx_path):
+def get_placeholder_regions(pptx_path, jobs=1):
     """Extract ALL text regions from the presentation.
 
     Returns a tuple of (placeholder_regions, slide_dimensions).
     text_regions is a dict mapping slide indices to lists of text regions.
     Each region is a dict with 'left', 'top', 'width', 'height' in inches.
     slide_dimensions is a tuple of (width_inches, height_inches).
+    With jobs != 1 the slides are extracted by that many worker processes.
     """
     prs = Presentation(str(pptx_path))
-    inventory = extract_text_inventory(pptx_path, prs)
+    inventory = extract_text_inventory(pptx_path, prs, jobs=jobs)
     placeholder_regions = {}
 
     # Get actual slide dimensions in inches (EMU to inches conversion)
@@ -194,8 +203,12 @@ def get_placeholder_regions(pptx_path):
     return placeholder_regions, (slide_width_inches, slide_height_inches)
 
 
-def convert_to_images(pptx_path, temp_dir, dpi):
-    """Convert PowerPoint to images via PDF, handling hidden slides."""
+def convert_to_images(pptx_path, temp_dir, dpi, pool=None):
+    """Convert PowerPoint to images via PDF, handling hidden slides.
+
+    The PDF is made by a fresh soffice process, or by pool (a long-lived
+    ooxml/scripts/soffice.SofficePool) if given.
+    """
     # Detect hidden slides
     print("Analyzing presentation...")
     prs = Presentation(str(pptx_path))
@@ -216,21 +229,24 @@ def convert_to_images(pptx_path, temp_dir, dpi):
 
     # Convert to PDF
     print("Converting to PDF...")
-    result = subprocess.run(
-        [
-            "soffice",
-            "--headless",
-            "--convert-to",
-            "pdf",
-            "--outdir",
-            str(temp_dir),
-            str(pptx_path),
-        ],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0 or not pdf_path.exists():
-        raise RuntimeError("PDF conversion failed")
+    if pool is not None:
+        pdf_path = pool.convert(pptx_path, temp_dir, "pdf")
+    else:
+        result = subprocess.run(
+            [
+                "soffice",
+                "--headless",
+                "--convert-to",
+                "pdf",
+                "--outdir",
+                str(temp_dir),
+                str(pptx_path),
+            ],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0 or not pdf_path.exists():
+            raise RuntimeError("PDF conversion failed")
 
     # Convert PDF to images
     print(f"Converting to images at {dpi} DPI...")
@@ -50,13 +50,15 @@ def setup_libreoffice_macro():
         return False
 
 
-def recalc(filename, timeout=30):
+def recalc(filename, timeout=30, pool=None):
     """
     Recalculate formulas in Excel file and report any errors
     
     Args:
         filename: Path to Excel file
         timeout: Maximum time to wait for recalculation (seconds)
+        pool: Optional SofficePool (pptx/ooxml/scripts/soffice.py) whose
+              long-lived LibreOffice workers do the recalculation
     
     Returns:
         dict with error locations and counts
@@ -66,37 +68,15 @@ def recalc(filename, timeout=30):
     
     abs_path = str(Path(filename).absolute())
     
-    if not setup_libreoffice_macro():
-        return {'error': 'Failed to setup LibreOffice macro'}
-    
-    cmd = [
-        'soffice', '--headless', '--norestore',
-        'vnd.sun.star.script:Standard.Module1.RecalculateAndSave?language=Basic&location=application',
-        abs_path
-    ]
-    
-    # Handle timeout command differences between Linux and macOS
-    if platform.system() != 'Windows':
-        timeout_cmd = 'timeout' if platform.system() == 'Linux' else None
-        if platform.system() == 'Darwin':
-            # Check if gtimeout is available on macOS
-            try:
-                subprocess.run(['gtimeout', '--version'], capture_output=True, timeout=1, check=False)
-                timeout_cmd = 'gtimeout'
-            except (FileNotFoundError, subprocess.TimeoutExpired):
-                pass
-        
-        if timeout_cmd:
-            cmd = [timeout_cmd, str(timeout)] + cmd
-    
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    
-    if result.returncode != 0 and result.returncode != 124:  # 124 is timeout exit code
-        error_msg = result.stderr or 'Unknown error during recalculation'
-        if 'Module1' in error_msg or 'RecalculateAndSave' not in error_msg:
-            return {'error': 'LibreOffice macro not configured properly'}
-        else:
-            return {'error': error_msg}
+    if pool is not None:
+        try:
+            pool.recalculate(abs_path, timeout=timeout)
+        except Exception as e:
+            return {'error': f'LibreOffice recalculation failed: {e}'}
+    else:
+        error = recalc_with_soffice(abs_path, timeout)
+        if error:
+            return error
     
     # Check for Excel errors in the recalculated file - scan ALL cells
     try:
@@ -155,6 +135,43 @@ def recalc(filename, timeout=30):
         return {'error': str(e)}
 
 
+def recalc_with_soffice(abs_path, timeout):
+    """Run the recalculation macro in a fresh soffice process. Returns an error dict or None."""
+    if not setup_libreoffice_macro():
+        return {'error': 'Failed to setup LibreOffice macro'}
+    
+    cmd = [
+        'soffice', '--headless', '--norestore',
+        'vnd.sun.star.script:Standard.Module1.RecalculateAndSave?language=Basic&location=application',
+        abs_path
+    ]
+    
+    # Handle timeout command differences between Linux and macOS
+    if platform.system() != 'Windows':
+        timeout_cmd = 'timeout' if platform.system() == 'Linux' else None
+        if platform.system() == 'Darwin':
+            # Check if gtimeout is available on macOS
+            try:
+                subprocess.run(['gtimeout', '--version'], capture_output=True, timeout=1, check=False)
+                timeout_cmd = 'gtimeout'
+            except (FileNotFoundError, subprocess.TimeoutExpired):
+                pass
+        
+        if timeout_cmd:
+            cmd = [timeout_cmd, str(timeout)] + cmd
+    
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    
+    if result.returncode != 0 and result.returncode != 124:  # 124 is timeout exit code
+        error_msg = result.stderr or 'Unknown error during recalculation'
+        if 'Module1' in error_msg or 'RecalculateAndSave' not in error_msg:
+            return {'error': 'LibreOffice macro not configured properly'}
+        else:
+            return {'error': error_msg}
+    
+    return None
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python recalc.py <excel_file> [timeout_seconds]")